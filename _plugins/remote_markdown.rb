@@ -11,6 +11,8 @@ module Jekyll
   class RemoteMarkdownTag < Liquid::Tag
     # Configuration
     CACHE_DIR = '_remote_markdown_cache'
+    # Shared README store written by scripts/readme_store.py
+    README_STORE_DIR = '_readme_cache'
     CACHE_EXPIRY = 3600 * 24 * 7  # 7 days in seconds
     TIMEOUT_SECONDS = 10
     MAX_RETRIES = 3
@@ -66,6 +68,15 @@ module Jekyll
         return File.read(cache_file, encoding: 'UTF-8')
       end
       
+      # Reuse a fresh README already fetched by the maintenance scripts
+      stored = read_from_store(url)
+      if stored
+        Jekyll.logger.info "RemoteMarkdown:", "Using README store content for #{url}"
+        content = process_markdown_content(stored)
+        save_to_cache(cache_file, cache_meta_file, content)
+        return content
+      end
+      
       # Fetch fresh content
       Jekyll.logger.info "RemoteMarkdown:", "Fetching #{url}"
       content = fetch_remote_content(url)
@@ -90,6 +101,20 @@ module Jekyll
       false
     end
 
+    def read_from_store(url)
+      index_file = File.join(README_STORE_DIR, 'index.json')
+      return nil unless File.exist?(index_file)
+      
+      entry = (JSON.parse(File.read(index_file))['readmes'] || {})[url]
+      return nil unless entry && entry['sha256']
+      return nil unless Time.now - Time.at(entry['timestamp']) < CACHE_EXPIRY
+      
+      blob_file = File.join(README_STORE_DIR, "#{entry['sha256']}.md")
+      File.exist?(blob_file) ? File.read(blob_file, encoding: 'UTF-8') : nil
+    rescue JSON::ParserError
+      nil
+    end
+
     def save_to_cache(cache_file, cache_meta_file, content)
       File.write(cache_file, content)
       File.write(cache_meta_file, JSON.generate({
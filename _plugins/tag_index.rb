@@ -0,0 +1,43 @@
+# Skip tag pages for minor tags and non-canonical spellings
+# Reads _data/tag_index.json written by scripts/tag_vocabulary.py
+
+module Jekyll
+  class TagIndexGenerator < Generator
+    safe true
+    # Must run before jekyll-tagging's Tagger (priority :normal)
+    priority :highest
+
+    def generate(site)
+      index = site.data['tag_index']
+      return unless index && index['ignored']
+
+      ignored = Array(site.config['ignored_tags']) | index['ignored']
+      site.config['ignored_tags'] = ignored
+
+      Jekyll.logger.info "TagIndex:", "#{index['tags'].size} tag pages, #{index['ignored'].size} tags skipped"
+    end
+  end
+
+  # Resolve each tag page's normalized post list (including alias-tagged posts)
+  # once, so tag_page.html doesn't search site.posts for every entry
+  class TagPostsGenerator < Generator
+    safe true
+    # Must run after jekyll-tagging's Tagger has created the tag pages
+    priority :low
+
+    def generate(site)
+      index = site.data['tag_index']
+      return unless index && index['tags']
+
+      posts_by_id = {}
+      site.posts.docs.each { |post| posts_by_id[post.basename_without_ext] = post }
+
+      site.pages.each do |page|
+        entry = page.data['tag'] && index['tags'][page.data['tag']]
+        next unless entry
+
+        page.data['tag_posts'] = entry['posts'].map { |id| posts_by_id[id] }.compact
+      end
+    end
+  end
+end
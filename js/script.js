@@ -49,16 +49,96 @@ $(document).ready(function() {
     }
   });
 
-  search_field.ghostHunter({
-    results: search_results,
-    onKeyUp         : true,
-    rss             : base_url + '/feed.xml',
-    zeroResultsInfo : false,
-    info_template   : "<h4 class='heading'>Number of posts found: {{amount}}</h4>",
-    result_template : search_result_template,
-    before: function() {
-      search_results.fadeIn();
+  // Prefix index built by scripts/build_search_index.py: search/index.json
+  // holds the post list, search/<first letter>.json maps prefixes to post ids.
+  // Only the shards for the typed words are fetched, once each.
+  var search_index = null,
+      search_shards = {},
+      search_info_template = "<h4 class='heading'>Number of posts found: {{amount}}</h4>";
+
+  function loadSearchIndex() {
+    if (!search_index) {
+      search_index = $.getJSON(base_url + '/search/index.json').then(function(index) {
+        search_index = index;
+        return index;
+      }, function() {
+        search_index = null;
+      });
+    }
+    return $.when(search_index);
+  }
+
+  function loadShard(key) {
+    if (!search_shards[key]) {
+      search_shards[key] = $.inArray(key, search_index.shards) < 0 ? {} :
+        $.getJSON(base_url + '/search/' + key + '.json?v=' + search_index.version).then(function(shard) {
+          return shard;
+        }, function() {
+          return $.Deferred().resolve({});
+        });
     }
+    return $.when(search_shards[key]);
+  }
+
+  function shardKey(word) {
+    return /[0-9a-z]/.test(word.charAt(0)) ? word.charAt(0) : '_';
+  }
+
+  function searchPosts(query) {
+    var words = $.grep(query.toLowerCase().split(/[^0-9a-z\u00c0-\uffff]+/), function(word) {
+      return word.length > 0;
+    });
+
+    return loadSearchIndex().then(function(index) {
+      var requests = $.map(words, function(word) { return loadShard(shardKey(word)); });
+
+      return $.when.apply($, requests).then(function() {
+        var shards = arguments,
+            ids = null;
+
+        $.each(words, function(i, word) {
+          var postings = shards[i][word.slice(0, index.max_prefix)] || [];
+          // Keep the first word's ranking, drop posts missing any other word
+          ids = ids === null ? postings : $.grep(ids, function(id) {
+            return $.inArray(id, postings) >= 0;
+          });
+        });
+
+        return $.map(ids || [], function(id) { return index.docs[id]; });
+      });
+    });
+  }
+
+  function renderSearchResults(query, docs) {
+    if (query !== $.trim(search_field.val())) {
+      return;
+    }
+
+    var html = search_info_template.replace('{{amount}}', docs.length);
+    $.each(docs, function(i, doc) {
+      html += search_result_template
+        .replace('{{link}}', base_url + doc.u)
+        .replace('{{title}}', $('<div>').text(doc.t).html())
+        .replace('{{pubDate}}', doc.d);
+    });
+    search_results.html(html).fadeIn();
+  }
+
+  search_field.closest('form').on('submit', function(e) {
+    e.preventDefault();
+  });
+
+  search_field.on('keyup', function() {
+    var query = $.trim(search_field.val());
+
+    if (!query) {
+      search_results.empty();
+      return;
+    }
+
+    searchPosts(query).then(function(docs) {
+      renderSearchResults(query, docs);
+    });
   });
 
 });
\ No newline at end of file
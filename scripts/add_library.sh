@@ -80,4 +80,5 @@ echo ""
 echo "📋 다음 단계:"
 echo "1. 이미지가 없다면 /images/posts/${LIBRARY_NAME}.gif 추가"
 echo "2. 필요시 포스트 파일 수정: $POST_FILE"
-echo "3. Jekyll 빌드: bundle exec jekyll build"
\ No newline at end of file
+echo "3. 검색 색인 갱신: python3 scripts/build_search_index.py"
+echo "4. Jekyll 빌드: bundle exec jekyll build"
\ No newline at end of file
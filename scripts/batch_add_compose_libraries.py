@@ -8,10 +8,15 @@ Android UI Collection - Compose 라이브러리 일괄 추가 스크립트
 
 import os
 import json
-import requests
 from datetime import datetime
 import time
 
+from http_session import print_session_stats
+from image_downloader import download_image
+from image_probe import select_image
+from readme_images import extract_images, readme_base_url
+from readme_store import get_readme_store
+
 # 추가할 라이브러리 목록
 LIBRARIES = [
     {
@@ -56,61 +61,19 @@ link: 'https://github.com/{library["repo"]}'
     return filename
 
 def find_image_in_readme(repo):
-    """README에서 이미지 URL 찾기"""
-    # main 브랜치 시도
-    readme_urls = [
-        f"https://raw.githubusercontent.com/{repo}/main/README.md",
-        f"https://raw.githubusercontent.com/{repo}/master/README.md"
-    ]
-    
-    for url in readme_urls:
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                content = response.text
-                
-                # 이미지 URL 패턴 찾기
-                import re
-                # GIF 우선
-                gif_pattern = r'https?://[^\s\)]+\.gif'
-                gifs = re.findall(gif_pattern, content)
-                if gifs:
-                    return gifs[0], 'gif'
-                
-                # PNG/JPG
-                img_pattern = r'https?://[^\s\)]+\.(png|jpg|jpeg)'
-                imgs = re.findall(img_pattern, content)
-                if imgs:
-                    return imgs[0][0], imgs[0][1]
-                
-                # 상대 경로 이미지
-                relative_pattern = r'!\[.*?\]\(([^\)]+\.(gif|png|jpg|jpeg))\)'
-                relatives = re.findall(relative_pattern, content)
-                if relatives:
-                    relative_path = relatives[0][0]
-                    ext = relatives[0][1]
-                    # 상대 경로를 절대 경로로 변환
-                    base_url = f"https://raw.githubusercontent.com/{repo}/main/"
-                    return base_url + relative_path, ext
-                    
-        except Exception as e:
-            print(f"  ⚠️  README 접근 실패: {e}")
-            continue
+    """README에서 가장 알맞은 이미지 URL과 확장자 찾기"""
+    store = get_readme_store()
+    content = store.readme_for_repo(repo)
+    if not content:
+        print(f"  ⚠️  README를 찾을 수 없음")
+        return None, None
     
+    # 상위 후보를 HEAD로 확인해서 배지/너무 큰 파일을 받기 전에 거름
+    image, _ = select_image(extract_images(content, readme_base_url(repo, store)))
+    if image:
+        return image.url, image.ext
     return None, None
 
-def download_image(url, filename):
-    """이미지 다운로드"""
-    try:
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            with open(filename, 'wb') as f:
-                f.write(response.content)
-            return True
-    except Exception as e:
-        print(f"  ❌ 다운로드 실패: {e}")
-    return False
-
 def main():
     """메인 실행 함수"""
     date = datetime.now().strftime("%Y-%m-%d")
@@ -163,6 +126,7 @@ def main():
         time.sleep(1)
     
     print(f"\n✨ 완료! 성공: {success_count}/{len(LIBRARIES)}")
+    print_session_stats()
     print("\n📋 다음 단계:")
     print("1. 이미지가 없는 라이브러리는 수동으로 추가")
     print("2. bundle exec jekyll build 실행")
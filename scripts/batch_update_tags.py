@@ -5,68 +5,114 @@
 View 라이브러리 태그 일괄 업데이트
 """
 
-import os
-import re
-import time
-import urllib.request
-import urllib.error
-import json
+import argparse
 
-def extract_github_repo(file_path):
-    """포스트 파일에서 GitHub 저장소 정보 추출"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        
-    link_match = re.search(r"link:\s*'([^']+)'", content)
-    if link_match:
-        link = link_match.group(1)
-        repo_match = re.search(r'github\.com/([^/]+/[^/]+)', link)
-        if repo_match:
-            return repo_match.group(1).rstrip('/')
-    
-    remote_match = re.search(r'github\.com/([^/]+/[^/]+)/', content)
-    if remote_match:
-        return remote_match.group(1)
-    
-    return None
+from github_client import DEFAULT_CONCURRENCY, check_github_statuses
+from http_session import print_session_stats
+from keyword_matcher import KeywordMatcher
+from library_db import record_repo_statuses
+from post_catalog import get_catalog
+from tag_vocabulary import normalize_tag, normalize_tags
 
-def check_github_status(repo):
-    """GitHub 저장소 상태 확인"""
-    api_url = f"https://api.github.com/repos/{repo}"
-    
-    try:
-        req = urllib.request.Request(api_url, headers={
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'AndroidUICollection/1.0'
-        })
-        
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return {
-                'exists': True,
-                'stars': data.get('stargazers_count', 0),
-                'archived': data.get('archived', False),
-                'description': data.get('description', ''),
-                'topics': data.get('topics', [])
-            }
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return {'exists': False}
-    except Exception:
-        pass
-    
-    return {'exists': 'unknown'}
+# UI 컴포넌트 매핑 (키워드 → 태그)
+TAG_MAPPINGS = {
+    # Loading & Progress
+    ('loading', 'progress', 'loader'): 'loading',
+    ('indicator',): 'indicator',
+    ('progressbar', 'progress bar'): 'progress',
+    ('shimmer',): 'shimmer',
+    
+    # Navigation
+    ('navigation', 'navbar', 'nav'): 'navigation',
+    ('menu', 'drawer', 'reside'): 'menu',
+    ('tab', 'tablayout'): 'tab',
+    ('bottomsheet', 'bottom sheet'): 'bottomsheet',
+    
+    # Animation & Effects
+    ('animation', 'animated', 'animate', 'anim'): 'animation',
+    ('transition',): 'transition',
+    ('blur', 'blurview'): 'blur',
+    ('shadow',): 'shadow',
+    ('wave',): 'wave',
+    ('explod', 'explosion'): 'explosion',
+    
+    # Input & Selection
+    ('calendar', 'date', 'datepicker'): 'calendar',
+    ('picker', 'select', 'choose'): 'picker',
+    ('switch', 'toggle'): 'switch',
+    ('slider', 'seekbar', 'seek'): 'slider',
+    ('rating', 'ratingbar'): 'rating',
+    
+    # Display
+    ('card', 'cardview'): 'card',
+    ('list', 'listview', 'recycler'): 'list',
+    ('chart', 'graph'): 'chart',
+    ('image', 'photo', 'gallery'): 'image',
+    ('text', 'textview', 'label'): 'text',
+    ('table',): 'table',
+    
+    # Interaction
+    ('swipe', 'slide', 'sliding', 'slidr'): 'swipe',
+    ('drag', 'draggable'): 'drag',
+    ('pull', 'refresh', 'ptr'): 'refresh',
+    ('scroll',): 'scroll',
+    ('expand', 'collapse', 'fold'): 'expand',
+    
+    # Dialogs & Overlays
+    ('dialog', 'alert', 'popup'): 'dialog',
+    ('toast', 'snackbar'): 'toast',
+    ('floating', 'fab'): 'floating',
+    ('bubble',): 'bubble',
+    
+    # Others
+    ('material',): 'material',
+    ('button', 'btn'): 'button',
+    ('badge',): 'badge',
+    ('chip',): 'chip',
+    ('stepper',): 'stepper',
+    ('intro', 'onboarding', 'showcase'): 'intro',
+    ('permission',): 'permission',
+    ('camera', 'video'): 'media',
+    ('music', 'audio', 'player'): 'audio',
+    ('qr', 'barcode'): 'scanner',
+    ('ribbon',): 'ribbon',
+    ('ticket',): 'ticket',
+    ('compass',): 'compass',
+    ('tree',): 'tree',
+    ('snowfall', 'snow'): 'effect',
+    ('konfetti', 'confetti'): 'effect',
+    ('cropper', 'crop'): 'crop',
+    ('webview', 'web'): 'webview'
+}
 
-def get_current_tags(file_path):
-    """현재 태그 가져오기"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+# 키워드 표를 한 번만 컴파일
+TAG_MATCHER = KeywordMatcher(TAG_MAPPINGS.items())
+
+# 단어의 앞부분인 키워드 (README처럼 단어 단위로 셀 때 뒤에 붙는 글자 허용)
+KEYWORD_STEMS = ('anim', 'explod')
+
+# 현재 태그 중 항상 유지할 태그
+PRESERVE_TAGS = {'material', 'material3', 'compose'}
+
+# 태그 수 제한과 제한을 넘을 때의 우선순위 (view는 항상 포함)
+MAX_TAGS = 6
+PRIORITY_TAGS = ['view', 'material', 'animation', 'loading', 'navigation', 'picker']
+
+def limit_tags(tags):
+    """최대 MAX_TAGS개로 제한 (우선순위 태그 먼저, 나머지는 이름순)"""
+    tags_list = sorted(list(tags))
+    if len(tags_list) > MAX_TAGS:
+        # view는 항상 포함, 나머지는 중요도 순
+        final_tags = ['view']
+        for tag in PRIORITY_TAGS[1:]:
+            if tag in tags_list and len(final_tags) < MAX_TAGS:
+                final_tags.append(tag)
+        for tag in tags_list:
+            if tag not in final_tags and len(final_tags) < MAX_TAGS:
+                final_tags.append(tag)
+        return final_tags
     
-    tag_match = re.search(r'tag:\s*\[([^\]]+)\]', content)
-    if tag_match:
-        tags = [tag.strip() for tag in tag_match.group(1).split(',')]
-        return tags
-    return []
+    return tags_list
 
 def suggest_tags(library_info, title, current_tags=[]):
     """라이브러리 정보를 기반으로 태그 제안"""
@@ -76,15 +122,14 @@ def suggest_tags(library_info, title, current_tags=[]):
     tags.add('view')
     
     # 현재 태그 중 의미있는 것 유지
-    preserve_tags = {'material', 'material3', 'compose'}
     for tag in current_tags:
-        if tag in preserve_tags:
+        if tag in PRESERVE_TAGS:
             tags.add(tag)
     
     # GitHub topics 활용
     if 'topics' in library_info:
         for topic in library_info['topics']:
-            clean_topic = topic.lower().replace('-', '').replace('_', '')
+            clean_topic = normalize_tag(topic)
             if 'android' not in clean_topic and len(clean_topic) > 2:
                 tags.add(clean_topic)
     
@@ -93,117 +138,32 @@ def suggest_tags(library_info, title, current_tags=[]):
     desc = library_info.get('description', '')
     desc_lower = desc.lower() if desc else ''
     
-    # UI 컴포넌트 매핑
-    tag_mappings = {
-        # Loading & Progress
-        ('loading', 'progress', 'loader'): 'loading',
-        ('indicator',): 'indicator',
-        ('progressbar', 'progress bar'): 'progress',
-        ('shimmer',): 'shimmer',
-        
-        # Navigation
-        ('navigation', 'navbar', 'nav'): 'navigation',
-        ('menu', 'drawer', 'reside'): 'menu',
-        ('tab', 'tablayout'): 'tab',
-        ('bottomsheet', 'bottom sheet'): 'bottomsheet',
-        
-        # Animation & Effects
-        ('animation', 'animated', 'animate', 'anim'): 'animation',
-        ('transition',): 'transition',
-        ('blur', 'blurview'): 'blur',
-        ('shadow',): 'shadow',
-        ('wave',): 'wave',
-        ('explod', 'explosion'): 'explosion',
-        
-        # Input & Selection
-        ('calendar', 'date', 'datepicker'): 'calendar',
-        ('picker', 'select', 'choose'): 'picker',
-        ('switch', 'toggle'): 'switch',
-        ('slider', 'seekbar', 'seek'): 'slider',
-        ('rating', 'ratingbar'): 'rating',
-        
-        # Display
-        ('card', 'cardview'): 'card',
-        ('list', 'listview', 'recycler'): 'list',
-        ('chart', 'graph'): 'chart',
-        ('image', 'photo', 'gallery'): 'image',
-        ('text', 'textview', 'label'): 'text',
-        ('table',): 'table',
-        
-        # Interaction
-        ('swipe', 'slide', 'sliding', 'slidr'): 'swipe',
-        ('drag', 'draggable'): 'drag',
-        ('pull', 'refresh', 'ptr'): 'refresh',
-        ('scroll',): 'scroll',
-        ('expand', 'collapse', 'fold'): 'expand',
-        
-        # Dialogs & Overlays
-        ('dialog', 'alert', 'popup'): 'dialog',
-        ('toast', 'snackbar'): 'toast',
-        ('floating', 'fab'): 'floating',
-        ('bubble',): 'bubble',
-        
-        # Others
-        ('material',): 'material',
-        ('button', 'btn'): 'button',
-        ('badge',): 'badge',
-        ('chip',): 'chip',
-        ('stepper',): 'stepper',
-        ('intro', 'onboarding', 'showcase'): 'intro',
-        ('permission',): 'permission',
-        ('camera', 'video'): 'media',
-        ('music', 'audio', 'player'): 'audio',
-        ('qr', 'barcode'): 'scanner',
-        ('ribbon',): 'ribbon',
-        ('ticket',): 'ticket',
-        ('compass',): 'compass',
-        ('tree',): 'tree',
-        ('snowfall', 'snow'): 'effect',
-        ('konfetti', 'confetti'): 'effect',
-        ('cropper', 'crop'): 'crop',
-        ('webview', 'web'): 'webview'
-    }
-    
     combined_text = f"{title_lower} {desc_lower}"
+    tags |= TAG_MATCHER.match(combined_text)
     
-    for keywords, tag in tag_mappings.items():
-        if any(keyword in combined_text for keyword in keywords):
-            tags.add(tag)
-    
-    # 최대 6개 태그로 제한
-    tags_list = sorted(list(tags))
-    if len(tags_list) > 6:
-        # view는 항상 포함, 나머지는 중요도 순
-        priority_tags = ['view', 'material', 'animation', 'loading', 'navigation', 'picker']
-        final_tags = ['view']
-        for tag in priority_tags[1:]:
-            if tag in tags_list and len(final_tags) < 6:
-                final_tags.append(tag)
-        for tag in tags_list:
-            if tag not in final_tags and len(final_tags) < 6:
-                final_tags.append(tag)
-        return final_tags
-    
-    return tags_list
+    return limit_tags(normalize_tags(tags))
 
-def update_post_tags(file_path, new_tags):
-    """포스트 파일의 태그 업데이트"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    new_tags_str = ", ".join(new_tags)
-    content = re.sub(r'tag:\s*\[[^\]]*\]', f'tag: [{new_tags_str}]', content)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+def update_post_tags(post, new_tags, writer=None):
+    """포스트 파일의 태그 업데이트 (writer: PostBatch에 모으거나, 없으면 바로 쓰기)"""
+    (writer if writer is not None else get_catalog()).edit(post, {'tag': new_tags})
 
 def main():
     """메인 실행 함수"""
-    posts_dir = "_posts"
-    
+    parser = argparse.ArgumentParser(description='View 라이브러리 태그 일괄 업데이트')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='GitHub API 동시 요청 수')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ETag 캐시를 쓰지 않고 모든 저장소를 새로 조회')
+    parser.add_argument('--backend', choices=['auto', 'rest', 'graphql'], default='auto',
+                        help='메타데이터 조회 방식 (auto: GITHUB_TOKEN이 있으면 graphql)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='파일을 쓰지 않고 변경 내용(diff)만 출력')
+    args = parser.parse_args()
+
     # Compose 포스트 제외
-    posts = [f for f in os.listdir(posts_dir) if f.endswith('.md') and not f.startswith('2024-01')]
-    posts.sort()
+    catalog = get_catalog()
+    posts = catalog.view_posts()
+    batch = catalog.batch()
     
     print(f"🏷️  View 라이브러리 태그 일괄 업데이트")
     print(f"📚 총 {len(posts)}개 라이브러리\n")
@@ -215,24 +175,28 @@ def main():
         'not_found': 0
     }
     
-    for i, post_file in enumerate(posts, 1):
-        file_path = os.path.join(posts_dir, post_file)
-        title = post_file.replace('.md', '').split('-', 3)[-1]
+    # GitHub 저장소 추출 후 상태를 한 번에 조회
+    statuses = check_github_statuses(
+        [post.repo for post in posts if post.repo], args.concurrency,
+        use_cache=not args.no_cache, backend=args.backend
+    )
+    record_repo_statuses(statuses)
+    
+    for i, post in enumerate(posts, 1):
+        title = post.name
         
         print(f"\r[{i}/{len(posts)}] {title:<40}", end='', flush=True)
         stats['total'] += 1
         
-        # GitHub 저장소 추출
-        repo = extract_github_repo(file_path)
+        repo = post.repo
         if not repo:
             stats['failed'] += 1
             continue
         
         # 현재 태그
-        current_tags = get_current_tags(file_path)
+        current_tags = post.tags
         
-        # GitHub 상태 확인
-        status = check_github_status(repo)
+        status = statuses[repo]
         
         if status['exists'] == False:
             stats['not_found'] += 1
@@ -247,14 +211,17 @@ def main():
         # 태그가 변경된 경우만 업데이트
         if set(current_tags) != set(suggested_tags):
             try:
-                update_post_tags(file_path, suggested_tags)
+                update_post_tags(post, suggested_tags, batch)
                 stats['updated'] += 1
             except Exception:
                 stats['failed'] += 1
-        
-        # API 제한 방지
-        if i % 10 == 0:
-            time.sleep(1)
+    
+    # 모든 변경을 모은 뒤 한 번에 쓰기 (중간에 중단되면 아무 파일도 바뀌지 않음)
+    stats['updated'] = len(batch)
+    if args.dry_run:
+        print("\n\n" + batch.diff(), end='')
+    else:
+        batch.commit()
     
     # 결과 출력
     print(f"\n\n✅ 태그 업데이트 완료!")
@@ -262,6 +229,7 @@ def main():
     print(f"  ✏️  업데이트: {stats['updated']}개")
     print(f"  ❌ 삭제된 저장소: {stats['not_found']}개")
     print(f"  ⚠️  실패: {stats['failed']}개")
+    print_session_stats()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+사이트 검색 색인 생성
+
+_posts 카탈로그의 제목, 태그, 요약(front matter 또는 _data/summaries.json)에서
+단어를 뽑아 접두사 → 포스트 번호 색인을 만들고, 단어의 첫 글자별로 나눠
+search/ 아래 작은 JSON 파일로 쓴다.
+js/script.js는 입력한 단어의 첫 글자에 해당하는 조각만 받아서
+접두사를 바로 찾는다 (전체 피드를 받아서 훑지 않음).
+
+search/index.json   - 버전, 포스트 목록(제목, 주소, 날짜), 조각 목록
+search/<글자>.json  - 접두사(최대 MAX_PREFIX_LENGTH자) → 포스트 번호 목록
+
+포스트 번호는 최신 포스트부터 0, 1, 2... 이고, 접두사마다 제목에서 나온
+단어, 태그, 요약 순으로 같은 필드 안에서는 최신 순으로 정렬해 둔다.
+
+사용법:
+    python3 scripts/build_search_index.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+from post_catalog import atomic_write, get_catalog
+from readme_summary import load_summaries
+
+SEARCH_DIR = 'search'
+MAX_PREFIX_LENGTH = 12
+
+# 필드 순위 (낮을수록 먼저)
+TITLE, TAG, SUMMARY = 0, 1, 2
+
+CAMEL_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+WORD_PATTERN = re.compile(r'[0-9a-z\u00c0-\uffff]+')
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'with', 'your'
+}
+
+
+def tokenize(text):
+    """검색 단어 목록 (소문자 단어와 CamelCase 조각, 중복 제거)"""
+    if not text:
+        return []
+    words = WORD_PATTERN.findall(text.lower())
+    words += [part.lower() for part in CAMEL_PATTERN.findall(text)]
+    return list(dict.fromkeys(word for word in words if word not in STOPWORDS))
+
+
+def shard_key(prefix):
+    """접두사가 들어갈 조각 이름 (첫 글자, 영문/숫자가 아니면 '_')"""
+    char = prefix[0]
+    return char if char.isascii() and char.isalnum() else '_'
+
+
+def build_search_index(posts, summaries=None):
+    """(포스트 목록, {조각: {접두사: [포스트 번호]}}) 반환
+
+    summaries: readme_summary의 미리 계산한 요약 (front matter에 summary가 없을 때)
+    """
+    summaries = summaries or {}
+    posts = sorted(posts, key=lambda post: (post.date, post.file), reverse=True)
+    docs = []
+    best = {}
+    for doc_id, post in enumerate(posts):
+        docs.append({'t': post.title, 'u': post.url, 'd': post.date})
+        summary = post.summary or summaries.get(post.file[:-3], {}).get('summary')
+        fields = [(TITLE, tokenize(post.title) + tokenize(post.name)), (SUMMARY, tokenize(summary))]
+        fields.append((TAG, [word for tag in post.tags for word in tokenize(tag)]))
+        for rank, words in fields:
+            for word in words:
+                for length in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1):
+                    key = (word[:length], doc_id)
+                    best[key] = min(best.get(key, rank), rank)
+
+    shards = {}
+    for (prefix, doc_id), rank in best.items():
+        shards.setdefault(shard_key(prefix), {}).setdefault(prefix, []).append((rank, doc_id))
+    for shard in shards.values():
+        for prefix, postings in shard.items():
+            shard[prefix] = [doc_id for rank, doc_id in sorted(postings)]
+    return docs, shards
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':')) + '\n'
+
+
+def write_search_index(docs, shards, search_dir=SEARCH_DIR):
+    """조각 파일과 index.json 쓰기 (없어진 조각 파일은 삭제)"""
+    os.makedirs(search_dir, exist_ok=True)
+    payloads = {key: _dumps(shards[key]) for key in sorted(shards)}
+    version = hashlib.sha256(_dumps(docs).encode('utf-8'))
+    for key, payload in payloads.items():
+        version.update(payload.encode('utf-8'))
+        atomic_write(os.path.join(search_dir, f'{key}.json'), payload)
+
+    for name in os.listdir(search_dir):
+        stem, ext = os.path.splitext(name)
+        if ext == '.json' and stem != 'index' and stem not in payloads:
+            os.remove(os.path.join(search_dir, name))
+
+    index = {
+        'version': version.hexdigest()[:12],
+        'max_prefix': MAX_PREFIX_LENGTH,
+        'docs': docs,
+        'shards': sorted(payloads)
+    }
+    # 조각을 모두 쓴 뒤 마지막에 교체해서 새 index.json이 없는 조각을 가리키지 않게 함
+    atomic_write(os.path.join(search_dir, 'index.json'), _dumps(index))
+    return index, sum(len(payload) for payload in payloads.values())
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='사이트 검색 색인 생성')
+    parser.add_argument('--output', default=SEARCH_DIR, help='색인을 쓸 디렉토리')
+    args = parser.parse_args()
+
+    docs, shards = build_search_index(get_catalog().posts(), load_summaries())
+    index, shard_bytes = write_search_index(docs, shards, args.output)
+
+    prefixes = sum(len(shard) for shard in shards.values())
+    print(f"🔍 검색 색인 생성: 포스트 {len(docs)}개, 접두사 {prefixes}개")
+    print(f"📦 조각 {len(shards)}개 ({shard_bytes / 1024:.0f}KB), 버전 {index['version']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,42 +5,41 @@
 누락된 이미지 확인 및 다운로드
 """
 
+import argparse
 import os
-import re
-import urllib.request
-import urllib.error
+import queue
+import threading
+import time
 
-def check_missing_images():
-    """누락된 이미지 확인"""
-    posts_dir = "_posts"
+from http_session import print_session_stats
+from image_downloader import download_image
+from image_optimizer import ImageOptimizer, pillow_available
+from image_probe import select_image
+from image_store import ImageStore, set_post_image
+from library_db import record_images
+from post_catalog import get_catalog
+from readme_images import readme_images
+from readme_store import get_readme_store
+
+def scan_post_images():
+    """포스트마다 (post_file, image_name, 존재 여부)를 하나씩 반환"""
     images_dir = "images/posts"
     
+    for post in get_catalog():
+        if post.image_name:
+            full_path = os.path.join(images_dir, post.image_name)
+            yield post.file, post.image_name, os.path.exists(full_path)
+
+def check_missing_images():
+    """누락된 이미지 확인"""
     missing = []
     existing = []
     
-    # 모든 포스트 확인
-    posts = [f for f in os.listdir(posts_dir) if f.endswith('.md')]
-    posts.sort()
-    
-    for post_file in posts:
-        file_path = os.path.join(posts_dir, post_file)
-        
-        # 이미지 경로 추출
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        image_match = re.search(r"image:\s*'([^']+)'", content)
-        if image_match:
-            image_path = image_match.group(1)
-            # 상대 경로로 변환
-            if image_path.startswith('/images/posts/'):
-                image_name = image_path.replace('/images/posts/', '')
-                full_path = os.path.join(images_dir, image_name)
-                
-                if os.path.exists(full_path):
-                    existing.append((post_file, image_name))
-                else:
-                    missing.append((post_file, image_name))
+    for post_file, image_name, exists in scan_post_images():
+        if exists:
+            existing.append((post_file, image_name))
+        else:
+            missing.append((post_file, image_name))
     
     print(f"📊 이미지 현황")
     print(f"  ✅ 존재: {len(existing)}개")
@@ -57,71 +56,188 @@ def check_missing_images():
     return missing
 
 def find_image_url(post_file):
-    """포스트에서 GitHub 저장소 찾고 이미지 URL 검색"""
-    file_path = os.path.join("_posts", post_file)
+    """포스트에서 GitHub 저장소 찾고 가장 알맞은 README 이미지 (URL, 확장자) 반환
+    
+    확장자는 HEAD 확인의 Content-Type으로 맞춘 값이다. 없으면 (None, None).
+    """
+    post = get_catalog().get(post_file)
+    if not post.link or 'github.com/' not in post.link or not post.repo:
+        return None, None
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # 상위 후보를 HEAD로 확인해서 배지/너무 큰 파일을 받기 전에 거름
+    image, _ = select_image(readme_images(post.repo))
+    if image:
+        return image.url, image.ext
+    return None, None
+
+def save_image(post_file, image_name, image_url, ext, store=None, optimizer=None):
+    """이미지를 받아 저장하고 저장된 바이트 수 반환 (실패 시 None)
     
-    # GitHub 저장소 추출
-    link_match = re.search(r"link:\s*'([^']+)'", content)
-    if not link_match:
+    ext는 find_image_url이 확인한 실제 형식이다 (URL의 확장자는 틀릴 수 있음).
+    store(ImageStore)가 주어지면 같은 URL이나 같은 내용의 이미지가 이미 있을 때
+    새로 저장하지 않고 포스트가 기존 파일을 가리키게 한다.
+    optimizer(ImageOptimizer)가 주어지면 새로 저장한 이미지를 바로 최적화한다.
+    """
+    # 확장자 확인
+    if ext not in ['gif', 'png', 'jpg', 'jpeg', 'webp']:
+        print(f"  ⚠️  {post_file}: 지원하지 않는 형식 ({image_url})")
         return None
     
-    link = link_match.group(1)
-    repo_match = re.search(r'github\.com/([^/]+/[^/]+)', link)
-    if not repo_match:
+    # 같은 URL에서 받은 이미지가 이미 있으면 다운로드 생략
+    if store is not None:
+        existing = store.lookup_url(image_url)
+        if existing:
+            set_post_image(post_file, existing)
+            print(f"  ♻️  {post_file}: 기존 이미지 사용 {existing}")
+            return 0
+    
+    # 기존 이미지명의 확장자 변경 필요 여부 확인 (Foo.PNG처럼 대문자 확장자도 같게 비교)
+    stem, current_ext = os.path.splitext(image_name)
+    current_ext = current_ext[1:].lower()
+    if current_ext != ext:
+        new_image_name = f'{stem}.{ext}'
+        print(f"  📝 {post_file}: 이미지명 변경 {image_name} → {new_image_name}")
+    else:
+        new_image_name = image_name
+    
+    # 다운로드
+    save_path = os.path.join("images/posts", new_image_name)
+    if not download_image(image_url, save_path):
         return None
+    size = os.path.getsize(save_path)
     
-    repo = repo_match.group(1).rstrip('/')
+    # 같은 내용의 파일이 이미 있으면 새 파일 대신 기존 파일 사용
+    if store is not None:
+        canonical = store.ingest(new_image_name, image_url)
+        if canonical != new_image_name:
+            set_post_image(post_file, canonical)
+            print(f"  ♻️  {post_file}: 중복 이미지, 기존 파일 사용 {canonical}")
+            return size
     
-    # README 확인
-    readme_urls = [
-        f"https://raw.githubusercontent.com/{repo}/master/README.md",
-        f"https://raw.githubusercontent.com/{repo}/main/README.md"
-    ]
+    # 포스트 파일 업데이트 필요시
+    if current_ext != ext:
+        update_post_image_ext(post_file, current_ext, ext)
     
-    for url in readme_urls:
-        try:
-            req = urllib.request.Request(url, headers={
-                'User-Agent': 'AndroidUICollection/1.0'
-            })
-            with urllib.request.urlopen(req, timeout=10) as response:
-                readme_content = response.read().decode('utf-8')
-                
-                # 이미지 찾기 (GIF 우선)
-                gif_pattern = r'https?://[^\s\)]+\.gif'
-                gifs = re.findall(gif_pattern, readme_content)
-                if gifs:
-                    return gifs[0]
-                
-                # PNG/JPG
-                img_pattern = r'https?://[^\s\)]+\.(png|jpg|jpeg)'
-                imgs = re.findall(img_pattern, readme_content)
-                if imgs:
-                    return imgs[0]
-                
-        except Exception:
-            continue
-    
-    return None
+    if optimizer is not None:
+        entry = optimizer.optimize(new_image_name)
+        if entry and entry['after'] < entry['before']:
+            print(f"  📉 {post_file}: 최적화 {entry['before'] / 1024:.0f}KB → {entry['after'] / 1024:.0f}KB")
+    return size
 
-def download_image(url, save_path):
-    """이미지 다운로드"""
-    try:
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'AndroidUICollection/1.0'
-        })
-        with urllib.request.urlopen(req, timeout=30) as response:
-            with open(save_path, 'wb') as f:
-                f.write(response.read())
-        return True
-    except Exception as e:
-        print(f"    다운로드 실패: {e}")
-        return False
+def run_pipeline(missing, limit=None, discover_workers=8, download_workers=4, queue_size=16,
+                 optimize=False):
+    """누락 목록 → README 이미지 검색 → 다운로드를 단계별 작업자로 동시에 실행
+    
+    missing: check_missing_images가 한 번 스캔한 (post_file, image_name) 목록
+    단계 사이는 크기가 제한된 큐로 연결되어, 앞 단계가 너무 앞서 나가지 않는다.
+    """
+    missing = missing[:limit]
+    discover_queue = queue.Queue(maxsize=queue_size)
+    download_queue = queue.Queue(maxsize=queue_size)
+    stats = {'queued': 0, 'done': 0, 'downloaded': 0, 'not_found': 0, 'failed': 0, 'bytes': 0}
+    lock = threading.Lock()
+    store = ImageStore()
+    store.refresh()
+    optimizer = ImageOptimizer() if optimize else None
+    
+    # README URL은 작업자를 띄우기 전에 한 번에 찾음 (검색 작업자마다 resolver를 돌리지 않도록)
+    catalog = get_catalog()
+    get_readme_store().resolve_unknown(catalog.get(post_file).repo for post_file, _ in missing)
+    started = time.time()
+    
+    def finish(post_file, result, message, size=0):
+        with lock:
+            stats['done'] += 1
+            stats[result] += 1
+            stats['bytes'] += size
+            elapsed = max(time.time() - started, 1e-3)
+            print(f"[{stats['done']}/{stats['queued']}] {post_file}: {message} "
+                  f"({stats['done'] / elapsed:.1f}개/s, {stats['bytes'] / 1024 / 1024 / elapsed:.2f}MB/s)")
+    
+    def scan():
+        # 중간에 실패해도 종료 신호는 보내야 검색 작업자가 멈춘다
+        try:
+            for post_file, image_name in missing:
+                with lock:
+                    stats['queued'] += 1
+                discover_queue.put((post_file, image_name))
+        finally:
+            for _ in range(discover_workers):
+                discover_queue.put(None)
+    
+    # 항목 하나가 예외를 던져도 작업자는 계속 돌아야 한다. 작업자가 죽으면
+    # 크기가 제한된 큐가 차서 앞 단계와 종료 신호를 기다리는 join이 멈춘다.
+    def discover():
+        while True:
+            item = discover_queue.get()
+            if item is None:
+                break
+            post_file, image_name = item
+            try:
+                image_url, ext = find_image_url(post_file)
+            except Exception as e:
+                finish(post_file, 'failed', f"⚠️  이미지 검색 실패: {e}")
+                continue
+            if image_url:
+                print(f"  📷 {post_file}: {image_url}")
+                download_queue.put((post_file, image_name, image_url, ext))
+            else:
+                finish(post_file, 'not_found', "❌ 이미지를 찾을 수 없음")
+    
+    def download():
+        while True:
+            item = download_queue.get()
+            if item is None:
+                break
+            try:
+                size = save_image(*item, store=store, optimizer=optimizer)
+            except Exception as e:
+                finish(item[0], 'failed', f"⚠️  저장 실패: {e}")
+                continue
+            if size is None:
+                finish(item[0], 'failed', "⚠️  다운로드 실패")
+            else:
+                finish(item[0], 'downloaded', f"✅ 다운로드 완료 ({size / 1024:.0f}KB)", size)
+    
+    scan_thread = threading.Thread(target=scan)
+    discover_threads = [threading.Thread(target=discover) for _ in range(discover_workers)]
+    download_threads = [threading.Thread(target=download) for _ in range(download_workers)]
+    for thread in [scan_thread] + discover_threads + download_threads:
+        thread.start()
+    
+    scan_thread.join()
+    for thread in discover_threads:
+        thread.join()
+    for _ in range(download_workers):
+        download_queue.put(None)
+    for thread in download_threads:
+        thread.join()
+    store.save()
+    record_images(store)
+    if optimizer is not None:
+        optimizer.save()
+        optimizer.write_report()
+    
+    stats['elapsed'] = max(time.time() - started, 1e-3)
+    return stats
 
 def main():
     """메인 실행"""
+    parser = argparse.ArgumentParser(description='누락된 이미지 확인 및 다운로드')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='처리할 최대 이미지 수 (기본: 전체)')
+    parser.add_argument('--discover-workers', type=int, default=8,
+                        help='README 이미지 검색 작업자 수')
+    parser.add_argument('--download-workers', type=int, default=4,
+                        help='다운로드 작업자 수')
+    parser.add_argument('--optimize', action='store_true',
+                        help='받은 이미지를 최적화 (Pillow 필요)')
+    args = parser.parse_args()
+    
+    if args.optimize and not pillow_available():
+        print("❌ --optimize에는 Pillow가 필요합니다: pip install Pillow")
+        return
+    
     missing = check_missing_images()
     
     if not missing:
@@ -130,51 +246,23 @@ def main():
     
     print(f"\n🔄 누락된 이미지 다운로드 시작...")
     
-    success_count = 0
-    for i, (post_file, image_name) in enumerate(missing[:10], 1):  # 처음 10개만
-        print(f"\n[{i}/10] {post_file}")
-        
-        # 이미지 URL 찾기
-        image_url = find_image_url(post_file)
-        if image_url:
-            print(f"  📷 발견: {image_url}")
-            
-            # 확장자 확인
-            ext = image_url.split('.')[-1].lower()
-            if ext in ['gif', 'png', 'jpg', 'jpeg', 'webp']:
-                # 기존 이미지명의 확장자 변경 필요 여부 확인
-                current_ext = image_name.split('.')[-1].lower()
-                if current_ext != ext:
-                    new_image_name = image_name.replace(f'.{current_ext}', f'.{ext}')
-                    print(f"  📝 이미지명 변경: {image_name} → {new_image_name}")
-                else:
-                    new_image_name = image_name
-                
-                # 다운로드
-                save_path = os.path.join("images/posts", new_image_name)
-                if download_image(image_url, save_path):
-                    print(f"  ✅ 다운로드 완료: {new_image_name}")
-                    success_count += 1
-                    
-                    # 포스트 파일 업데이트 필요시
-                    if current_ext != ext:
-                        update_post_image_ext(post_file, current_ext, ext)
-        else:
-            print(f"  ❌ 이미지를 찾을 수 없음")
+    stats = run_pipeline(missing, args.limit, args.discover_workers, args.download_workers,
+                         optimize=args.optimize)
     
-    print(f"\n✅ 완료! 성공: {success_count}/10")
+    elapsed = stats['elapsed']
+    print(f"\n✅ 완료! 성공: {stats['downloaded']}/{stats['queued']}")
+    print(f"  ❌ 이미지 없음: {stats['not_found']}개, ⚠️  실패: {stats['failed']}개")
+    print(f"  ⏱️  {elapsed:.1f}초, {stats['queued'] / elapsed:.1f}개/s, "
+          f"{stats['bytes'] / 1024 / 1024:.1f}MB ({stats['bytes'] / 1024 / 1024 / elapsed:.2f}MB/s)")
+    print_session_stats()
 
 def update_post_image_ext(post_file, old_ext, new_ext):
     """포스트 파일의 이미지 확장자 업데이트"""
-    file_path = os.path.join("_posts", post_file)
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    content = content.replace(f'.{old_ext}', f'.{new_ext}')
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    catalog = get_catalog()
+    post = catalog.get(post_file)
+    stem, ext = os.path.splitext(post.image)
+    if ext[1:].lower() == old_ext.lower():
+        catalog.edit(post, {'image': f'{stem}.{new_ext}'})
     
     print(f"  ✏️  포스트 파일 업데이트 완료")
 
@@ -3,10 +3,11 @@
 Script to check GitHub repository URLs and find the correct branch and README location.
 """
 
-import requests
 import json
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from github_client import check_github_statuses
+from library_db import record_readmes, record_repo_statuses
+from readme_resolver import resolve_readme_urls
 
 # List of repositories to check
 REPOSITORIES = [
@@ -31,63 +32,32 @@ REPOSITORIES = [
     "cashapp/paging-multiplatform"
 ]
 
-def check_url(url, timeout=5):
-    """Check if a URL is accessible."""
-    try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
-        return response.status_code == 200
-    except:
-        return False
+def to_repo_info(status):
+    """Convert a github_client status dict into the repo_info shape used here."""
+    if status["exists"] is False:
+        return {"exists": False, "error": "Repository not found"}
+    if status["exists"] == "unknown":
+        return {"exists": False, "error": f"API error: {status.get('error', '')}"}
 
-def get_repo_info(repo_path):
-    """Get repository information using GitHub API."""
-    try:
-        # First check if repo exists using API
-        api_url = f"https://api.github.com/repos/{repo_path}"
-        response = requests.get(api_url, timeout=5)
-        
-        if response.status_code == 404:
-            return {"exists": False, "error": "Repository not found"}
-        elif response.status_code != 200:
-            return {"exists": False, "error": f"API error: {response.status_code}"}
-            
-        repo_data = response.json()
-        default_branch = repo_data.get('default_branch', 'main')
-        
-        return {
-            "exists": True,
-            "default_branch": default_branch,
-            "full_name": repo_data.get('full_name', repo_path),
-            "archived": repo_data.get('archived', False),
-            "private": repo_data.get('private', False)
-        }
-    except Exception as e:
-        return {"exists": False, "error": str(e)}
+    return {
+        "exists": True,
+        "default_branch": status["default_branch"],
+        "full_name": status["full_name"],
+        "archived": status["archived"],
+        "private": status["private"]
+    }
+
+def get_repo_infos(repo_paths):
+    """Get repository information for all repositories using GitHub API.
 
-def check_readme_variations(repo_path, branch):
-    """Check different README URL variations."""
-    base_url = f"https://raw.githubusercontent.com/{repo_path}"
-    variations = [
-        f"{base_url}/{branch}/README.md",
-        f"{base_url}/{branch}/readme.md",
-        f"{base_url}/{branch}/README.MD",
-        f"{base_url}/{branch}/Readme.md",
-        f"{base_url}/{branch}/README",
-        f"{base_url}/{branch}/readme",
-        f"{base_url}/{branch}/README.markdown",
-        f"{base_url}/{branch}/readme.markdown",
-        f"{base_url}/{branch}/README.rst",
-        f"{base_url}/{branch}/readme.rst",
-        f"{base_url}/{branch}/README.txt",
-        f"{base_url}/{branch}/readme.txt"
-    ]
-    
-    for url in variations:
-        if check_url(url):
-            return url
-    return None
+    Requests are paced by the rate-limit headers GitHub returns, so a
+    repository is only reported as an API error after its retries ran out.
+    """
+    statuses = check_github_statuses(repo_paths)
+    record_repo_statuses(statuses)
+    return {repo: to_repo_info(status) for repo, status in statuses.items()}
 
-def process_repository(repo_path):
+def process_repository(repo_path, repo_info, readme):
     """Process a single repository to find its correct URL."""
     print(f"\nChecking: {repo_path}")
     result = {
@@ -96,9 +66,6 @@ def process_repository(repo_path):
         "details": {}
     }
     
-    # Get repository info
-    repo_info = get_repo_info(repo_path)
-    
     if not repo_info["exists"]:
         result["status"] = "not_found"
         result["details"] = repo_info
@@ -114,44 +81,23 @@ def process_repository(repo_path):
     if repo_info["archived"]:
         print(f"  ⚠️  Repository is archived")
     
-    # Check for README in default branch
+    # The README lookup already resolved the default branch and exact path
     default_branch = repo_info["default_branch"]
     print(f"  Default branch: {default_branch}")
     
-    readme_url = check_readme_variations(repo_path, default_branch)
-    
-    if readme_url:
+    if readme["status"] == "found":
         result["status"] = "found"
         result["details"] = {
             **repo_info,
-            "readme_url": readme_url,
-            "suggested_url": readme_url
+            "readme_url": readme["readme_url"],
+            "suggested_url": readme["readme_url"]
         }
-        print(f"  ✅ Found README at: {readme_url}")
+        print(f"  ✅ Found README at: {readme['readme_url']}")
     else:
-        # Try other common branches
-        other_branches = ['main', 'master', 'develop', 'dev']
-        other_branches = [b for b in other_branches if b != default_branch]
-        
-        for branch in other_branches:
-            readme_url = check_readme_variations(repo_path, branch)
-            if readme_url:
-                result["status"] = "found"
-                result["details"] = {
-                    **repo_info,
-                    "readme_url": readme_url,
-                    "suggested_url": readme_url,
-                    "note": f"Found in '{branch}' branch (not default)"
-                }
-                print(f"  ✅ Found README in '{branch}' branch: {readme_url}")
-                break
-        
-        if result["status"] != "found":
-            result["status"] = "no_readme"
-            result["details"] = repo_info
-            print(f"  ❌ No README found in any common location")
+        result["status"] = "no_readme"
+        result["details"] = {**repo_info, "error": readme["error"]} if "error" in readme else repo_info
+        print(f"  ❌ No README found")
     
-    time.sleep(0.1)  # Be nice to GitHub
     return result
 
 def main():
@@ -161,23 +107,14 @@ def main():
     
     results = []
     
-    # Process repositories with thread pool for faster execution
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_repo = {executor.submit(process_repository, repo): repo 
-                         for repo in REPOSITORIES}
-        
-        for future in as_completed(future_to_repo):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                repo = future_to_repo[future]
-                print(f"\n❌ Error processing {repo}: {str(e)}")
-                results.append({
-                    "repository": repo,
-                    "status": "error",
-                    "details": {"error": str(e)}
-                })
+    # Fetch repository metadata and README locations for every repository up front,
+    # one request per repository each
+    repo_infos = get_repo_infos(REPOSITORIES)
+    readmes = resolve_readme_urls(REPOSITORIES)
+    record_readmes(readmes)
+    
+    for repo in REPOSITORIES:
+        results.append(process_repository(repo, repo_infos[repo], readmes[repo]))
     
     # Sort results by repository name
     results.sort(key=lambda x: x["repository"])
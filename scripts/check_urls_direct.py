@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
-Direct URL checker for GitHub repositories without using API.
+README URL checker for GitHub repositories.
+
+Each repository's README is resolved with a single lookup that returns the
+default branch and exact README path, instead of probing branch x filename
+combinations.
 """
 
-import requests
-import time
+from library_db import record_readmes
+from readme_resolver import resolve_readme_urls
 
 # List of repositories to check
 REPOSITORIES = [
@@ -29,55 +33,29 @@ REPOSITORIES = [
     "cashapp/paging-multiplatform"
 ]
 
-def check_url(url, timeout=10):
-    """Check if a URL is accessible."""
-    try:
-        response = requests.get(url, timeout=timeout)
-        return response.status_code == 200
-    except:
-        return False
-
-def check_repository(repo_path):
-    """Check different README URL variations for a repository."""
-    print(f"\nChecking: {repo_path}")
-    base_url = f"https://raw.githubusercontent.com/{repo_path}"
-    
-    # Common branch names to try
-    branches = ['main', 'master', 'develop']
-    
-    # README file variations
-    readme_files = [
-        'README.md', 'readme.md', 'README.MD', 'Readme.md',
-        'README', 'readme', 'README.markdown', 'readme.markdown'
-    ]
-    
-    found_urls = []
-    
-    for branch in branches:
-        for readme in readme_files:
-            url = f"{base_url}/{branch}/{readme}"
-            if check_url(url):
-                found_urls.append(url)
-                print(f"  ✅ Found: {url}")
-                return url  # Return first working URL
-            time.sleep(0.1)  # Be nice to GitHub
+def check_repositories(repositories):
+    """Resolve the README URL of every repository (repo -> URL or None)."""
+    resolved = resolve_readme_urls(repositories)
+    record_readmes(resolved)
     
-    if not found_urls:
-        print(f"  ❌ No README found")
-    
-    return None
+    results = {}
+    for repo in repositories:
+        result = resolved[repo]
+        print(f"\nChecking: {repo}")
+        if result["status"] == "found":
+            print(f"  ✅ Found: {result['readme_url']}")
+            results[repo] = result["readme_url"]
+        else:
+            print(f"  ❌ No README found {result.get('error', '')}")
+            results[repo] = None
+    return results
 
 def main():
-    print("Direct GitHub Repository URL Checker")
+    print("GitHub README URL Checker")
     print("=" * 50)
     print(f"Checking {len(REPOSITORIES)} repositories...")
     
-    results = {}
-    
-    for repo in REPOSITORIES:
-        working_url = check_repository(repo)
-        results[repo] = working_url
-        time.sleep(0.5)  # Additional delay between repositories
+    results = check_repositories(REPOSITORIES)
     
     # Print summary
     print("\n" + "=" * 50)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import os
-import requests
-import re
-from urllib.parse import urlparse
+
+from http_session import print_session_stats
+from image_downloader import download_image
+from image_probe import select_image
+from readme_images import readme_images
 
 # List of libraries with their GitHub URLs
 libraries = [
@@ -62,57 +64,6 @@ libraries = [
     ("lazybones", "https://github.com/BuggieSlugger/lazybones")
 ]
 
-def get_readme_url(github_url):
-    """Convert GitHub URL to raw README URL"""
-    parts = github_url.replace("https://github.com/", "").split("/")
-    owner = parts[0]
-    repo = parts[1] if len(parts) > 1 else ""
-    return f"https://raw.githubusercontent.com/{owner}/{repo}/master/README.md"
-
-def find_image_urls(readme_content, github_url):
-    """Find all image URLs in README content"""
-    # Pattern to find image URLs in markdown
-    pattern = r'!\[.*?\]\((.*?)\)'
-    urls = re.findall(pattern, readme_content)
-    
-    # Also find direct image links
-    img_pattern = r'(https?://[^\s]+\.(?:gif|png|jpg|jpeg|webp))'
-    direct_urls = re.findall(img_pattern, readme_content, re.IGNORECASE)
-    
-    all_urls = urls + direct_urls
-    
-    # Convert relative URLs to absolute
-    absolute_urls = []
-    for url in all_urls:
-        if url.startswith('http'):
-            absolute_urls.append(url)
-        elif url.startswith('/'):
-            # Relative to repo root
-            parts = github_url.replace("https://github.com/", "").split("/")
-            owner = parts[0]
-            repo = parts[1] if len(parts) > 1 else ""
-            absolute_urls.append(f"https://raw.githubusercontent.com/{owner}/{repo}/master{url}")
-        else:
-            # Relative to README location
-            parts = github_url.replace("https://github.com/", "").split("/")
-            owner = parts[0]
-            repo = parts[1] if len(parts) > 1 else ""
-            absolute_urls.append(f"https://raw.githubusercontent.com/{owner}/{repo}/master/{url}")
-    
-    return absolute_urls
-
-def download_image(url, filename):
-    """Download image from URL"""
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            with open(filename, 'wb') as f:
-                f.write(response.content)
-            return True
-    except Exception as e:
-        print(f"Error downloading {url}: {e}")
-    return False
-
 # Create images directory if it doesn't exist
 os.makedirs("images/posts", exist_ok=True)
 
@@ -127,42 +78,27 @@ for name, github_url in libraries:
     
     print(f"Processing {name}...")
     
-    # Get README content
-    readme_url = get_readme_url(github_url)
+    # Find images in README (shared README store)
+    repo = "/".join(github_url.replace("https://github.com/", "").split("/")[:2])
     try:
-        response = requests.get(readme_url, timeout=10)
-        if response.status_code == 200:
-            readme_content = response.text
-            
-            # Find image URLs
-            image_urls = find_image_urls(readme_content, github_url)
+        # Ranked candidates, HEAD-probed so badges and oversized files are skipped
+        image, _ = select_image(readme_images(repo))
+        if image:
+            selected_url, ext = image.url, image.ext
             
-            if image_urls:
-                # Try to find the best image (prefer GIFs)
-                gif_urls = [url for url in image_urls if '.gif' in url.lower()]
-                if gif_urls:
-                    selected_url = gif_urls[0]
-                    ext = 'gif'
-                else:
-                    selected_url = image_urls[0]
-                    ext = selected_url.split('.')[-1].split('?')[0].lower()
-                    if ext not in ['png', 'jpg', 'jpeg', 'webp']:
-                        ext = 'png'
-                
-                # Download the image
-                filename = f"images/posts/{name}.{ext}"
-                if download_image(selected_url, filename):
-                    print(f"✓ Downloaded {filename}")
-                else:
-                    print(f"✗ Failed to download image for {name}")
+            # Download the image
+            filename = f"images/posts/{name}.{ext}"
+            if download_image(selected_url, filename):
+                print(f"✓ Downloaded {filename}")
             else:
-                print(f"✗ No images found in README for {name}")
+                print(f"✗ Failed to download image for {name}")
         else:
-            print(f"✗ Could not fetch README for {name}")
+            print(f"✗ No images found in README for {name}")
     except Exception as e:
         print(f"✗ Error processing {name}: {e}")
 
 print("\nDone! Check the images/posts directory for downloaded images.")
+print_session_stats()
 print("Note: Some libraries may not have images in their README. You may need to:")
 print("1. Take screenshots manually")
 print("2. Look for images in the repository's other directories")
@@ -3,53 +3,43 @@
 
 """
 README URL 수정 스크립트
+
+사용법:
+    python3 scripts/fix_readme_urls.py          # 문제가 있던 라이브러리만
+    python3 scripts/fix_readme_urls.py --all    # 전체 포스트 확인
+    python3 scripts/fix_readme_urls.py --all --check   # 수정하지 않고 확인만
 """
 
-import os
+import argparse
 import re
-import urllib.request
-import urllib.error
-
-def check_readme_url(url):
-    """URL이 유효한지 확인"""
-    try:
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'AndroidUICollection/1.0'
-        })
-        with urllib.request.urlopen(req, timeout=5) as response:
-            return response.getcode() == 200
-    except:
-        return False
 
-def find_correct_readme_url(repo):
-    """올바른 README URL 찾기"""
-    branches = ['master', 'main', 'develop']
-    filenames = ['README.md', 'readme.md', 'Readme.md']
-    
-    for branch in branches:
-        for filename in filenames:
-            url = f"https://raw.githubusercontent.com/{repo}/{branch}/{filename}"
-            if check_readme_url(url):
-                return url
-    return None
+from front_matter import FrontMatter
+from http_session import print_session_stats
+from library_db import record_readmes
+from post_catalog import get_catalog
+from readme_resolver import resolve_readme_urls
 
-def fix_post_readme_url(file_path, new_url):
-    """포스트 파일의 README URL 수정"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def fix_post_readme_url(post, new_url):
+    """포스트 파일의 README URL 수정 (본문 remote_markdown과 front matter md:)"""
+    front_matter = FrontMatter(post.content)
     
     # remote_markdown URL 수정
-    content = re.sub(
+    front_matter.body = re.sub(
         r'{% remote_markdown https://raw\.githubusercontent\.com/[^}]+\.md %}',
         f'{{% remote_markdown {new_url} %}}',
-        content
+        front_matter.body
     )
+    if 'md' in front_matter:
+        front_matter['md'] = new_url
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    get_catalog().rewrite(post, front_matter.render())
 
 def main():
     """404 오류가 나는 라이브러리들 수정"""
+    parser = argparse.ArgumentParser(description='README URL 수정')
+    parser.add_argument('--all', action='store_true', help='_posts 전체 확인')
+    parser.add_argument('--check', action='store_true', help='파일을 수정하지 않고 결과만 출력')
+    args = parser.parse_args()
     
     # 문제가 있는 라이브러리들
     problematic_libs = [
@@ -60,38 +50,62 @@ def main():
         ('2024-01-15-WheelPickerCompose.md', 'commandiron/WheelPickerCompose')
     ]
     
+    catalog = get_catalog()
+    if args.all:
+        targets = [(post.file, post.repo) for post in catalog]
+    else:
+        targets = problematic_libs
+    
     print("🔧 README URL 수정 시작...\n")
     
-    for post_file, repo in problematic_libs:
-        file_path = os.path.join('_posts', post_file)
-        if not os.path.exists(file_path):
+    # 저장소마다 요청 한 번으로 README 위치 확인
+    resolved = resolve_readme_urls([repo for _, repo in targets if repo])
+    record_readmes(resolved)
+    
+    stats = {'ok': 0, 'fixed': 0, 'failed': 0}
+    
+    for post_file, repo in targets:
+        post = catalog.get(post_file)
+        if post is None:
             print(f"❌ {post_file} - 파일이 존재하지 않음")
+            stats['failed'] += 1
+            continue
+        if not repo:
+            print(f"❌ {post_file} - GitHub 저장소를 찾을 수 없음")
+            stats['failed'] += 1
             continue
         
-        print(f"📍 {post_file} ({repo})")
+        result = resolved[repo]
+        current_url = post.readme_url
+        
+        if result['status'] == 'found' and result['readme_url'] == current_url:
+            stats['ok'] += 1
+            continue
         
-        # 올바른 URL 찾기
-        correct_url = find_correct_readme_url(repo)
+        print(f"📍 {post_file} ({repo})")
         
-        if correct_url:
+        if result['status'] == 'found':
+            correct_url = result['readme_url']
             print(f"  ✅ 올바른 URL 발견: {correct_url}")
-            fix_post_readme_url(file_path, correct_url)
-            print(f"  ✅ 수정 완료")
+            if not result['markdown']:
+                print(f"  ⚠️  마크다운 README가 아님 (remote_markdown에서 사용할 수 없음)")
+                stats['failed'] += 1
+            elif args.check:
+                print(f"  ℹ️  현재 URL: {current_url}")
+                stats['fixed'] += 1
+            else:
+                fix_post_readme_url(post, correct_url)
+                print(f"  ✅ 수정 완료")
+                stats['fixed'] += 1
+        elif result['status'] == 'not_found':
+            print(f"  ❌ README를 찾을 수 없음 (README가 없거나 저장소가 삭제됨)")
+            stats['failed'] += 1
         else:
-            print(f"  ❌ README를 찾을 수 없음")
-            # 저장소 자체 확인
-            api_url = f"https://api.github.com/repos/{repo}"
-            try:
-                req = urllib.request.Request(api_url, headers={
-                    'User-Agent': 'AndroidUICollection/1.0'
-                })
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    print(f"  ℹ️  저장소는 존재하지만 README가 없음")
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
-                    print(f"  ⚠️  저장소가 삭제됨")
-                else:
-                    print(f"  ⚠️  오류: {e.code}")
+            print(f"  ⚠️  오류: {result['error']}")
+            stats['failed'] += 1
+    
+    print(f"\n✅ 정상: {stats['ok']}개, {'수정 필요' if args.check else '수정'}: {stats['fixed']}개, 실패: {stats['failed']}개")
+    print_session_stats()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
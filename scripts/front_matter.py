@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+포스트 front matter 파서/작성기
+
+포스트를 '---'로 둘러싼 YAML 머리말과 본문으로 한 번만 나누고,
+머리말은 YAML로 파싱한다. 값을 바꾸면 바뀐 키의 줄만 기존 표기
+(작은따옴표 여부, [a, b] 형태 목록)에 맞춰 다시 쓰고, 나머지 머리말 줄과
+본문은 바이트 단위로 그대로 둔다.
+
+사용법:
+    fm = FrontMatter(content)
+    fm['tag'] = ['view', 'button']
+    fm['image'] = '/images/posts/Button.png'
+    content = fm.render()
+"""
+
+import re
+
+import yaml
+
+try:
+    Loader = yaml.CSafeLoader
+except AttributeError:
+    Loader = yaml.SafeLoader
+
+DELIMITER = '---'
+KEY_PATTERN = re.compile(r'^([A-Za-z0-9_-]+):')
+PLAIN_SCALAR = re.compile(r'^[A-Za-z0-9][A-Za-z0-9 ._/-]*$')
+
+
+class FrontMatterError(ValueError):
+    """front matter가 없거나 YAML로 읽을 수 없음"""
+
+
+def _quote(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _format_scalar(value, quoted):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    value = str(value)
+    # 따옴표 없이 쓰면 다른 값으로 읽히는 경우(true, 123, 'a: b' 등)는 항상 따옴표
+    if quoted or not PLAIN_SCALAR.match(value) or yaml.load(value, Loader=Loader) != value:
+        return _quote(value)
+    return value
+
+
+def format_value(value, original=''):
+    """값을 YAML 한 줄로 표기 (original 줄의 따옴표 사용 여부를 따름)"""
+    quoted = "'" in original or '"' in original
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(_format_scalar(item, quoted) for item in value) + ']'
+    return _format_scalar(value, quoted)
+
+
+def split_front_matter(content):
+    """(머리말 줄 목록, 본문) 반환 — 본문은 닫는 '---' 줄 다음부터 그대로"""
+    if not content.startswith(DELIMITER + '\n'):
+        raise FrontMatterError('front matter가 없음')
+    end = content.find('\n' + DELIMITER, len(DELIMITER))
+    while end != -1:
+        after = end + 1 + len(DELIMITER)
+        if after == len(content) or content[after] == '\n':
+            break
+        end = content.find('\n' + DELIMITER, after)
+    if end == -1:
+        raise FrontMatterError('front matter가 닫히지 않음')
+
+    header = content[len(DELIMITER) + 1:end + 1]
+    body_start = end + 1 + len(DELIMITER)
+    return header.splitlines(keepends=True), content[body_start:]
+
+
+class FrontMatter:
+    """포스트 하나의 front matter (변경한 키만 다시 씀)"""
+
+    def __init__(self, content):
+        self.lines, self.body = split_front_matter(content)
+        try:
+            self.data = yaml.load(''.join(self.lines), Loader=Loader) or {}
+        except yaml.YAMLError as e:
+            raise FrontMatterError(f'YAML 오류: {e}') from e
+        if not isinstance(self.data, dict):
+            raise FrontMatterError('front matter가 매핑이 아님')
+        self._changed = {}
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        if key in self.data and self.data[key] == value and key not in self._changed:
+            return
+        self.data[key] = value
+        self._changed[key] = value
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def update(self, values):
+        for key, value in values.items():
+            self[key] = value
+
+    @property
+    def changed(self):
+        """render() 결과가 원본과 다른지 여부"""
+        return bool(self._changed)
+
+    def _key_span(self, key):
+        """키가 차지하는 줄 범위 (블록 목록 등 이어지는 줄 포함)"""
+        for i, line in enumerate(self.lines):
+            match = KEY_PATTERN.match(line)
+            if match and match.group(1) == key:
+                end = i + 1
+                while end < len(self.lines) and self.lines[end][:1] in (' ', '\t', '-'):
+                    end += 1
+                return i, end
+        return None
+
+    def render(self):
+        """바뀐 키의 줄만 교체한 전체 포스트 내용"""
+        lines = list(self.lines)
+        for key, value in self._changed.items():
+            span = self._key_span(key)
+            original = ''.join(lines[span[0]:span[1]]) if span else ''
+            line = f'{key}: {format_value(value, original.partition(":")[2])}\n'
+            if span:
+                # 이미 교체한 키가 있어도 줄 수가 바뀌지 않도록 한 줄로 합친다
+                lines[span[0]:span[1]] = [line] + [''] * (span[1] - span[0] - 1)
+            else:
+                if lines and not lines[-1].endswith('\n'):
+                    lines[-1] += '\n'
+                lines.append(line)
+        return DELIMITER + '\n' + ''.join(lines) + DELIMITER + self.body
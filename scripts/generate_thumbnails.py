@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+포스트 카드용 반응형 썸네일 생성
+
+포스트 front matter의 image:(대부분 수 MB짜리 GIF)를 카드 크기에 맞춘
+WebP 변형(THUMBNAIL_WIDTHS)과 정지 포스터 이미지로 만들고,
+템플릿이 읽는 매니페스트(_data/thumbnails.json)를 작성한다.
+GIF는 애니메이션 WebP로 변환되어 원본보다 훨씬 작다.
+
+원본의 SHA-256이 매니페스트와 같고 결과 파일이 모두 있으면 건너뛰므로
+새로 추가되거나 바뀐 이미지만 다시 처리한다. SHA-256은 image_store의
+크기/수정 시각 매니페스트에서 가져오므로 바뀐 파일만 다시 읽는다. Pillow가 필요하다.
+
+사용법:
+    python3 scripts/generate_thumbnails.py
+    python3 scripts/generate_thumbnails.py --workers 4 --force
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from check_missing_images import scan_post_images
+from image_optimizer import POSTERS_DIR, frame_plan, make_poster, pillow_available
+from image_store import IMAGES_DIR, ImageStore, file_sha256
+
+THUMBS_DIR = 'images/thumbs'
+MANIFEST_PATH = '_data/thumbnails.json'
+THUMBNAIL_WIDTHS = (320, 480, 640)
+WEBP_QUALITY = 75
+
+
+def _resize(frame, width):
+    if frame.width <= width:
+        return frame
+    return frame.resize((width, round(frame.height * width / frame.width)), Image.LANCZOS)
+
+
+if Image is not None:
+    class FrameStream(Image.Image):
+        """원본의 indices 프레임을 하나씩 디코딩해서 width로 줄여 주는 애니메이션
+
+        Pillow의 save_all은 n_frames와 seek()로 프레임을 차례로 읽어 인코더에 넘기므로,
+        모든 프레임을 목록으로 만들지 않고 한 번에 한 프레임만 메모리에 둔다.
+        """
+
+        def __init__(self, source, indices, width):
+            super().__init__()
+            self._source = source
+            self._indices = indices
+            self._width = width
+            self._index = None
+            self.n_frames = len(indices)
+            self.is_animated = self.n_frames > 1
+            self.info = {}
+            self.seek(0)
+
+        def seek(self, index):
+            if index == self._index:
+                return
+            self._source.seek(self._indices[index])
+            frame = _resize(self._source.convert('RGBA'), self._width)
+            self.im = frame.im
+            self._mode = frame.mode
+            self._size = frame.size
+            self._index = index
+
+        def tell(self):
+            return self._index
+
+
+def _save_webp(source, indices, durations, width, save_path, loop):
+    """원본 프레임을 하나씩 width에 맞춰 (애니메이션) WebP로 저장"""
+    frames = FrameStream(source, indices, width)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(save_path), suffix='.webp')
+    os.close(fd)
+    if frames.is_animated:
+        frames.save(tmp_path, 'WEBP', save_all=True, duration=durations, loop=loop,
+                    quality=WEBP_QUALITY)
+    else:
+        frames.save(tmp_path, 'WEBP', quality=WEBP_QUALITY)
+    os.replace(tmp_path, save_path)
+
+
+def build_thumbnails(image_name, digest):
+    """이미지 하나의 WebP 변형과 포스터를 만들고 매니페스트 항목 반환 (작업 프로세스에서 실행)"""
+    path = os.path.join(IMAGES_DIR, image_name)
+    stem = os.path.splitext(image_name)[0]
+
+    with Image.open(path) as image:
+        width, height = image.size
+        # 원본보다 큰 변형은 만들지 않고, 원본이 가장 큰 너비보다 작으면 원본 크기를 추가
+        widths = [w for w in THUMBNAIL_WIDTHS if w < width]
+        if width <= max(THUMBNAIL_WIDTHS):
+            widths.append(width)
+
+        # 썸네일은 MAX_FPS로 제한 (10ms 이하 프레임은 브라우저처럼 100ms로 보고 합침)
+        indices, durations = frame_plan(image)
+        loop = image.info.get('loop', 0)
+
+        # 변형마다 원본을 한 번씩 다시 훑는다 (프레임 목록을 메모리에 모으지 않음)
+        variants = {}
+        for w in widths:
+            save_path = os.path.join(THUMBS_DIR, f'{stem}-{w}.webp')
+            _save_webp(image, indices, durations, w, save_path, loop)
+            variants[str(w)] = '/' + save_path
+
+    poster = make_poster(path, POSTERS_DIR, max(widths))
+    return {
+        'sha256': digest,
+        'width': width,
+        'height': height,
+        'animated': len(indices) > 1,
+        'poster': '/' + poster,
+        'variants': variants
+    }
+
+
+def _outputs_exist(entry):
+    paths = [entry['poster']] + list(entry['variants'].values())
+    return all(os.path.exists(p.lstrip('/')) for p in paths)
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """매니페스트 읽기 ({'/images/posts/이름': 항목})"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, manifest_path=MANIFEST_PATH):
+    """매니페스트 저장 (임시 파일 후 이름 변경)"""
+    directory = os.path.dirname(manifest_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, manifest_path)
+
+
+def generate_thumbnails(workers=None, force=False):
+    """포스트 이미지 중 새로 추가되거나 바뀐 것만 프로세스 풀에서 처리"""
+    manifest = load_manifest()
+    os.makedirs(THUMBS_DIR, exist_ok=True)
+
+    image_names = sorted({name for _, name, exists in scan_post_images() if exists})
+    keys = {f'/{IMAGES_DIR}/{name}' for name in image_names}
+    stats = {'images': len(image_names), 'built': 0, 'skipped': 0, 'failed': 0}
+
+    # 크기나 수정 시각이 바뀐 파일만 다시 해시
+    store = ImageStore()
+    store.refresh()
+    store.save()
+
+    pending = {}
+    for name in image_names:
+        key = f'/{IMAGES_DIR}/{name}'
+        stored = store.images.get(name)
+        digest = stored['sha256'] if stored else file_sha256(os.path.join(IMAGES_DIR, name))
+        entry = manifest.get(key)
+        if not force and entry and entry['sha256'] == digest and _outputs_exist(entry):
+            stats['skipped'] += 1
+        else:
+            pending[name] = digest
+
+    # 포스트에서 더 이상 쓰지 않는 이미지 항목 정리
+    for key in list(manifest):
+        if key not in keys:
+            del manifest[key]
+
+    started = time.time()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(build_thumbnails, name, digest): name
+            for name, digest in pending.items()
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            name = futures[future]
+            try:
+                manifest[f'/{IMAGES_DIR}/{name}'] = future.result()
+                stats['built'] += 1
+                print(f"[{i}/{len(futures)}] ✅ {name}")
+            except Exception as e:
+                stats['failed'] += 1
+                print(f"[{i}/{len(futures)}] ⚠️  {name}: {e}")
+
+    save_manifest(manifest)
+    stats['elapsed'] = time.time() - started
+    return stats
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='포스트 카드용 썸네일 생성')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='작업 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--force', action='store_true', help='모든 이미지 다시 생성')
+    args = parser.parse_args()
+
+    if not pillow_available():
+        print("❌ Pillow가 필요합니다: pip install Pillow")
+        return
+
+    stats = generate_thumbnails(args.workers, args.force)
+    print(f"\n✅ 완료! 이미지 {stats['images']}개 중 생성 {stats['built']}개, "
+          f"건너뜀 {stats['skipped']}개, 실패 {stats['failed']}개 ({stats['elapsed']:.1f}초)")
+    print(f"  📋 매니페스트: {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub 저장소 메타데이터 공용 비동기 클라이언트
+
+update_view_libraries.py, batch_update_tags.py, test_update_view_libraries.py에
+복사되어 있던 check_github_status를 대체한다. 호스트별 keep-alive 연결을
+재사용하고 동시 요청 수를 제한해서 전체 카탈로그를 한 번에 조회한다.
+
+사용법:
+    from github_client import check_github_status, check_github_statuses
+
+    status = check_github_status('Yalantis/Phoenix')
+    statuses = check_github_statuses(repos, concurrency=16)
+    statuses = check_github_statuses(repos, backend='graphql')  # GITHUB_TOKEN 필요
+"""
+
+import asyncio
+import http.client
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from github_graphql import fetch_repo_statuses
+from http_session import DEFAULT_CONCURRENCY, USER_AGENT, get_session
+from metadata_cache import MetadataCache
+from rate_limit import RateLimited, RateLimitScheduler, RetryableError
+
+API_URL = 'https://api.github.com'
+
+
+def parse_repo_status(data):
+    """/repos/{repo} 응답을 스크립트들이 쓰는 상태 dict로 변환"""
+    return {
+        'exists': True,
+        'stars': data.get('stargazers_count', 0),
+        'last_update': data.get('updated_at', ''),
+        'archived': data.get('archived', False),
+        'description': data.get('description', ''),
+        'language': data.get('language', ''),
+        'topics': data.get('topics', []),
+        'default_branch': data.get('default_branch', 'main'),
+        'full_name': data.get('full_name', ''),
+        'private': data.get('private', False),
+        'pushed_at': data.get('pushed_at', '')
+    }
+
+
+class GitHubClient:
+    """asyncio 기반 GitHub REST 클라이언트
+
+    요청은 스레드 풀에서 블로킹 http.client로 실행되고, 연결은 공용
+    HttpSession(http_session)의 연결 풀을 통해 재사용된다. 동시에 진행되는
+    요청 수는 concurrency로 제한되고, API 요청 시점은 scheduler가 조절한다.
+    cache가 있으면 API GET은 조건부 요청으로 보낸다.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, token=None, api_url=API_URL,
+                 scheduler=None, cache=None, session=None):
+        self.concurrency = concurrency
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.cache = cache
+        self.api_url = api_url.rstrip('/')
+        self.token = token if token is not None else os.environ.get('GITHUB_TOKEN')
+        self.session = session or get_session()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """스레드 풀 정리 (공용 세션의 연결은 실행이 끝날 때 정리)"""
+        self._executor.shutdown(wait=True)
+        if self.cache:
+            self.cache.prune()
+
+    def api_headers(self):
+        """GitHub API 공통 헤더"""
+        headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': 'gzip',
+            'User-Agent': USER_AGENT
+        }
+        if self.token:
+            headers['Authorization'] = f'token {self.token}'
+        return headers
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        """URL을 비동기로 요청하고 (status, headers, body)를 반환 (리다이렉트 추적)
+
+        재시도는 scheduler가 맡으므로 세션의 재시도는 쓰지 않는다.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            response = await loop.run_in_executor(
+                self._executor, lambda: self.session.request(method, url, headers, body, retries=0)
+            )
+        return response.status, response.headers, response.data
+
+    async def fetch_checked(self, url, method='GET', headers=None, scheduler=None, body=None):
+        """scheduler를 거쳐 요청. 제한이나 일시 오류는 예외로 알림
+
+        RateLimited: 할당량 초과 (scheduler가 대기 후 재시도)
+        RetryableError: 5xx 또는 네트워크 오류
+        """
+        scheduler = scheduler or self.scheduler
+        await scheduler.acquire()
+        try:
+            status, resp_headers, data = await self.fetch(url, method, headers, body)
+        except (OSError, http.client.HTTPException) as e:
+            raise RetryableError(str(e) or type(e).__name__) from e
+
+        retry_at = scheduler.observe(status, resp_headers)
+        if retry_at is not None:
+            raise RateLimited(retry_at)
+        if status >= 500:
+            raise RetryableError(f'HTTP {status}')
+        return status, resp_headers, data
+
+    async def get_json(self, url, max_age=0):
+        """API GET 후 (status, data) 반환. 캐시 항목이 304로 확인되면 캐시 본문 사용
+
+        max_age초 이내에 저장되거나 확인된 캐시 항목은 요청 없이 바로 사용한다.
+        """
+        headers = self.api_headers()
+        entry = self.cache.get(url) if self.cache else None
+        if entry and self.cache.age(entry) < max_age:
+            return 200, entry['data']
+        if entry:
+            headers.update(self.cache.conditional_headers(entry))
+
+        status, resp_headers, body = await self.fetch_checked(url, headers=headers)
+        if status == 304 and entry:
+            return 200, self.cache.revalidate(url, entry, resp_headers)
+        if status != 200:
+            return status, None
+
+        data = json.loads(body.decode('utf-8'))
+        if self.cache:
+            self.cache.store(url, resp_headers, data)
+        return status, data
+
+    async def _fetch_repo_status(self, repo):
+        status, data = await self.get_json(f'{self.api_url}/repos/{repo}')
+        if status == 404:
+            return {'exists': False}
+        if status != 200:
+            return {'exists': 'unknown', 'error': f'HTTP {status}'}
+        return parse_repo_status(data)
+
+    async def repo_status(self, repo):
+        """GitHub 저장소 상태 확인"""
+        return (await self.repo_statuses([repo]))[repo]
+
+    async def repo_statuses(self, repos):
+        """여러 저장소 상태를 동시에 확인 (repo -> 상태 dict)
+
+        할당량 초과나 일시 오류로 실패한 저장소는 다시 큐에 넣어 재시도하고,
+        끝내 실패한 경우에만 'unknown'으로 남긴다.
+        """
+        repos = list(dict.fromkeys(repos))
+        results, failures = await self.scheduler.run(
+            repos, self._fetch_repo_status, self.concurrency
+        )
+        for repo, error in failures.items():
+            results[repo] = {'exists': 'unknown', 'error': str(error)}
+        return {repo: results[repo] for repo in repos}
+
+
+def check_github_statuses(repos, concurrency=DEFAULT_CONCURRENCY, use_cache=True,
+                          backend='auto'):
+    """여러 저장소 상태를 동시에 확인 (동기 호출용)
+
+    backend:
+        'rest'    - 저장소마다 /repos/{repo} 요청. use_cache가 켜져 있으면
+                    _github_metadata_cache의 ETag로 조건부 요청을 보낸다.
+        'graphql' - 100개씩 묶어 GraphQL 요청 (토큰 필요)
+        'auto'    - 토큰이 있으면 graphql, 없으면 rest
+    """
+    # 캐시는 REST 경로에서만 쓰므로 GraphQL이면 만들지 않음 (GitHubClient와 같은 토큰 기준)
+    use_graphql = backend == 'graphql' or backend == 'auto' and bool(os.environ.get('GITHUB_TOKEN'))
+    cache = MetadataCache() if use_cache and not use_graphql else None
+
+    async def run():
+        async with GitHubClient(concurrency, cache=cache) as client:
+            if use_graphql:
+                return await fetch_repo_statuses(client, repos)
+            return await client.repo_statuses(repos)
+
+    return asyncio.run(run())
+
+
+def check_github_status(repo):
+    """GitHub 저장소 상태 확인 (기존 check_github_status 대체)"""
+    return check_github_statuses([repo], concurrency=1, backend='rest')[repo]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub GraphQL 일괄 조회 백엔드
+
+저장소마다 REST 호출을 한 번씩 하는 대신, 별칭(alias)을 붙인 GraphQL
+쿼리 하나로 최대 100개 저장소의 메타데이터를 가져온다. 결과는
+github_client.parse_repo_status와 같은 상태 dict 형식으로 돌려준다.
+
+GraphQL API는 토큰이 필요하다 (GITHUB_TOKEN).
+"""
+
+import json
+
+from rate_limit import RetryableError
+
+BATCH_SIZE = 100
+TOPICS_LIMIT = 20
+
+REPO_FIELDS = f"""
+fragment RepoFields on Repository {{
+  nameWithOwner
+  stargazerCount
+  isArchived
+  isPrivate
+  description
+  updatedAt
+  pushedAt
+  defaultBranchRef {{ name }}
+  primaryLanguage {{ name }}
+  repositoryTopics(first: {TOPICS_LIMIT}) {{ nodes {{ topic {{ name }} }} }}
+}}
+"""
+
+
+def build_query(repos):
+    """저장소 목록으로 별칭 쿼리와 변수 생성 (r0, r1, ...)"""
+    params = []
+    fields = []
+    variables = {}
+    for i, repo in enumerate(repos):
+        owner, name = repo.split('/', 1)
+        params.append(f'$o{i}: String!, $n{i}: String!')
+        fields.append(f'  r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}')
+        variables[f'o{i}'] = owner
+        variables[f'n{i}'] = name
+
+    query = (
+        f"query({', '.join(params)}) {{\n"
+        + '\n'.join(fields)
+        + '\n}\n'
+        + REPO_FIELDS
+    )
+    return query, variables
+
+
+def parse_graphql_repo(node):
+    """GraphQL Repository 노드를 상태 dict로 변환"""
+    default_branch = node.get('defaultBranchRef') or {}
+    language = node.get('primaryLanguage') or {}
+    topics = (node.get('repositoryTopics') or {}).get('nodes', [])
+    return {
+        'exists': True,
+        'stars': node.get('stargazerCount', 0),
+        'last_update': node.get('updatedAt', ''),
+        'archived': node.get('isArchived', False),
+        'description': node.get('description', ''),
+        'language': language.get('name', ''),
+        'topics': [t['topic']['name'] for t in topics],
+        'default_branch': default_branch.get('name', 'main'),
+        'full_name': node.get('nameWithOwner', ''),
+        'private': node.get('isPrivate', False),
+        'pushed_at': node.get('pushedAt', '')
+    }
+
+
+def parse_response(repos, payload):
+    """GraphQL 응답을 repo -> 상태 dict로 변환
+
+    응답에 없는 저장소는 errors의 type에 따라 삭제됨(NOT_FOUND) 또는
+    'unknown'으로 표시한다.
+    """
+    data = payload.get('data') or {}
+    errors = {}
+    for error in payload.get('errors', []):
+        path = error.get('path') or []
+        if path:
+            errors[path[0]] = error
+
+    results = {}
+    for i, repo in enumerate(repos):
+        alias = f'r{i}'
+        node = data.get(alias)
+        error = errors.get(alias)
+        if node:
+            results[repo] = parse_graphql_repo(node)
+        elif (error is None and alias in data) or (error and error.get('type') == 'NOT_FOUND'):
+            results[repo] = {'exists': False}
+        else:
+            message = error.get('message') if error else 'missing from GraphQL response'
+            results[repo] = {'exists': 'unknown', 'error': message}
+    return results
+
+
+async def fetch_batch(client, repos):
+    """저장소 한 묶음을 GraphQL 요청 한 번으로 조회"""
+    query, variables = build_query(repos)
+    headers = client.api_headers()
+    headers['Content-Type'] = 'application/json'
+    body = json.dumps({'query': query, 'variables': variables}).encode('utf-8')
+
+    status, _, data = await client.fetch_checked(
+        f'{client.api_url}/graphql', method='POST', headers=headers, body=body
+    )
+    if status != 200:
+        return {repo: {'exists': 'unknown', 'error': f'HTTP {status}'} for repo in repos}
+
+    payload = json.loads(data.decode('utf-8'))
+    if payload.get('data') is None:
+        # 쿼리 전체가 거절된 경우 (타임아웃, 노드 제한 등)
+        message = '; '.join(e.get('message', '') for e in payload.get('errors', []))
+        raise RetryableError(message or 'empty GraphQL response')
+    return parse_response(repos, payload)
+
+
+async def fetch_repo_statuses(client, repos, batch_size=BATCH_SIZE):
+    """GraphQL로 여러 저장소 상태를 batch_size개씩 묶어 조회 (repo -> 상태 dict)"""
+    repos = list(dict.fromkeys(repos))
+    batches = [tuple(repos[i:i + batch_size]) for i in range(0, len(repos), batch_size)]
+
+    results, failures = await client.scheduler.run(
+        batches, lambda batch: fetch_batch(client, batch), client.concurrency
+    )
+
+    statuses = {}
+    for batch in batches:
+        if batch in failures:
+            error = str(failures[batch])
+            statuses.update({repo: {'exists': 'unknown', 'error': error} for repo in batch})
+        else:
+            statuses.update(results[batch])
+    return {repo: statuses[repo] for repo in repos}
+
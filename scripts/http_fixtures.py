@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP 기록/재생 픽스처
+
+공용 HTTP 세션(http_session)은 HTTP_FIXTURES_URL 환경 변수가 있으면 모든 요청을
+그 주소의 로컬 대역 서버로 보낸다 (https://host/path → {대역}/https/host/path).
+이 모듈의 대역 서버는 두 가지로 동작한다.
+
+record - 받은 요청을 실제 서버로 보내고 응답(/repos API, README, 이미지 HEAD/GET)을
+         픽스처 보관소(_http_fixtures/)에 저장한 뒤 그대로 돌려준다.
+replay - 보관소의 응답만 돌려준다 (네트워크 없음). 지연(--latency, --jitter)과
+         오류(--error-rate: 503 또는 연결 끊김)를 --seed로 재현 가능하게 넣는다.
+         보관소에 없는 요청은 404와 X-Fixture-Miss 헤더로 답하고 개수를 센다.
+
+보관소는 index.json(요청 키 → 상태, 응답 헤더, 본문 SHA-256)과 본문 파일
+(<sha256>.bin)로 되어 있다. If-None-Match는 기록된 ETag와 비교해서 304로 답하므로
+캐시 재검증 경로도 재생된다.
+
+사용법:
+    # 실제 GitHub으로 한 번 실행하면서 기록
+    python3 scripts/http_fixtures.py record -- python3 scripts/update_view_libraries.py --no-cache --dry-run
+
+    # 네트워크 없이 재생 (요청마다 50ms 지연, 5% 오류)
+    python3 scripts/http_fixtures.py replay --latency 0.05 --error-rate 0.05 -- \\
+        python3 scripts/update_view_libraries.py --no-cache --dry-run
+
+    # 대역 서버만 띄우기 (다른 터미널에서 HTTP_FIXTURES_URL=http://127.0.0.1:8765 로 실행)
+    python3 scripts/http_fixtures.py serve --port 8765
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from http_session import ConnectionPool
+
+FIXTURES_DIR = '_http_fixtures'
+ERROR_KINDS = ('status', 'reset')
+
+# 저장하지 않는 응답 헤더 (연결/전송 방식, 쿠키)
+SKIPPED_HEADERS = {
+    'connection', 'keep-alive', 'transfer-encoding', 'content-encoding', 'set-cookie', 'date'
+}
+# 실제 서버로 넘기지 않는 요청 헤더 (대역 서버가 직접 처리)
+SKIPPED_REQUEST_HEADERS = {
+    'host', 'connection', 'accept-encoding', 'if-none-match', 'if-modified-since', 'content-length'
+}
+
+
+def fixture_key(method, url, range_header=None, body=None):
+    """보관소 키 (메서드, URL, Range, POST 본문 해시)"""
+    key = f'{method} {url}'
+    if range_header:
+        key += f' range={range_header}'
+    if body:
+        key += f' body={hashlib.sha256(body).hexdigest()[:16]}'
+    return key
+
+
+class FixtureArchive:
+    """요청 키 → 응답 보관소 (스레드 안전)"""
+
+    def __init__(self, archive_dir=FIXTURES_DIR):
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, 'index.json')
+        self._lock = threading.Lock()
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.responses = json.load(f)
+        except (OSError, ValueError):
+            self.responses = {}
+
+    def _blob_path(self, digest):
+        return os.path.join(self.archive_dir, f'{digest}.bin')
+
+    def get(self, key):
+        """(status, headers, body) 또는 None"""
+        with self._lock:
+            entry = self.responses.get(key)
+        if entry is None:
+            return None
+        body = b''
+        if entry['body']:
+            with open(self._blob_path(entry['body']), 'rb') as f:
+                body = f.read()
+        return entry['status'], entry['headers'], body
+
+    def put(self, key, status, headers, body):
+        digest = None
+        if body:
+            digest = hashlib.sha256(body).hexdigest()
+            path = self._blob_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(self.archive_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.archive_dir, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(body)
+                os.replace(tmp_path, path)
+        with self._lock:
+            self.responses[key] = {'status': status, 'headers': headers, 'body': digest}
+
+    def save(self):
+        """index.json 저장 (임시 파일 후 이름 변경)"""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        with self._lock:
+            payload = json.dumps(self.responses, indent=2, sort_keys=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.archive_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.index_path)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """{대역}/{scheme}/{host}/{path} 요청을 보관소(또는 실제 서버)로 처리"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _target_url(self):
+        scheme, _, rest = self.path.lstrip('/').partition('/')
+        return f'{scheme}://{rest}'
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        url = self._target_url()
+        key = fixture_key(self.command, url, self.headers.get('Range'), body)
+
+        error = server.inject(key)
+        if error == 'reset':
+            # 응답 없이 연결 끊기 (클라이언트에서는 RemoteDisconnected)
+            self.close_connection = True
+            return
+        if error == 'status':
+            self._send(503, [['Retry-After', '0']], b'')
+            return
+
+        if server.mode == 'record':
+            response = server.record(self.command, url, self.headers, body, key)
+        else:
+            response = server.archive.get(key)
+            if response is None and self.command == 'HEAD':
+                response = server.archive.get(fixture_key('GET', url, self.headers.get('Range')))
+        if response is None:
+            server.count('misses')
+            self._send(404, [['X-Fixture-Miss', key]], b'')
+            return
+
+        status, headers, data = response
+        etag = next((value for name, value in headers if name.lower() == 'etag'), None)
+        if status == 200 and etag and self.headers.get('If-None-Match') == etag:
+            status, data = 304, b''
+        server.count('served')
+        self._send(status, headers, data)
+
+    def _send(self, status, headers, data):
+        self.send_response(status)
+        recorded_length = None
+        for name, value in headers:
+            if name.lower() == 'content-length':
+                recorded_length = value
+                continue
+            self.send_header(name, value)
+        # HEAD는 기록된 본문 크기를, 그 외에는 실제로 보내는 본문 크기를 알림
+        if self.command == 'HEAD' and recorded_length is not None:
+            self.send_header('Content-Length', recorded_length)
+        else:
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if self.command != 'HEAD' and status != 304:
+            self.wfile.write(data)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """기록/재생 대역 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, archive, mode='replay', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, errors=ERROR_KINDS, seed=0):
+        super().__init__(('127.0.0.1', port), FixtureHandler)
+        self.archive = archive
+        self.mode = mode
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.errors = tuple(errors)
+        self.seed = seed
+        self.stats = {'served': 0, 'recorded': 0, 'misses': 0, 'injected': 0}
+        self._attempts = {}
+        self._lock = threading.Lock()
+        self._upstream = ConnectionPool()
+        self._thread = None
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def inject(self, key):
+        """지연을 넣고, 오류를 넣을 요청이면 오류 종류 반환
+
+        같은 키의 n번째 요청은 seed가 같으면 항상 같은 지연과 오류를 받는다.
+        """
+        with self._lock:
+            attempt = self._attempts[key] = self._attempts.get(key, 0) + 1
+        rng = random.Random(f'{self.seed}:{key}:{attempt}')
+        delay = self.latency + rng.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        if self.error_rate and rng.random() < self.error_rate:
+            self.count('injected')
+            return rng.choice(self.errors)
+        return None
+
+    def record(self, method, url, request_headers, body, key):
+        """실제 서버로 보내고 응답을 보관소에 저장 (네트워크 오류면 None)"""
+        headers = {name: value for name, value in request_headers.items()
+                   if name.lower() not in SKIPPED_REQUEST_HEADERS}
+        headers['Accept-Encoding'] = 'identity'
+        try:
+            status, resp_headers, data = self._upstream.request(method, url, headers, body)
+        except Exception:
+            return None
+        kept = [[name, value] for name, value in resp_headers.items()
+                if name.lower() not in SKIPPED_HEADERS]
+        self.archive.put(key, status, kept, data)
+        self.count('recorded')
+        return status, kept, data
+
+    def start(self):
+        """백그라운드 스레드에서 요청 처리 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """서버 종료 (기록 모드면 보관소 저장)"""
+        self.shutdown()
+        self.server_close()
+        self._upstream.close()
+        if self.mode == 'record':
+            self.archive.save()
+
+
+def run_command(server, command):
+    """HTTP_FIXTURES_URL을 대역 서버로 두고 명령 실행 (종료 코드, 걸린 시간)"""
+    env = dict(os.environ, HTTP_FIXTURES_URL=server.url)
+    start = time.perf_counter()
+    returncode = subprocess.call(command, env=env)
+    return returncode, time.perf_counter() - start
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='HTTP 응답 기록/재생 대역 서버',
+                                     usage='%(prog)s {record,replay,serve} [옵션] [-- 명령 ...]')
+    parser.add_argument('mode', choices=('record', 'replay', 'serve'),
+                        help='record: 기록하며 실행, replay: 재생하며 실행, serve: 재생 서버만 실행')
+    parser.add_argument('--archive', default=FIXTURES_DIR, help='픽스처 보관소 디렉토리')
+    parser.add_argument('--port', type=int, default=0, help='대역 서버 포트 (기본: 빈 포트)')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답마다 넣을 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연에 더할 최대 무작위 시간 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류를 넣을 요청 비율 (0~1)')
+    parser.add_argument('--errors', default=','.join(ERROR_KINDS),
+                        help='넣을 오류 종류 (status: 503, reset: 연결 끊김)')
+    parser.add_argument('--seed', type=int, default=0, help='지연/오류 재현용 시드')
+    parser.add_argument('--strict', action='store_true', help='재생 중 보관소에 없는 요청이 있으면 실패')
+    # -- 뒤는 실행할 명령 (argparse에 넘기지 않음)
+    argv, command = sys.argv[1:], []
+    if '--' in argv:
+        split = argv.index('--')
+        argv, command = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    if args.mode != 'serve' and not command:
+        parser.error('-- 뒤에 실행할 명령이 필요합니다')
+    errors = [kind for kind in args.errors.split(',') if kind in ERROR_KINDS] or ERROR_KINDS
+
+    archive = FixtureArchive(args.archive)
+    mode = 'record' if args.mode == 'record' else 'replay'
+    if mode == 'replay' and not archive.responses:
+        print(f"⚠️  {args.archive}에 기록된 응답이 없습니다 (record로 먼저 기록)")
+        sys.exit(1)
+
+    server = FixtureServer(archive, mode, args.port, args.latency, args.jitter,
+                           args.error_rate, errors, args.seed).start()
+    print(f"🎞️  {mode} 대역 서버: {server.url} (응답 {len(archive.responses)}개)")
+
+    if args.mode == 'serve':
+        print(f"  HTTP_FIXTURES_URL={server.url} 로 스크립트를 실행하세요 (Ctrl+C로 종료)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        returncode, elapsed = 0, None
+    else:
+        returncode, elapsed = run_command(server, command)
+    server.close()
+
+    stats = server.stats
+    print(f"\n🎞️  응답 {stats['served']}개, 기록 {stats['recorded']}개, "
+          f"없는 응답 {stats['misses']}개, 넣은 오류 {stats['injected']}개")
+    if elapsed is not None:
+        print(f"  ⏱️  {elapsed:.2f}초")
+    if args.strict and stats['misses']:
+        returncode = returncode or 1
+    sys.exit(returncode)
+
+
+if __name__ == "__main__":
+    main()
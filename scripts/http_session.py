@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+공용 HTTP 세션
+
+GitHub API 클라이언트, README 저장소, 이미지 HEAD 확인, 이미지 다운로더가
+각자 만들던 연결 풀을 하나로 모은다. 같은 호스트(raw.githubusercontent.com 등)에
+보내는 요청은 스크립트 안의 어느 단계에서 보내든 keep-alive 연결을 재사용하므로
+TCP/TLS 연결은 호스트마다 동시 요청 수만큼만 생긴다.
+
+- 호스트별 keep-alive 연결 풀 (ConnectionPool)
+- 공통 User-Agent, gzip, 시간 제한 (DEFAULT_TIMEOUT)
+- 리다이렉트 추적
+- 네트워크 오류와 429/5xx는 지터를 넣은 지수 백오프로 재시도
+  (429/503의 Retry-After가 있으면 그만큼 대기)
+- HTTP_FIXTURES_URL이 있으면 모든 요청을 그 주소의 대역 서버로 보냄
+  (http_fixtures의 기록/재생 서버, https://host/path → {대역}/https/host/path)
+
+사용법:
+    from http_session import get_session
+
+    response = get_session().request('GET', url)
+    response.status, response.headers, response.data, response.url
+"""
+
+import atexit
+import gzip
+import http.client
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from urllib.parse import urljoin, urlsplit
+
+from rate_limit import backoff_delay, parse_retry_after
+
+USER_AGENT = 'AndroidUICollection/1.0'
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 10
+MAX_REDIRECTS = 3
+MAX_RETRIES = 2
+MAX_RETRY_DELAY = 30
+MAX_IDLE_PER_HOST = 16
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 재사용한 keep-alive 연결이 서버 쪽에서 끊겼을 때 한 번 더 시도할 예외
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+HttpResponse = namedtuple('HttpResponse', ['status', 'headers', 'data', 'url'])
+
+
+def stand_in_url(stand_in, url):
+    """대역 서버로 보낼 주소 (https://host/path?q → {stand_in}/https/host/path?q)"""
+    scheme, _, rest = url.partition('://')
+    return f'{stand_in}/{scheme}/{rest}'
+
+
+class ConnectionPool:
+    """호스트별 keep-alive 연결 풀 (스레드 안전)"""
+
+    def __init__(self, size=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT, stand_in=None):
+        self.size = size
+        self.timeout = timeout
+        self.stand_in = stand_in.rstrip('/') if stand_in else None
+        self.requests = 0
+        self.opened = 0
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, scheme, netloc):
+        with self._lock:
+            self.requests += 1
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+            self.opened += 1
+
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _release(self, scheme, netloc, conn):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.size:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _open(self, method, url, headers, body):
+        if self.stand_in:
+            url = stand_in_url(self.stand_in, url)
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        for attempt in range(2):
+            conn = self._acquire(parts.scheme, parts.netloc)
+            reused = conn.sock is not None
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                return parts, conn, conn.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+    @contextmanager
+    def stream(self, method, url, headers=None, body=None):
+        """본문을 직접 나눠 읽을 수 있도록 response를 넘겨주는 요청
+
+        본문을 끝까지 읽은 연결만 풀로 돌려보내고, 중간에 멈춘 연결은 닫는다.
+        """
+        parts, conn, response = self._open(method, url, headers, body)
+        try:
+            yield response
+        except BaseException:
+            conn.close()
+            raise
+
+        if response.isclosed() and not response.will_close:
+            self._release(parts.scheme, parts.netloc, conn)
+        else:
+            conn.close()
+
+    def request(self, method, url, headers=None, body=None):
+        """요청을 보내고 (status, headers, body)를 반환"""
+        with self.stream(method, url, headers, body) as response:
+            data = response.read()
+
+        if data and response.getheader('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return response.status, response.msg, data
+
+    def close(self):
+        """유휴 연결 모두 닫기"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class HttpSession:
+    """공통 헤더, 리다이렉트, 재시도를 더한 연결 풀 (스레드 안전)"""
+
+    def __init__(self, pool_size=MAX_IDLE_PER_HOST, timeout=DEFAULT_TIMEOUT, retries=MAX_RETRIES,
+                 sleep=time.sleep, clock=time.time, stand_in=None):
+        self.pool = ConnectionPool(pool_size, timeout, stand_in)
+        self.retries = retries
+        self.sleep = sleep
+        self.clock = clock
+        self.retried = 0
+        self._lock = threading.Lock()
+
+    def _send(self, method, url, headers, body, follow_redirects):
+        for _ in range(MAX_REDIRECTS + 1):
+            status, resp_headers, data = self.pool.request(method, url, headers, body)
+            location = resp_headers.get('Location')
+            if not follow_redirects or status not in REDIRECT_STATUSES or not location:
+                break
+            url = urljoin(url, location)
+        return HttpResponse(status, resp_headers, data, url)
+
+    def _retry_delay(self, attempt, response=None):
+        if response is not None and response.headers.get('Retry-After'):
+            retry_at = parse_retry_after(response.headers['Retry-After'], self.clock())
+            if retry_at is not None:
+                return min(max(retry_at - self.clock(), 0), MAX_RETRY_DELAY)
+        return min(backoff_delay(attempt), MAX_RETRY_DELAY)
+
+    def request(self, method, url, headers=None, body=None, follow_redirects=True, retries=None):
+        """요청을 보내고 HttpResponse(status, headers, data, 최종 url) 반환
+
+        네트워크 오류와 RETRY_STATUSES 응답은 retries번까지 다시 시도한다.
+        마지막 시도도 실패하면 예외를 그대로 던지거나 마지막 응답을 반환한다.
+        """
+        retries = self.retries if retries is None else retries
+        headers = dict({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'}, **(headers or {}))
+
+        for attempt in range(1, retries + 2):
+            try:
+                response = self._send(method, url, headers, body, follow_redirects)
+            except (OSError, http.client.HTTPException):
+                if attempt > retries:
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if response.status not in RETRY_STATUSES or attempt > retries:
+                    return response
+                delay = self._retry_delay(attempt, response)
+
+            with self._lock:
+                self.retried += 1
+            self.sleep(delay)
+
+    @contextmanager
+    def stream(self, method, url, headers=None, body=None):
+        """본문을 직접 읽는 요청 (리다이렉트와 재시도는 호출하는 쪽에서)"""
+        headers = dict({'User-Agent': USER_AGENT}, **(headers or {}))
+        with self.pool.stream(method, url, headers, body) as response:
+            yield response
+
+    def stats(self):
+        """지금까지의 요청 수, 새로 연 연결 수, 재시도 수"""
+        return {'requests': self.pool.requests, 'connections': self.pool.opened, 'retries': self.retried}
+
+    def close(self):
+        """유휴 연결 정리"""
+        self.pool.close()
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """실행 중 한 번만 만들어지는 공용 세션 (종료할 때 연결 정리)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = HttpSession(stand_in=os.environ.get('HTTP_FIXTURES_URL'))
+            atexit.register(_session.close)
+        return _session
+
+
+def print_session_stats():
+    """공용 세션의 요청/연결 수 출력 (요청이 없었으면 출력하지 않음)"""
+    stats = get_session().stats()
+    if stats['requests']:
+        print(f"🔌 HTTP 요청 {stats['requests']}개, 새 연결 {stats['connections']}개, "
+              f"재시도 {stats['retries']}개")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+스트리밍 이미지 다운로더
+
+download_images.py, check_missing_images.py, batch_add_compose_libraries.py의
+download_image를 대체한다. 파일 전체를 메모리에 올리지 않고 청크 단위로
+임시 파일(.part)에 쓴 뒤 이름을 바꿔서, 중간에 실패해도 잘린 파일이나
+HTML 오류 페이지가 이미지 이름으로 남지 않는다.
+
+- Content-Type과 파일 시그니처를 쓰기 전에 확인
+- 최대 크기 제한 (Content-Length와 실제 수신량 모두)
+- 끊긴 전송은 Range 요청으로 이어받기 (If-Range로 원본 변경 확인)
+"""
+
+import http.client
+import json
+import os
+import time
+from urllib.parse import urljoin
+
+from http_session import MAX_REDIRECTS, REDIRECT_STATUSES, RETRY_STATUSES, get_session
+from rate_limit import backoff_delay
+
+MAX_IMAGE_SIZE = 20 * 1024 * 1024  # 20MB
+CHUNK_SIZE = 64 * 1024
+RESUME_ATTEMPTS = 3
+
+# Content-Type이 image/*가 아니어도 시그니처로 판별해서 받는 경우
+GENERIC_CONTENT_TYPES = ('application/octet-stream', 'binary/octet-stream')
+
+
+class DownloadError(Exception):
+    """이미지로 저장하면 안 되는 응답"""
+
+
+class ResumeRejected(DownloadError):
+    """이어받기 요청이 받아들여지지 않음 (.part를 버리고 처음부터)"""
+
+
+class TransientStatus(http.client.HTTPException):
+    """429/5xx 응답 (잠시 뒤 다시 시도)"""
+
+
+def sniff_image_type(head):
+    """파일 앞부분으로 이미지 형식 판별 (gif/png/jpg/webp, 모르면 None)"""
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if head[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'png'
+    if head[:3] == b'\xff\xd8\xff':
+        return 'jpg'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def _read_head(path, size=12):
+    with open(path, 'rb') as f:
+        return f.read(size)
+
+
+def _discard(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _load_resume_state(part_path, meta_path, url):
+    """이어받을 .part 파일의 크기와 검증 헤더"""
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        offset = os.path.getsize(part_path)
+    except (OSError, ValueError):
+        return 0, None
+    if meta.get('url') != url:
+        return 0, None
+    return offset, meta.get('etag') or meta.get('last_modified')
+
+
+def _check_content_type(response):
+    content_type = (response.getheader('Content-Type') or '').split(';')[0].strip().lower()
+    if content_type and not content_type.startswith('image/') and content_type not in GENERIC_CONTENT_TYPES:
+        raise DownloadError(f'이미지가 아님 (Content-Type: {content_type})')
+
+
+def _transfer(url, part_path, meta_path, max_size):
+    """한 번의 요청으로 .part 파일 채우기 (이어받기 포함)"""
+    source_url = url
+    offset, validator = _load_resume_state(part_path, meta_path, source_url)
+    headers = {}
+    if offset:
+        headers['Range'] = f'bytes={offset}-'
+        if validator:
+            headers['If-Range'] = validator
+
+    for _ in range(MAX_REDIRECTS + 1):
+        with get_session().stream('GET', url, headers) as response:
+            location = response.getheader('Location')
+            if response.status in REDIRECT_STATUSES and location:
+                response.read()
+                url = urljoin(url, location)
+                continue
+
+            if response.status == 416:
+                # .part가 이미 완성됐거나 원본과 맞지 않음
+                response.read()
+                raise ResumeRejected('Range 요청 거절')
+            if response.status == 206:
+                content_range = response.getheader('Content-Range', '')
+                if not content_range.startswith(f'bytes {offset}-'):
+                    raise ResumeRejected(f'예상과 다른 Content-Range: {content_range}')
+            elif response.status == 200:
+                offset = 0
+            elif response.status in RETRY_STATUSES:
+                response.read()
+                raise TransientStatus(f'HTTP {response.status}')
+            else:
+                raise DownloadError(f'HTTP {response.status}')
+
+            _check_content_type(response)
+
+            length = response.getheader('Content-Length')
+            if length is not None and offset + int(length) > max_size:
+                raise DownloadError(f'최대 크기 초과 ({(offset + int(length)) / 1024 / 1024:.1f}MB)')
+
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': source_url,
+                    'etag': response.getheader('ETag'),
+                    'last_modified': response.getheader('Last-Modified')
+                }, f)
+
+            received = offset
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                while True:
+                    chunk = response.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if received == 0 and sniff_image_type(chunk) is None:
+                        raise DownloadError('이미지 시그니처가 아님')
+                    received += len(chunk)
+                    if received > max_size:
+                        raise DownloadError(f'최대 크기 초과 ({max_size / 1024 / 1024:.0f}MB)')
+                    f.write(chunk)
+
+            # read(amt)는 연결이 일찍 끊겨도 예외 없이 빈 값을 돌려준다
+            if length is not None and received < offset + int(length):
+                raise http.client.IncompleteRead(b'', offset + int(length) - received)
+            return received
+
+    raise DownloadError('리다이렉트가 너무 많음')
+
+
+def fetch_to_file(url, save_path, max_size=MAX_IMAGE_SIZE):
+    """이미지를 save_path에 원자적으로 저장하고 실제 형식(gif/png/...) 반환
+
+    전송 중 연결이 끊기거나 429/5xx를 받으면 RESUME_ATTEMPTS번까지 이어받는다.
+    실패하면 DownloadError 또는 OSError를 던진다.
+    """
+    part_path = save_path + '.part'
+    meta_path = part_path + '.json'
+
+    for attempt in range(1, RESUME_ATTEMPTS + 1):
+        try:
+            _transfer(url, part_path, meta_path, max_size)
+            break
+        except ResumeRejected:
+            _discard(part_path, meta_path)
+            if attempt == RESUME_ATTEMPTS:
+                raise
+        except DownloadError:
+            _discard(part_path, meta_path)
+            raise
+        except (OSError, http.client.HTTPException):
+            # .part와 메타 파일을 남겨 두고 다음 시도에서 이어받기
+            if attempt == RESUME_ATTEMPTS:
+                raise
+            time.sleep(backoff_delay(attempt))
+
+    image_type = sniff_image_type(_read_head(part_path))
+    if image_type is None:
+        _discard(part_path, meta_path)
+        raise DownloadError('이미지 시그니처가 아님')
+
+    os.replace(part_path, save_path)
+    os.remove(meta_path)
+    return image_type
+
+
+def download_image(url, save_path, max_size=MAX_IMAGE_SIZE):
+    """이미지 다운로드 (성공 여부 반환)"""
+    try:
+        fetch_to_file(url, save_path, max_size)
+        return True
+    except (DownloadError, OSError, http.client.HTTPException) as e:
+        print(f"    다운로드 실패: {e}")
+        return False
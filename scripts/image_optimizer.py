@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+데모 이미지 최적화 (선택 단계)
+
+download_image 이후, 또는 images/posts 전체에 대해 실행한다.
+Pillow가 필요하며 (pip install Pillow), gifsicle이 설치되어 있으면
+GIF 재압축에 함께 사용한다.
+
+- PNG: 무손실 재압축 (optimize)
+- GIF: gifsicle 무손실 재압축 (-O3, gifsicle이 없으면 그대로 둠)
+- 첫 프레임으로 정지 포스터 이미지 생성 (images/posters/{이름}.jpg, 최대 너비 MAX_WIDTH)
+- 결과가 원본보다 작을 때만 교체
+- 처리 결과와 SHA-256을 _data/image_optimization.json에 기록해서
+  이미 최적화한 이미지는 다시 처리하지 않음
+
+원본은 포스트 페이지에서 그대로 보여 주므로 크기, 프레임, 화질을 바꾸지 않는다.
+너비와 프레임 속도 제한(MAX_WIDTH, MAX_FPS)은 포스터와 카드 썸네일
+(generate_thumbnails, frame_plan)에만 적용한다.
+
+보고서(image_optimization_report.md)와 기록(_data/image_optimization.json)은
+실행한 컴퓨터의 상태이므로 저장소에 넣지 않는다 (.gitignore).
+
+사용법:
+    python3 scripts/image_optimizer.py            # images/posts 전체
+    python3 scripts/image_optimizer.py --dry-run  # 교체하지 않고 절감량만 계산
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:
+    Image = None
+
+from image_store import IMAGE_EXTENSIONS, IMAGES_DIR, file_sha256
+
+POSTERS_DIR = 'images/posters'
+STATE_PATH = '_data/image_optimization.json'
+REPORT_PATH = 'image_optimization_report.md'
+
+MAX_WIDTH = 800
+MAX_FPS = 25
+POSTER_QUALITY = 85
+# 브라우저는 10ms 이하로 적힌 GIF 프레임을 100ms로 보여 준다
+MIN_FRAME_DURATION = 10
+DEFAULT_FRAME_DURATION = 100
+
+
+def pillow_available():
+    """Pillow 설치 여부"""
+    return Image is not None
+
+
+def _replace_if_smaller(path, tmp_path, dry_run=False):
+    """tmp_path가 더 작으면 path를 교체하고 최종 크기 반환"""
+    before = os.path.getsize(path)
+    after = os.path.getsize(tmp_path)
+    if after >= before:
+        os.remove(tmp_path)
+        return before
+    if dry_run:
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, path)
+    return after
+
+
+def frame_duration(frame):
+    """프레임 표시 시간 (ms, 브라우저처럼 10ms 이하는 100ms로)"""
+    duration = frame.info.get('duration') or 0
+    return DEFAULT_FRAME_DURATION if duration <= MIN_FRAME_DURATION else duration
+
+
+def frame_plan(image, max_fps=MAX_FPS):
+    """썸네일에 쓸 (원본 프레임 번호 목록, 프레임별 표시 시간) (max_fps를 넘는 프레임은 합침)
+
+    합친 프레임의 시간은 직전 프레임에 더하므로 전체 재생 시간은 그대로다.
+    """
+    min_duration = 1000 / max_fps
+    indices = []
+    durations = []
+    for index, frame in enumerate(ImageSequence.Iterator(image)):
+        duration = frame_duration(frame)
+        if indices and durations[-1] < min_duration:
+            # 직전 프레임이 너무 짧으면 이번 프레임을 건너뛰고 시간을 합친다
+            durations[-1] += duration
+            continue
+        indices.append(index)
+        durations.append(duration)
+    return indices, durations
+
+
+def optimize_gif(path, dry_run=False):
+    """GIF 무손실 재압축 (gifsicle -O3), 최종 크기 반환 (gifsicle이 없으면 그대로)"""
+    gifsicle = shutil.which('gifsicle')
+    if not gifsicle:
+        return os.path.getsize(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.gif')
+    os.close(fd)
+    subprocess.run([gifsicle, '-O3', path, '-o', tmp_path], check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return _replace_if_smaller(path, tmp_path, dry_run)
+
+
+def optimize_png(path, dry_run=False):
+    """PNG 무손실 재압축, 최종 크기 반환"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.png')
+    os.close(fd)
+    with Image.open(path) as image:
+        image.save(tmp_path, optimize=True)
+    return _replace_if_smaller(path, tmp_path, dry_run)
+
+
+def make_poster(path, posters_dir=POSTERS_DIR, width=MAX_WIDTH):
+    """첫 프레임을 흰 배경 JPEG로 저장하고 경로 반환"""
+    os.makedirs(posters_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(path))[0]
+    poster_path = os.path.join(posters_dir, f'{name}.jpg')
+    with Image.open(path) as image:
+        frame = image.convert('RGBA')
+        if frame.width > width:
+            frame = frame.resize((width, round(frame.height * width / frame.width)), Image.LANCZOS)
+        background = Image.new('RGB', frame.size, (255, 255, 255))
+        background.paste(frame, mask=frame.getchannel('A'))
+        background.save(poster_path, 'JPEG', quality=POSTER_QUALITY, optimize=True, progressive=True)
+    return poster_path
+
+
+class ImageOptimizer:
+    """최적화 결과(이전/이후 바이트, 최적화 후 해시)를 기록하는 최적화 단계"""
+
+    def __init__(self, images_dir=IMAGES_DIR, state_path=STATE_PATH, dry_run=False):
+        if not pillow_available():
+            raise RuntimeError('Pillow가 필요합니다 (pip install Pillow)')
+        self.images_dir = images_dir
+        self.state_path = state_path
+        self.dry_run = dry_run
+        self._lock = threading.Lock()
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                self.images = json.load(f).get('images', {})
+        except (OSError, ValueError):
+            self.images = {}
+
+    def optimize(self, name):
+        """이미지 하나 최적화 후 기록 반환 (이미 최적화된 파일이면 None)"""
+        path = os.path.join(self.images_dir, name)
+        digest = file_sha256(path)
+        with self._lock:
+            entry = self.images.get(name)
+        if entry and entry['sha256'] == digest:
+            return None
+
+        before = os.path.getsize(path)
+        ext = name.rsplit('.', 1)[-1].lower()
+        if ext == 'gif':
+            after = optimize_gif(path, self.dry_run)
+        elif ext == 'png':
+            after = optimize_png(path, self.dry_run)
+        else:
+            after = before
+        poster = make_poster(path) if not self.dry_run else None
+
+        entry = {
+            'sha256': file_sha256(path) if after != before and not self.dry_run else digest,
+            'before': before,
+            'after': after,
+            'poster': '/' + poster if poster else None
+        }
+        with self._lock:
+            self.images[name] = entry
+        return entry
+
+    def totals(self):
+        """기록된 전체 이전/이후 바이트"""
+        before = sum(entry['before'] for entry in self.images.values())
+        after = sum(entry['after'] for entry in self.images.values())
+        return before, after
+
+    def save(self):
+        """기록 저장 (임시 파일 후 이름 변경)"""
+        if self.dry_run:
+            return
+        with self._lock:
+            directory = os.path.dirname(self.state_path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'images': self.images}, f, indent=2, sort_keys=True)
+                f.write('\n')
+            os.replace(tmp_path, self.state_path)
+
+    def write_report(self, report_path=REPORT_PATH):
+        """이미지별 절감량 보고서(Markdown) 작성"""
+        before, after = self.totals()
+        rows = sorted(self.images.items(), key=lambda item: item[1]['after'] - item[1]['before'])
+        lines = [
+            '# 이미지 최적화 보고서',
+            '',
+            f'- 이미지: {len(self.images)}개',
+            f'- 최적화 전: {before / 1024 / 1024:.1f}MB',
+            f'- 최적화 후: {after / 1024 / 1024:.1f}MB',
+            f'- 절감: {(before - after) / 1024 / 1024:.1f}MB ({(before - after) / max(before, 1) * 100:.0f}%)',
+            '',
+            '| 이미지 | 이전 | 이후 | 절감 |',
+            '|---|---:|---:|---:|'
+        ]
+        for name, entry in rows:
+            saved = entry['before'] - entry['after']
+            lines.append(f"| {name} | {entry['before'] / 1024:.0f}KB | {entry['after'] / 1024:.0f}KB "
+                         f"| {saved / 1024:.0f}KB |")
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='images/posts 데모 이미지 최적화')
+    parser.add_argument('names', nargs='*', help='최적화할 이미지 이름 (기본: 전체)')
+    parser.add_argument('--dry-run', action='store_true', help='교체하지 않고 절감량만 계산')
+    parser.add_argument('--report', default=REPORT_PATH, help='보고서 경로')
+    args = parser.parse_args()
+
+    if not pillow_available():
+        print("❌ Pillow가 필요합니다: pip install Pillow")
+        return
+
+    optimizer = ImageOptimizer(dry_run=args.dry_run)
+    names = args.names or sorted(
+        name for name in os.listdir(IMAGES_DIR) if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+    skipped = 0
+    for i, name in enumerate(names, 1):
+        try:
+            entry = optimizer.optimize(name)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"[{i}/{len(names)}] {name}: ⚠️  실패 ({e})")
+            continue
+        if entry is None:
+            skipped += 1
+            continue
+        print(f"[{i}/{len(names)}] {name}: {entry['before'] / 1024:.0f}KB → {entry['after'] / 1024:.0f}KB")
+
+    optimizer.save()
+    optimizer.write_report(args.report)
+
+    before, after = optimizer.totals()
+    print(f"\n✅ 완료! 건너뜀(이미 최적화됨): {skipped}개")
+    print(f"  📉 {before / 1024 / 1024:.1f}MB → {after / 1024 / 1024:.1f}MB")
+    print(f"  📋 보고서: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 후보 HEAD 확인
+
+readme_images가 고른 후보를 받기 전에 HEAD 요청을 동시에 보내서
+Content-Length와 Content-Type을 모으고, 배지(SVG, 아주 작은 파일),
+이미지가 아닌 응답, MAX_IMAGE_SIZE를 넘는 파일을 뺀 뒤
+순위가 가장 높은 후보를 고른다. 본문은 한 바이트도 받지 않는다.
+
+HEAD를 받지 않는 서버(403/405/501)에는 Range: bytes=0-0 GET으로
+Content-Range의 전체 크기를 얻는다. 연결은 공용 HTTP 세션에서 호스트별로
+재사용하므로 README를 받은 연결이 그대로 이미지 확인에도 쓰인다.
+
+사용법:
+    from image_probe import select_image
+
+    image, probe = select_image(readme_images(repo))
+    if image:
+        download_image(image.url, f'images/posts/{name}.{image.ext}')
+"""
+
+import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from http_session import DEFAULT_CONCURRENCY, get_session
+from image_downloader import GENERIC_CONTENT_TYPES, MAX_IMAGE_SIZE
+from readme_images import readme_images
+
+MAX_PROBES = 8  # 저장소마다 확인할 상위 후보 수
+MIN_IMAGE_BYTES = 2 * 1024  # 이보다 작으면 배지나 아이콘으로 봄
+HEAD_UNSUPPORTED = (403, 405, 501)
+
+CONTENT_TYPE_EXTENSIONS = {
+    'image/gif': 'gif',
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+    'image/webp': 'webp'
+}
+
+ImageProbe = namedtuple('ImageProbe', ['url', 'status', 'content_type', 'size', 'error'])
+
+
+def _total_size(status, headers):
+    """응답 헤더의 전체 크기 (206이면 Content-Range의 /뒤, 모르면 None)"""
+    if status == 206:
+        total = (headers.get('Content-Range') or '').rpartition('/')[2]
+        return int(total) if total.isdigit() else None
+    length = headers.get('Content-Length')
+    return int(length) if length and length.isdigit() else None
+
+
+def probe_image(url, session=None):
+    """HEAD(안 되면 1바이트 GET)로 최종 URL, 상태, Content-Type, 크기 확인"""
+    session = session or get_session()
+    try:
+        response = session.request('HEAD', url)
+        if response.status in HEAD_UNSUPPORTED:
+            response = session.request('GET', url, {'Range': 'bytes=0-0'})
+    except Exception as e:
+        return ImageProbe(url, None, None, None, str(e) or type(e).__name__)
+    content_type = (response.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+    return ImageProbe(response.url, response.status, content_type,
+                      _total_size(response.status, response.headers), None)
+
+
+def probe_images(urls, concurrency=DEFAULT_CONCURRENCY, session=None):
+    """여러 URL을 동시에 확인 (url -> ImageProbe)"""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+        return dict(zip(urls, executor.map(lambda url: probe_image(url, session), urls)))
+
+
+def rejection_reason(probe, max_size=MAX_IMAGE_SIZE, min_size=MIN_IMAGE_BYTES):
+    """후보로 쓸 수 없는 이유 (쓸 수 있으면 None)"""
+    if probe.error:
+        return f'요청 실패 ({probe.error})'
+    if probe.status not in (200, 206):
+        return f'HTTP {probe.status}'
+    if probe.content_type == 'image/svg+xml':
+        return 'SVG (배지)'
+    if probe.content_type and not probe.content_type.startswith('image/') \
+            and probe.content_type not in GENERIC_CONTENT_TYPES:
+        return f'이미지가 아님 ({probe.content_type})'
+    if probe.size is not None and probe.size > max_size:
+        return f'최대 크기 초과 ({format_size(probe.size)})'
+    if probe.size is not None and probe.size < min_size:
+        return f'너무 작음 ({format_size(probe.size)}, 배지/아이콘)'
+    return None
+
+
+def format_size(size):
+    """사람이 읽기 쉬운 크기 (모르면 '크기 모름')"""
+    if size is None:
+        return '크기 모름'
+    if size >= 1024 * 1024:
+        return f'{size / 1024 / 1024:.1f}MB'
+    return f'{size / 1024:.0f}KB'
+
+
+def choose_image(candidates, probes, max_size=MAX_IMAGE_SIZE, min_size=MIN_IMAGE_BYTES):
+    """확인 결과로 쓸 수 있는 첫 후보와 그 확인 결과 반환 (없으면 (None, None))
+
+    확장자는 Content-Type이 가리키는 실제 형식으로 맞춘다.
+    """
+    for candidate in candidates:
+        probe = probes.get(candidate.url)
+        if probe is None:
+            continue
+        if rejection_reason(probe, max_size, min_size):
+            continue
+        ext = CONTENT_TYPE_EXTENSIONS.get(probe.content_type)
+        if ext and ext != candidate.ext and not (ext == 'jpg' and candidate.ext == 'jpeg'):
+            candidate = candidate._replace(ext=ext)
+        return candidate, probe
+    return None, None
+
+
+def select_image(candidates, max_size=MAX_IMAGE_SIZE, min_size=MIN_IMAGE_BYTES, limit=MAX_PROBES):
+    """상위 limit개 후보를 동시에 확인해서 쓸 수 있는 첫 후보 고르기
+
+    candidates: readme_images/extract_images의 순위순 ImageCandidate 목록
+    """
+    candidates = candidates[:limit]
+    probes = probe_images(candidate.url for candidate in candidates)
+    return choose_image(candidates, probes, max_size, min_size)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='README 이미지 후보 HEAD 확인')
+    parser.add_argument('repos', nargs='+', help='owner/repo')
+    parser.add_argument('--limit', type=int, default=MAX_PROBES, help='확인할 상위 후보 수')
+    args = parser.parse_args()
+
+    for repo in args.repos:
+        candidates = readme_images(repo)[:args.limit]
+        probes = probe_images(candidate.url for candidate in candidates)
+        print(f"🖼️  {repo}: 후보 {len(candidates)}개")
+        for candidate in candidates:
+            probe = probes[candidate.url]
+            reason = rejection_reason(probe)
+            mark = f"❌ {reason}" if reason else f"✅ {format_size(probe.size)}"
+            print(f"  {mark}  {candidate.url}")
+        image, probe = choose_image(candidates, probes)
+        print(f"  👉 {image.url if image else '쓸 수 있는 이미지 없음'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+images/posts 내용 주소(SHA-256) 기반 이미지 저장소
+
+포스트가 참조하는 파일 이름은 그대로 두고, 그 위에 이름 → SHA-256 매니페스트
+(_data/image_manifest.json)를 유지한다. 이미 가지고 있는 바이트는 다시 받지
+않고 기존 파일을 가리키게 하며, 같은 내용의 파일은 보고하고 하나로 합친다.
+
+사용법:
+    python3 scripts/image_store.py              # 중복/미사용 이미지 보고
+    python3 scripts/image_store.py --collapse   # 중복 이미지를 하나로 합치기
+    python3 scripts/image_store.py --collapse --dry-run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from library_db import record_images
+from post_catalog import get_catalog
+
+IMAGES_DIR = 'images/posts'
+MANIFEST_PATH = '_data/image_manifest.json'
+IMAGE_EXTENSIONS = ('.gif', '.png', '.jpg', '.jpeg', '.webp')
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path):
+    """파일 SHA-256 (청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageStore:
+    """이미지 이름 → {sha256, size, mtime, source_url} 매니페스트"""
+
+    def __init__(self, images_dir=IMAGES_DIR, manifest_path=MANIFEST_PATH):
+        self.images_dir = images_dir
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.images = json.load(f).get('images', {})
+        except (OSError, ValueError):
+            self.images = {}
+
+    def _path(self, name):
+        return os.path.join(self.images_dir, name)
+
+    def _record(self, name, source_url=None):
+        path = self._path(name)
+        stat = os.stat(path)
+        entry = self.images.get(name, {})
+        if entry.get('size') != stat.st_size or entry.get('mtime') != int(stat.st_mtime):
+            entry = {
+                'sha256': file_sha256(path),
+                'size': stat.st_size,
+                'mtime': int(stat.st_mtime),
+                'source_url': entry.get('source_url')
+            }
+        if source_url:
+            entry['source_url'] = source_url
+        self.images[name] = entry
+        return entry
+
+    def refresh(self):
+        """디렉터리와 매니페스트 동기화 (크기나 수정 시각이 바뀐 파일만 다시 해시)"""
+        with self._lock:
+            names = {
+                name for name in os.listdir(self.images_dir)
+                if name.lower().endswith(IMAGE_EXTENSIONS)
+            }
+            for name in list(self.images):
+                if name not in names:
+                    del self.images[name]
+            for name in sorted(names):
+                self._record(name)
+
+    def lookup_url(self, source_url):
+        """같은 URL에서 받은 적 있는 이미지 이름 (없으면 None)"""
+        with self._lock:
+            for name, entry in self.images.items():
+                if entry.get('source_url') == source_url and os.path.exists(self._path(name)):
+                    return name
+        return None
+
+    def ingest(self, name, source_url=None):
+        """새로 받은 images/posts/{name}을 등록하고 실제로 쓸 이름 반환
+
+        같은 내용의 파일이 이미 있으면 새 파일을 지우고 기존 이름을 돌려준다.
+        """
+        with self._lock:
+            entry = self._record(name, source_url)
+            for other, other_entry in self.images.items():
+                if other != name and other_entry['sha256'] == entry['sha256'] \
+                        and os.path.exists(self._path(other)):
+                    os.remove(self._path(name))
+                    del self.images[name]
+                    if source_url and not other_entry.get('source_url'):
+                        other_entry['source_url'] = source_url
+                    return other
+            return name
+
+    def duplicates(self):
+        """같은 내용을 가진 이미지 이름 묶음 목록"""
+        groups = {}
+        for name, entry in sorted(self.images.items()):
+            groups.setdefault(entry['sha256'], []).append(name)
+        return [names for names in groups.values() if len(names) > 1]
+
+    def remove(self, name):
+        """이미지 파일과 매니페스트 항목 삭제"""
+        with self._lock:
+            os.remove(self._path(name))
+            self.images.pop(name, None)
+
+    def save(self):
+        """매니페스트 저장 (임시 파일 후 이름 변경)"""
+        with self._lock:
+            directory = os.path.dirname(self.manifest_path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'images': self.images}, f, indent=2, sort_keys=True)
+                f.write('\n')
+            os.replace(tmp_path, self.manifest_path)
+
+
+def post_image_references():
+    """이미지 이름 → 그 이미지를 쓰는 포스트 파일 목록"""
+    return {
+        name: [post.file for post in posts]
+        for name, posts in get_catalog().by_image.items()
+    }
+
+
+def set_post_image(post_file, image_name):
+    """포스트의 image: 경로를 다른 이미지 파일로 변경"""
+    catalog = get_catalog()
+    catalog.edit(catalog.get(post_file), {'image': f'/images/posts/{image_name}'})
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='images/posts 중복 이미지 보고 및 정리')
+    parser.add_argument('--collapse', action='store_true', help='중복 이미지를 하나로 합치기')
+    parser.add_argument('--dry-run', action='store_true', help='변경하지 않고 결과만 출력')
+    args = parser.parse_args()
+
+    store = ImageStore()
+    store.refresh()
+    references = post_image_references()
+
+    total = sum(entry['size'] for entry in store.images.values())
+    unique = sum({entry['sha256']: entry['size'] for entry in store.images.values()}.values())
+    print(f"🖼️  이미지 {len(store.images)}개, {total / 1024 / 1024:.1f}MB "
+          f"(고유 내용 {unique / 1024 / 1024:.1f}MB)")
+
+    duplicates = store.duplicates()
+    print(f"\n📋 중복 이미지: {len(duplicates)}묶음")
+    saved = 0
+    for names in duplicates:
+        # 포스트가 참조하는 이름을 남기고, 없으면 이름순 첫 번째
+        canonical = next((name for name in names if name in references), names[0])
+        print(f"  - {canonical} ← {', '.join(n for n in names if n != canonical)}")
+        for name in names:
+            if name == canonical:
+                continue
+            saved += store.images[name]['size']
+            if args.collapse and not args.dry_run:
+                for post_file in references.pop(name, []):
+                    set_post_image(post_file, canonical)
+                    print(f"    ✏️  {post_file} → {canonical}")
+                store.remove(name)
+
+    orphans = sorted(name for name in store.images if name not in references)
+    print(f"\n📋 포스트에서 쓰지 않는 이미지: {len(orphans)}개")
+    for name in orphans:
+        print(f"  - {name} ({store.images[name]['size'] / 1024:.0f}KB)")
+
+    if duplicates:
+        action = '정리됨' if args.collapse and not args.dry_run else '정리 가능'
+        print(f"\n💾 중복 {saved / 1024 / 1024:.1f}MB {action}")
+
+    if not args.dry_run:
+        store.save()
+        record_images(store)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+키워드 → 태그 일괄 매칭
+
+suggest_tags의 키워드 표를 한 번 컴파일해서, 텍스트를 한 번 훑으며
+모든 태그를 찾는다. 키워드마다 `keyword in text`를 반복하는 대신
+키워드를 접두사 트리(trie) 형태의 정규식 하나로 묶고, 키워드가 시작하는
+위치마다 가장 긴 키워드를 찾는다 (겹치는 키워드도 놓치지 않도록
+다음 검색은 찾은 키워드의 다음 글자부터).
+
+결과는 `any(keyword in text for keyword in keywords)`와 같다.
+한 키워드 안에 다른 키워드가 들어 있는 경우(progressbar ⊃ progress)는
+컴파일할 때 포함 관계를 미리 계산해서 함께 돌려준다.
+
+whole_words=True로 만들면 단어 경계에서 시작하고 끝나는 키워드만 센다
+(복수형 s/es는 허용). 짧은 저장소 이름이 아닌 README 같은 산문에서
+update → date, listener → list 같은 부분 문자열 오탐을 막는다.
+stems에 준 키워드(anim, explod처럼 단어의 앞부분)는 단어 앞에서 시작하기만
+하면 뒤에 어떤 글자가 와도 맞는다 (animating, exploding).
+
+사용법:
+    matcher = KeywordMatcher([(('loading', 'progress'), 'loading'), (('card',), 'card')])
+    matcher.match('a progress card view')  # {'loading', 'card'}
+
+    words = KeywordMatcher(mappings, whole_words=True, stems=('anim',))
+    words.match('context listener')  # set() (text, list는 단어가 아님)
+"""
+
+import re
+from collections import Counter
+
+
+def _trie_pattern(words):
+    """단어 목록을 접두사 트리 형태의 정규식으로 (긴 단어 우선)"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        end = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not end:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if end else group
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """(키워드 목록, 태그) 표를 컴파일한 매처"""
+
+    def __init__(self, mappings, whole_words=False, stems=()):
+        keyword_tags = {}
+        for keywords, tag in mappings:
+            for keyword in keywords:
+                keyword_tags.setdefault(keyword.lower(), set()).add(tag)
+
+        # 긴 키워드가 맞으면 그 안에 들어 있는 짧은 키워드의 태그도 함께
+        self.tags_for = {}
+        for keyword in keyword_tags:
+            tags = set()
+            for other, other_tags in keyword_tags.items():
+                if other in keyword:
+                    tags |= other_tags
+            self.tags_for[keyword] = frozenset(tags)
+
+        pattern = f'(?P<keyword>{_trie_pattern(keyword_tags)})'
+        if whole_words:
+            pattern = rf'{pattern}(?:e?s)?(?![a-z0-9])'
+            stems = [stem.lower() for stem in stems if stem.lower() in keyword_tags]
+            if stems:
+                # 온전한 단어를 먼저 시도하고, 안 되면 어간 + 나머지 글자
+                pattern = rf'(?:{pattern}|(?P<stem>{_trie_pattern(stems)})[a-z0-9]*)'
+            pattern = rf'(?<![a-z0-9]){pattern}'
+        self.pattern = re.compile(pattern)
+
+    def count(self, text):
+        """텍스트에 등장하는 키워드별 횟수 (각 위치에서 가장 긴 키워드만)"""
+        counts = Counter()
+        search = self.pattern.search
+        text = text.lower()
+        match = search(text)
+        while match is not None:
+            counts[match.group('keyword') or match.group('stem')] += 1
+            match = search(text, match.start() + 1)
+        return counts
+
+    def keywords(self, text):
+        """텍스트에 등장하는 키워드 집합 (각 위치에서 가장 긴 키워드만)"""
+        return set(self.count(text))
+
+    def match(self, *texts):
+        """텍스트(들)에 등장하는 키워드의 태그 집합"""
+        tags = set()
+        for text in texts:
+            if text:
+                for keyword in self.keywords(text):
+                    tags |= self.tags_for[keyword]
+        return tags
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+라이브러리 로컬 데이터베이스 (SQLite)
+
+스크립트마다 흩어져 있던 결과(repository_check_results.json, need_images.txt,
+update_view_libraries의 화면 출력)를 _library.db 한 곳에 모은다.
+저장소 상태는 조회할 때마다 repo_snapshots에 이력으로 쌓이므로
+별점이나 보관 상태 변화를 다시 크롤링하지 않고 조회할 수 있다.
+
+테이블:
+    posts          - 포스트 front matter (post_catalog에서 동기화)
+    post_tags      - 포스트 태그
+    repos          - 저장소별 최신 상태
+    repo_snapshots - 저장소 상태 이력
+    readmes        - README 조회 결과
+    images         - images/posts 파일 (image_store 매니페스트)
+
+사용법:
+    python3 scripts/library_db.py archived --min-stars 1000
+    python3 scripts/library_db.py missing-readme
+    python3 scripts/library_db.py history Yalantis/Phoenix
+    python3 scripts/library_db.py sql "SELECT COUNT(*) FROM posts"
+"""
+
+import argparse
+import sqlite3
+import time
+
+from post_catalog import get_catalog
+
+DB_PATH = '_library.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    file TEXT PRIMARY KEY,
+    title TEXT,
+    date TEXT,
+    repo TEXT,
+    link TEXT,
+    image TEXT,
+    readme_url TEXT,
+    compose INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS posts_repo ON posts (repo COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS posts_image ON posts (image);
+
+CREATE TABLE IF NOT EXISTS post_tags (
+    file TEXT NOT NULL REFERENCES posts (file) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (file, tag)
+);
+CREATE INDEX IF NOT EXISTS post_tags_tag ON post_tags (tag);
+
+CREATE TABLE IF NOT EXISTS repos (
+    repo TEXT PRIMARY KEY COLLATE NOCASE,
+    status TEXT NOT NULL,
+    full_name TEXT,
+    stars INTEGER,
+    archived INTEGER,
+    private INTEGER,
+    description TEXT,
+    language TEXT,
+    default_branch TEXT,
+    last_update TEXT,
+    pushed_at TEXT,
+    error TEXT,
+    checked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS repos_archived_stars ON repos (archived, stars);
+CREATE INDEX IF NOT EXISTS repos_status ON repos (status);
+
+CREATE TABLE IF NOT EXISTS repo_snapshots (
+    repo TEXT NOT NULL COLLATE NOCASE,
+    checked_at REAL NOT NULL,
+    status TEXT NOT NULL,
+    stars INTEGER,
+    archived INTEGER,
+    last_update TEXT,
+    PRIMARY KEY (repo, checked_at)
+);
+
+CREATE TABLE IF NOT EXISTS readmes (
+    repo TEXT PRIMARY KEY COLLATE NOCASE,
+    status TEXT NOT NULL,
+    readme_url TEXT,
+    path TEXT,
+    branch TEXT,
+    error TEXT,
+    checked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS readmes_status ON readmes (status);
+
+CREATE TABLE IF NOT EXISTS images (
+    name TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    source_url TEXT
+);
+CREATE INDEX IF NOT EXISTS images_sha256 ON images (sha256);
+"""
+
+
+def _status_name(exists):
+    if exists is True:
+        return 'active'
+    if exists is False:
+        return 'not_found'
+    return 'unknown'
+
+
+class LibraryDB:
+    """_library.db 연결과 기록/조회 함수"""
+
+    def __init__(self, path=DB_PATH, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def sync_posts(self, catalog=None):
+        """post_catalog 레코드로 posts, post_tags 갱신"""
+        catalog = catalog or get_catalog()
+        with self.conn:
+            self.conn.execute('DELETE FROM posts')
+            self.conn.executemany(
+                'INSERT INTO posts (file, title, date, repo, link, image, readme_url, compose) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(post.file, post.title, post.date, post.repo, post.link, post.image_name,
+                  post.readme_url, int(post.is_compose)) for post in catalog]
+            )
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO post_tags (file, tag) VALUES (?, ?)',
+                [(post.file, tag) for post in catalog for tag in post.tags]
+            )
+
+    def record_repo_statuses(self, statuses):
+        """github_client 상태 dict(repo -> 상태)를 최신 상태와 이력에 기록"""
+        now = self.clock()
+        rows = []
+        for repo, status in statuses.items():
+            exists = status.get('exists')
+            rows.append({
+                'repo': repo,
+                'status': 'archived' if exists is True and status.get('archived') else _status_name(exists),
+                'full_name': status.get('full_name'),
+                'stars': status.get('stars'),
+                'archived': int(status['archived']) if 'archived' in status else None,
+                'private': int(status['private']) if 'private' in status else None,
+                'description': status.get('description'),
+                'language': status.get('language'),
+                'default_branch': status.get('default_branch'),
+                'last_update': status.get('last_update'),
+                'pushed_at': status.get('pushed_at'),
+                'error': status.get('error'),
+                'checked_at': now
+            })
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO repos VALUES (:repo, :status, :full_name, :stars, :archived, '
+                ':private, :description, :language, :default_branch, :last_update, :pushed_at, '
+                ':error, :checked_at)', rows
+            )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO repo_snapshots VALUES (:repo, :checked_at, :status, :stars, '
+                ':archived, :last_update)', rows
+            )
+
+    def record_readmes(self, results):
+        """readme_resolver 결과(repo -> 결과 dict) 기록"""
+        now = self.clock()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO readmes VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(repo, result['status'], result.get('readme_url'), result.get('path'),
+                  result.get('branch'), result.get('error'), now)
+                 for repo, result in results.items()]
+            )
+
+    def record_images(self, store):
+        """image_store 매니페스트로 images 갱신"""
+        with self.conn:
+            self.conn.execute('DELETE FROM images')
+            self.conn.executemany(
+                'INSERT INTO images VALUES (?, ?, ?, ?)',
+                [(name, entry['sha256'], entry['size'], entry.get('source_url'))
+                 for name, entry in store.images.items()]
+            )
+
+    def archived_repos(self, min_stars=0):
+        """보관된 저장소 중 별점 min_stars 이상 (포스트 포함)"""
+        return self.conn.execute(
+            'SELECT r.repo, r.stars, r.last_update, p.file FROM repos r '
+            'LEFT JOIN posts p ON p.repo = r.repo COLLATE NOCASE '
+            'WHERE r.archived = 1 AND r.stars >= ? ORDER BY r.stars DESC', (min_stars,)
+        ).fetchall()
+
+    def missing_readmes(self):
+        """마지막 조회에서 README를 찾지 못한 포스트"""
+        return self.conn.execute(
+            'SELECT p.file, p.repo, m.status, m.error FROM posts p '
+            'JOIN readmes m ON m.repo = p.repo COLLATE NOCASE '
+            "WHERE m.status != 'found' ORDER BY p.file"
+        ).fetchall()
+
+    def missing_images(self):
+        """image:가 가리키는 파일이 images/posts에 없는 포스트"""
+        return self.conn.execute(
+            'SELECT p.file, p.image FROM posts p LEFT JOIN images i ON i.name = p.image '
+            'WHERE p.image IS NOT NULL AND i.name IS NULL ORDER BY p.file'
+        ).fetchall()
+
+    def repo_history(self, repo):
+        """저장소 상태 이력 (오래된 순)"""
+        return self.conn.execute(
+            'SELECT checked_at, status, stars, archived, last_update FROM repo_snapshots '
+            'WHERE repo = ? ORDER BY checked_at', (repo,)
+        ).fetchall()
+
+
+def record_repo_statuses(statuses, path=DB_PATH):
+    """포스트를 동기화하고 저장소 상태를 기록 (스크립트용 단축 함수)"""
+    with LibraryDB(path) as db:
+        db.sync_posts()
+        db.record_repo_statuses(statuses)
+
+
+def record_readmes(results, path=DB_PATH):
+    """포스트를 동기화하고 README 조회 결과를 기록 (스크립트용 단축 함수)"""
+    with LibraryDB(path) as db:
+        db.sync_posts()
+        db.record_readmes(results)
+
+
+def record_images(store, path=DB_PATH):
+    """포스트를 동기화하고 이미지 매니페스트를 기록 (스크립트용 단축 함수)"""
+    with LibraryDB(path) as db:
+        db.sync_posts()
+        db.record_images(store)
+
+
+def _print_rows(rows):
+    if not rows:
+        print("(결과 없음)")
+        return
+    print(' | '.join(rows[0].keys()))
+    for row in rows:
+        print(' | '.join('' if value is None else str(value) for value in row))
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='라이브러리 데이터베이스 조회')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    archived = subparsers.add_parser('archived', help='보관된 저장소')
+    archived.add_argument('--min-stars', type=int, default=0)
+    subparsers.add_parser('missing-readme', help='README를 찾지 못한 포스트')
+    subparsers.add_parser('missing-image', help='이미지 파일이 없는 포스트')
+    history = subparsers.add_parser('history', help='저장소 상태 이력')
+    history.add_argument('repo')
+    sql = subparsers.add_parser('sql', help='SQL 직접 실행')
+    sql.add_argument('query')
+    args = parser.parse_args()
+
+    with LibraryDB() as db:
+        db.sync_posts()
+        if args.command == 'archived':
+            _print_rows(db.archived_repos(args.min_stars))
+        elif args.command == 'missing-readme':
+            _print_rows(db.missing_readmes())
+        elif args.command == 'missing-image':
+            from image_store import ImageStore
+            store = ImageStore()
+            store.refresh()
+            db.record_images(store)
+            _print_rows(db.missing_images())
+        elif args.command == 'history':
+            _print_rows(db.repo_history(args.repo))
+        else:
+            _print_rows(db.conn.execute(args.query).fetchall())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub API 응답 조건부 요청 캐시
+
+_plugins/remote_markdown.rb의 _remote_markdown_cache와 같은 방식으로
+응답 본문을 URL별 파일에 저장하고, ETag와 Last-Modified를 함께 기록한다.
+다음 실행에서는 If-None-Match / If-Modified-Since를 보내서 바뀌지 않은
+저장소를 304로 받는다. 304 응답은 API 할당량을 차감하지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import suppress
+
+CACHE_DIR = '_github_metadata_cache'
+CACHE_EXPIRY = 3600 * 24 * 7  # 7일
+MAX_ENTRIES = 2000
+STALE_TMP_AGE = 3600  # 이보다 오래된 임시 파일만 중단된 쓰기로 봄
+
+
+class MetadataCache:
+    """URL별 API 응답과 검증 헤더(ETag, Last-Modified)를 저장하는 디스크 캐시"""
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_EXPIRY, max_entries=MAX_ENTRIES,
+                 clock=time.time):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.revalidated = 0
+        self.stored = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        cache_key = hashlib.md5(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{cache_key}.json')
+
+    def _write(self, path, entry):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def get(self, url):
+        """유효한 캐시 항목 반환 (없거나 만료되면 None)"""
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.age(entry) >= self.ttl:
+            # 같은 항목을 읽던 다른 스레드가 먼저 지웠을 수 있음
+            with suppress(FileNotFoundError):
+                os.remove(path)
+            return None
+        return entry
+
+    def age(self, entry):
+        """항목이 저장되거나 마지막으로 확인된 뒤 지난 시간 (초)"""
+        return self.clock() - entry.get('timestamp', 0)
+
+    @staticmethod
+    def conditional_headers(entry):
+        """캐시 항목으로 조건부 요청 헤더 생성"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, headers, data):
+        """200 응답 저장"""
+        self._write(self._path(url), {
+            'url': url,
+            'timestamp': self.clock(),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'data': data
+        })
+        self.stored += 1
+
+    def revalidate(self, url, entry, headers):
+        """304 응답으로 확인된 항목의 TTL 갱신 후 본문 반환"""
+        entry['timestamp'] = self.clock()
+        entry['etag'] = headers.get('ETag') or entry.get('etag')
+        entry['last_modified'] = headers.get('Last-Modified') or entry.get('last_modified')
+        self._write(self._path(url), entry)
+        self.revalidated += 1
+        return entry['data']
+
+    def prune(self):
+        """만료된 항목을 지우고 max_entries를 넘는 오래된 항목 정리"""
+        now = self.clock()
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                mtime = os.path.getmtime(path)
+                if not name.endswith('.json'):
+                    # 중단된 쓰기로 남은 임시 파일 (다른 스레드/프로세스가 쓰는 중인 파일은 두기)
+                    if now - mtime >= STALE_TMP_AGE:
+                        os.remove(path)
+                    continue
+                if now - mtime >= self.ttl:
+                    os.remove(path)
+                else:
+                    entries.append((mtime, path))
+            except FileNotFoundError:
+                # 다른 클라이언트가 먼저 정리했거나 이름을 바꾼 파일
+                continue
+
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_entries:]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
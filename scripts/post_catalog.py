@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+_posts 카탈로그
+
+모든 포스트 파일을 한 번씩만 읽어 front matter를 레코드로 만들고,
+저장소/태그/이미지별 색인을 만든다. 스크립트는 파일을 직접 열어 정규식으로
+찾는 대신 이 카탈로그를 조회하고, 포스트를 고칠 때도 edit()(front matter)나 rewrite()로 쓴다.
+
+파싱한 레코드는 파일 크기, 수정 시각과 함께 스냅샷(_post_catalog.json)에
+저장된다. 다음 실행에서는 stat만 확인하고 바뀐 파일만 다시 읽는다.
+
+사용법:
+    from post_catalog import get_catalog
+
+    catalog = get_catalog()
+    for post in catalog.view_posts():
+        print(post.file, post.repo, post.tags)
+    catalog.find_repo('Yalantis/Phoenix')
+"""
+
+import atexit
+import difflib
+import json
+import os
+import re
+import tempfile
+import threading
+
+from front_matter import FrontMatter, FrontMatterError
+
+POSTS_DIR = '_posts'
+SNAPSHOT_PATH = '_post_catalog.json'
+SNAPSHOT_VERSION = 3
+
+# Compose 포스트는 2024-01-* 파일로 추가되어 있다
+COMPOSE_PREFIX = '2024-01'
+
+REMOTE_MARKDOWN_PATTERN = r'{% remote_markdown (https://raw\.githubusercontent\.com/[^}]+\.md) %}'
+
+
+def extract_repo(link, body):
+    """link 또는 본문에서 GitHub 저장소(owner/repo) 추출"""
+    if link:
+        repo_match = re.search(r'github\.com/([^/]+/[^/]+)', link)
+        if repo_match:
+            return repo_match.group(1).rstrip('/')
+
+    # remote_markdown URL에서도 시도
+    remote_match = re.search(r'github\.com/([^/]+/[^/]+)/', body)
+    if remote_match:
+        return remote_match.group(1)
+    return None
+
+
+def _string(value):
+    return None if value is None else str(value)
+
+
+def atomic_write(path, content):
+    """같은 디렉터리의 임시 파일에 쓴 뒤 이름을 바꿔 교체 (권한 유지)"""
+    mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class Post:
+    """포스트 하나의 front matter 레코드
+
+    본문(content)은 스냅샷에 저장하지 않고, 필요할 때 한 번 읽는다.
+    """
+
+    __slots__ = ('file', 'path', 'name', 'date', 'title', 'tags', 'link', 'image', 'summary',
+                 'repo', 'readme_url', 'mtime_ns', 'size', '_content')
+
+    SNAPSHOT_FIELDS = ('title', 'tags', 'link', 'image', 'summary', 'repo', 'readme_url',
+                       'mtime_ns', 'size')
+
+    def __init__(self, file, path, content, stat=None):
+        self.file = file
+        self.path = path
+        self._content = content
+        if stat is None:
+            stat = os.stat(path)
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+
+        stem = file[:-3] if file.endswith('.md') else file
+        self.date = stem[:10]
+        self.name = stem.split('-', 3)[-1]
+
+        try:
+            front_matter = FrontMatter(content)
+            data, body = front_matter.data, front_matter.body
+        except FrontMatterError:
+            data, body = {}, content
+
+        self.title = _string(data.get('title')) or self.name
+        self.link = _string(data.get('link'))
+        self.image = _string(data.get('image'))
+        self.summary = _string(data.get('summary'))
+        tags = data.get('tag') or []
+        self.tags = [str(tag) for tag in tags] if isinstance(tags, list) else [str(tags)]
+
+        readme_match = re.search(REMOTE_MARKDOWN_PATTERN, body)
+        self.readme_url = readme_match.group(1) if readme_match else None
+        self.repo = extract_repo(self.link, body)
+
+    @classmethod
+    def from_snapshot(cls, file, path, record):
+        """스냅샷 레코드로 복원 (파일을 읽지 않음)"""
+        post = cls.__new__(cls)
+        post.file = file
+        post.path = path
+        post._content = None
+        stem = file[:-3] if file.endswith('.md') else file
+        post.date = stem[:10]
+        post.name = stem.split('-', 3)[-1]
+        for field in cls.SNAPSHOT_FIELDS:
+            setattr(post, field, record[field])
+        return post
+
+    def to_snapshot(self):
+        return {field: getattr(self, field) for field in self.SNAPSHOT_FIELDS}
+
+    @property
+    def content(self):
+        """포스트 파일 전체 내용 (스냅샷에서 복원된 경우 처음 접근할 때 읽음)"""
+        if self._content is None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._content = f.read()
+        return self._content
+
+    @property
+    def image_name(self):
+        """images/posts 안의 파일 이름 (다른 경로면 None)"""
+        if self.image and self.image.startswith('/images/posts/'):
+            return self.image[len('/images/posts/'):]
+        return None
+
+    @property
+    def url(self):
+        """사이트 안의 포스트 주소 (permalink: pretty, baseurl 제외)"""
+        return f'/{self.date[:4]}/{self.date[5:7]}/{self.date[8:10]}/{self.name}/'
+
+    @property
+    def is_compose(self):
+        return self.file.startswith(COMPOSE_PREFIX)
+
+    def __repr__(self):
+        return f'Post({self.file!r})'
+
+
+class PostCatalog:
+    """_posts 전체 레코드와 저장소/태그/이미지 색인
+
+    snapshot_path가 주어지면 스냅샷에서 시작해 바뀐 파일만 다시 파싱한다.
+    """
+
+    def __init__(self, posts_dir=POSTS_DIR, snapshot_path=None):
+        self.posts_dir = posts_dir
+        self.snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self.parsed = 0
+        self.dirty = False
+        self.by_file = self._load_snapshot()
+        self.refresh()
+
+    def _load_snapshot(self):
+        if not self.snapshot_path:
+            return {}
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('posts_dir') != self.posts_dir:
+            return {}
+        return {
+            file: Post.from_snapshot(file, os.path.join(self.posts_dir, file), record)
+            for file, record in snapshot['posts'].items()
+        }
+
+    def refresh(self):
+        """크기나 수정 시각이 바뀐 파일만 다시 파싱하고 바뀐 파일 수 반환"""
+        current = {}
+        changed = 0
+        with os.scandir(self.posts_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.md'):
+                    continue
+                stat = entry.stat()
+                post = self.by_file.get(entry.name)
+                if post is None or post.mtime_ns != stat.st_mtime_ns or post.size != stat.st_size:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        post = Post(entry.name, entry.path, f.read(), stat)
+                    changed += 1
+                current[entry.name] = post
+
+        changed += len(self.by_file.keys() - current.keys())
+        with self._lock:
+            self.by_file = {file: current[file] for file in sorted(current)}
+            self._reindex()
+        self.parsed += changed
+        if changed:
+            self.save()
+        return changed
+
+    def flush(self):
+        """rewrite() 이후 바뀐 레코드가 있으면 스냅샷 저장"""
+        if self.dirty:
+            self.save()
+
+    def save(self):
+        """스냅샷 저장 (임시 파일 후 이름 변경)"""
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            self.dirty = False
+            snapshot = {
+                'version': SNAPSHOT_VERSION,
+                'posts_dir': self.posts_dir,
+                'posts': {file: post.to_snapshot() for file, post in self.by_file.items()}
+            }
+        directory = os.path.dirname(self.snapshot_path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.snapshot_path)
+
+    def _index_keys(self, post):
+        keys = []
+        if post.repo:
+            keys.append((self.by_repo, post.repo.lower()))
+        keys.extend((self.by_tag, tag) for tag in dict.fromkeys(post.tags))
+        if post.image_name:
+            keys.append((self.by_image, post.image_name))
+        return keys
+
+    def _reindex(self):
+        self.by_repo = {}
+        self.by_tag = {}
+        self.by_image = {}
+        for post in self.by_file.values():
+            for index, key in self._index_keys(post):
+                index.setdefault(key, []).append(post)
+
+    def __iter__(self):
+        return iter(self.posts())
+
+    def __len__(self):
+        return len(self.by_file)
+
+    def posts(self):
+        """전체 포스트 (파일 이름순)"""
+        return list(self.by_file.values())
+
+    def view_posts(self):
+        """Compose 포스트를 제외한 View 라이브러리 포스트"""
+        return [post for post in self.by_file.values() if not post.is_compose]
+
+    def get(self, file):
+        """파일 이름으로 포스트 찾기 (없으면 None)"""
+        return self.by_file.get(file)
+
+    def find_repo(self, repo):
+        """저장소(owner/repo, 대소문자 무시)를 쓰는 포스트 목록"""
+        return self.by_repo.get(repo.lower(), [])
+
+    def with_tag(self, tag):
+        """태그가 붙은 포스트 목록"""
+        return self.by_tag.get(tag, [])
+
+    def with_image(self, image_name):
+        """images/posts/{image_name}을 쓰는 포스트 목록"""
+        return self.by_image.get(image_name, [])
+
+    def edit(self, post, values):
+        """front matter 값 변경 (바뀐 키의 줄만 다시 쓰고, 바뀐 게 없으면 쓰지 않음)"""
+        front_matter = FrontMatter(post.content)
+        front_matter.update(values)
+        if not front_matter.changed:
+            return post
+        return self.rewrite(post, front_matter.render())
+
+    def batch(self):
+        """변경을 모았다가 한 번에 쓰는 PostBatch"""
+        return PostBatch(self)
+
+    def rewrite(self, post, content):
+        """포스트 파일을 content로 바꾸고 레코드와 색인 갱신 (다시 읽지 않음)
+
+        내용이 같으면 쓰지 않아서 수정 시각도 바뀌지 않는다.
+        """
+        if content == post.content:
+            return post
+        atomic_write(post.path, content)
+        updated = Post(post.file, post.path, content)
+        self.dirty = True
+        with self._lock:
+            old = self.by_file[post.file]
+            for index, key in self._index_keys(old):
+                index[key].remove(old)
+                if not index[key]:
+                    del index[key]
+            self.by_file[post.file] = updated
+            for index, key in self._index_keys(updated):
+                index.setdefault(key, []).append(updated)
+        return updated
+
+
+class PostBatch:
+    """여러 포스트의 변경을 모았다가 미리보기(diff) 후 한 번에 쓰는 쓰기 단위
+
+    PostCatalog와 같은 edit()/rewrite()를 제공하므로 그대로 바꿔 끼울 수 있다.
+    commit() 전에 중단되면 어떤 파일도 바뀌지 않는다.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.pending = {}
+
+    def _current(self, post):
+        return self.pending.get(post.file, post.content)
+
+    def edit(self, post, values):
+        """front matter 값 변경 예약"""
+        front_matter = FrontMatter(self._current(post))
+        front_matter.update(values)
+        if front_matter.changed:
+            self.rewrite(post, front_matter.render())
+        return post
+
+    def rewrite(self, post, content):
+        """포스트 내용 교체 예약 (원본과 같아지면 예약 취소)"""
+        if content == post.content:
+            self.pending.pop(post.file, None)
+        else:
+            self.pending[post.file] = content
+        return post
+
+    def __len__(self):
+        return len(self.pending)
+
+    def diff(self):
+        """예약된 변경의 unified diff"""
+        chunks = []
+        for file, content in sorted(self.pending.items()):
+            post = self.catalog.get(file)
+            for line in difflib.unified_diff(
+                post.content.splitlines(keepends=True), content.splitlines(keepends=True),
+                fromfile=f'a/{post.path}', tofile=f'b/{post.path}'
+            ):
+                if not line.endswith('\n'):
+                    line += '\n\\ No newline at end of file\n'
+                chunks.append(line)
+        return ''.join(chunks)
+
+    def commit(self):
+        """예약된 파일을 하나씩 원자적으로 쓰고 쓴 파일 수 반환"""
+        written = 0
+        for file, content in sorted(self.pending.items()):
+            self.catalog.rewrite(self.catalog.get(file), content)
+            written += 1
+        self.pending.clear()
+        return written
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(posts_dir=POSTS_DIR, snapshot_path=SNAPSHOT_PATH):
+    """실행 중 한 번만 만들어지는 공용 카탈로그 (스냅샷에서 시작)"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.posts_dir != posts_dir:
+            _catalog = PostCatalog(posts_dir, snapshot_path)
+            atexit.register(_catalog.flush)
+        return _catalog
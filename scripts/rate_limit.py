@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub 응답 헤더 기반 요청 스케줄러
+
+고정된 time.sleep 대신 X-RateLimit-Remaining, X-RateLimit-Reset,
+Retry-After 헤더를 읽어서 할당량이 남아 있는 동안은 최대 속도로 요청하고,
+제한에 걸렸을 때만 필요한 만큼 대기한다. 제한이나 일시적인 오류로 실패한
+항목은 버리지 않고 큐 뒤로 다시 넣는다.
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+
+
+class RateLimited(Exception):
+    """할당량 초과로 거절된 요청 (대기 후 재시도)"""
+
+    def __init__(self, retry_at):
+        super().__init__(f'rate limited until {time.strftime("%H:%M:%S", time.localtime(retry_at))}')
+        self.retry_at = retry_at
+
+
+class RetryableError(Exception):
+    """5xx, 네트워크 오류 등 다시 시도하면 성공할 수 있는 실패"""
+
+
+def backoff_delay(attempt):
+    """attempt번째 재시도 전 대기 시간 (지수 백오프에 ±50% 지터, 동시 재시도가 몰리지 않게)"""
+    return RETRY_BACKOFF * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+
+
+def parse_retry_after(value, now):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 절대 시각으로 변환"""
+    try:
+        return now + float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitScheduler:
+    """응답 헤더로 남은 할당량을 추적하고 요청 시점을 조절"""
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, clock=time.time, sleep=asyncio.sleep):
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self.sleep = sleep
+        self.remaining = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.requeued = 0
+        self.waited = 0.0
+        self._announced = None
+
+    def _resume_at(self):
+        resume_at = self.blocked_until
+        if self.remaining is not None and self.remaining <= 0:
+            resume_at = max(resume_at, self.reset_at)
+        return resume_at
+
+    async def acquire(self):
+        """요청 하나를 보내기 전 호출. 할당량이 없으면 reset 시각까지 대기"""
+        while True:
+            now = self.clock()
+            resume_at = self._resume_at()
+            if resume_at <= now:
+                break
+            delay = resume_at - now
+            if resume_at != self._announced:
+                # 동시에 대기하는 요청이 여럿이어도 한 번만 알림
+                self._announced = resume_at
+                self.waited += delay
+                print(f"  ⏳ API 제한 도달, {delay:.0f}초 대기")
+            await self.sleep(delay)
+
+        if self.remaining is not None:
+            # 응답을 받기 전까지 동시에 나가는 요청도 할당량을 차감
+            self.remaining -= 1
+
+    def observe(self, status, headers):
+        """응답 헤더로 상태 갱신. 제한에 걸린 응답이면 재시도 가능 시각 반환"""
+        now = self.clock()
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is not None:
+            self.remaining = int(remaining)
+        if reset is not None:
+            self.reset_at = float(reset)
+
+        if status not in (403, 429):
+            return None
+
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            retry_at = parse_retry_after(retry_after, now)
+        elif self.remaining == 0:
+            retry_at = self.reset_at
+        elif status == 429:
+            retry_at = now + RETRY_BACKOFF
+        else:
+            # 권한 문제 등 할당량과 무관한 403
+            return None
+
+        if retry_at is None:
+            retry_at = now + RETRY_BACKOFF
+        self.blocked_until = max(self.blocked_until, retry_at)
+        return retry_at
+
+    async def run(self, items, worker, concurrency):
+        """items를 worker로 처리하고 (results, failures) 반환
+
+        RateLimited는 시도 횟수를 차감하지 않고 큐 뒤로 보내며,
+        RetryableError는 max_attempts까지 큐 뒤로 보낸 뒤 failures에 기록한다.
+        """
+        queue = asyncio.Queue()
+        for item in dict.fromkeys(items):
+            queue.put_nowait((item, 1))
+
+        results = {}
+        failures = {}
+
+        async def consume():
+            while not queue.empty():
+                item, attempt = queue.get_nowait()
+                try:
+                    results[item] = await worker(item)
+                except RateLimited:
+                    self.requeued += 1
+                    queue.put_nowait((item, attempt))
+                except RetryableError as e:
+                    if attempt >= self.max_attempts:
+                        failures[item] = e
+                        continue
+                    self.requeued += 1
+                    await self.sleep(backoff_delay(attempt))
+                    queue.put_nowait((item, attempt + 1))
+
+        await asyncio.gather(*(consume() for _ in range(max(1, concurrency))))
+        return results, failures
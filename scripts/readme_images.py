@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+README 이미지 후보 추출
+
+README 본문을 한 번에 토큰으로 나눠서 마크다운 이미지(![alt](src)),
+HTML <img> 태그, 본문에 그대로 적힌 이미지 URL을 모두 찾고,
+대표 이미지로 쓸 순서대로 정렬한 후보 목록을 돌려준다.
+
+순위: GIF → 데모처럼 보이는 이름(demo, preview, screenshot...) → 크기 힌트
+(width/height 속성이나 파일명의 WxH가 MIN_IMAGE_SIZE 이상) → README 안의 순서.
+배지(shields.io 등)는 빼고, 로고/아이콘이나 작은 크기 힌트는 뒤로 보낸다.
+
+상대 경로는 README가 실제로 있는 브랜치와 디렉토리(readme_store가 기록한
+README URL) 기준으로 바꾼다. github.com/.../blob/ 주소는 raw 주소로 바꾼다.
+
+사용법:
+    python3 scripts/readme_images.py Yalantis/Phoenix   # 후보 목록 출력
+    python3 scripts/readme_images.py --benchmark        # 캐시된 README로 성능 비교
+"""
+
+import argparse
+import os
+import re
+import time
+from heapq import merge
+from collections import namedtuple
+from urllib.parse import urljoin, urlsplit
+
+from readme_resolver import RAW_URL
+from readme_store import STORE_DIR, ReadmeStore, get_readme_store
+from readme_tagger import CACHE_DIR
+
+MIN_IMAGE_SIZE = 200  # 이보다 작다고 적힌 이미지는 아이콘으로 봄
+
+# 토큰 종류별 패턴. 세 가지를 한 정규식의 | 로 묶으면 CPython re가 첫 글자
+# 빠른 검색을 못 해서 위치마다 세 갈래를 시도하므로(벤치마크에서 약 10배 느림),
+# 고정된 첫 글자로 시작하는 패턴 셋을 각자 훑고 위치 순으로 합친다.
+MARKDOWN_IMAGE_PATTERN = re.compile(r'''!\[([^\]]*)\]\(\s*<?([^\s)>]+)>?(?:\s+["'][^"']*["'])?\s*\)''')
+HTML_IMAGE_PATTERN = re.compile(r'<[iI][mM][gG]\b([^>]*)>')
+BARE_IMAGE_PATTERN = re.compile(
+    r'''https?://[^\s()<>"'\[\]]+?\.(?:[gG][iI][fF]|[pP][nN][gG]|[jJ][pP][eE]?[gG]|[wW][eE][bB][pP])'''
+    r'''(?:\?[^\s()<>"'\[\]]*)?(?![\w.])''')
+ATTR_PATTERN = re.compile(r'''\b(src|alt|width|height)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.I)
+EXT_PATTERN = re.compile(r'\.(gif|png|jpe?g|webp)$', re.I)
+PIXELS_PATTERN = re.compile(r'\s*([0-9]+)\s*(?:px)?\s*$')
+SIZE_PATTERN = re.compile(r'(?<![0-9])([0-9]{2,4})x([0-9]{2,4})(?![0-9])', re.I)
+BLOB_PATTERN = re.compile(r'^https?://github\.com/([^/]+/[^/]+)/(?:blob|raw)/(.+)$')
+
+DEMO_PATTERN = re.compile(r'demo|preview|screen|sample|example|showcase|record|capture', re.I)
+ICON_PATTERN = re.compile(r'logo|icon|avatar|banner', re.I)
+BADGE_PATTERN = re.compile(
+    r'shields\.io|badge|travis-ci\.|circleci\.com|codecov\.io|coveralls\.io|jitpack\.io/v/'
+    r'|api\.bintray|android-arsenal\.com|maven-badges|img\.shields', re.I)
+
+ImageCandidate = namedtuple('ImageCandidate', ['url', 'ext', 'alt', 'size'])
+
+
+def readme_base_url(repo, store=None):
+    """상대 경로의 기준 URL (README가 있는 디렉토리, 모르면 기본 브랜치 HEAD)"""
+    store = store or get_readme_store()
+    return store.readme_url(repo) or f'{RAW_URL}/{repo}/HEAD/README.md'
+
+
+def resolve_image_url(src, base_url=None):
+    """이미지 주소를 절대 URL로 (상대 경로는 README 위치 기준, blob 주소는 raw로)"""
+    src = src.strip()
+    match = BLOB_PATTERN.match(src)
+    if match:
+        return f'{RAW_URL}/{match.group(1)}/{match.group(2)}'
+    if src.startswith(('http://', 'https://')):
+        return src
+    if src.startswith('//'):
+        return 'https:' + src
+    if not base_url:
+        return None
+    if src.startswith('/'):
+        # 저장소 루트 기준: https://raw.githubusercontent.com/{owner}/{repo}/{branch}/
+        parts = urlsplit(base_url).path.split('/')
+        return f'{RAW_URL}{"/".join(parts[:4])}{src}'
+    if '..' in src:
+        return urljoin(base_url, src)
+    # 대부분의 상대 경로(art/demo.gif, ./demo.gif)는 urljoin 없이 README 디렉토리에 붙임
+    return base_url.rsplit('/', 1)[0] + '/' + (src[2:] if src.startswith('./') else src)
+
+
+def _size_hint(width, height, url):
+    """width/height 속성 또는 파일명의 WxH 중 큰 값 (없으면 None)"""
+    values = []
+    for value in (width, height):
+        digits = PIXELS_PATTERN.match(value or '')
+        if digits:
+            values.append(int(digits.group(1)))
+    if not values:
+        match = SIZE_PATTERN.search(url.rsplit('/', 1)[-1])
+        if match:
+            values = [int(match.group(1)), int(match.group(2))]
+    return max(values) if values else None
+
+
+def _rank(candidate):
+    name = candidate.url.rsplit('/', 1)[-1]
+    text = f'{name} {candidate.alt}'
+    if candidate.size is not None:
+        size_rank = 0 if candidate.size >= MIN_IMAGE_SIZE else 2
+    else:
+        size_rank = 2 if ICON_PATTERN.search(text) else 1
+    return (candidate.ext != 'gif', not DEMO_PATTERN.search(text), size_rank)
+
+
+def tokenize_images(content):
+    """README의 이미지 토큰을 위치 순으로 (src, alt, width, height)
+
+    마크다운/HTML 이미지 안에 있는 URL은 따로 세지 않는다.
+    """
+    tokens = merge(MARKDOWN_IMAGE_PATTERN.finditer(content), HTML_IMAGE_PATTERN.finditer(content),
+                   BARE_IMAGE_PATTERN.finditer(content), key=lambda match: match.start())
+    end = 0
+    for match in tokens:
+        if match.start() < end:
+            continue
+        end = match.end()
+        if match.re is MARKDOWN_IMAGE_PATTERN:
+            yield match.group(2), match.group(1), None, None
+        elif match.re is HTML_IMAGE_PATTERN:
+            attrs = {name.lower(): dq or sq or bare
+                     for name, dq, sq, bare in ATTR_PATTERN.findall(match.group(1))}
+            if attrs.get('src'):
+                yield attrs['src'], attrs.get('alt', ''), attrs.get('width'), attrs.get('height')
+        else:
+            yield match.group(0), '', None, None
+
+
+def extract_images(content, base_url=None):
+    """README에서 이미지 후보를 순위대로 반환 (ImageCandidate 목록)
+
+    base_url: README의 raw URL (상대 경로 기준)
+    """
+    candidates = []
+    seen = set()
+    for src, alt, width, height in tokenize_images(content or ''):
+        # 확장자와 배지는 주소를 바꾸기 전에 원래 src로 거른다
+        ext = EXT_PATTERN.search(src.split('#', 1)[0].split('?', 1)[0])
+        if not ext or BADGE_PATTERN.search(src):
+            continue
+        url = resolve_image_url(src, base_url)
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        candidates.append(ImageCandidate(url, ext.group(1).lower(), alt, _size_hint(width, height, url)))
+
+    # sorted는 안정 정렬이므로 같은 순위는 README 안의 순서 유지
+    return sorted(candidates, key=_rank)
+
+
+def readme_images(repo, store=None):
+    """저장소 README의 이미지 후보 (README가 없으면 빈 목록)"""
+    store = store or get_readme_store()
+    content = store.readme_for_repo(repo)
+    if not content:
+        return []
+    return extract_images(content, readme_base_url(repo, store))
+
+
+def legacy_find_images(content, repo):
+    """예전 update_view_libraries.find_images_in_readme의 정규식 세 번 (비교용)"""
+    images = [(url, 'gif') for url in re.findall(r'https?://[^\s\)]+\.gif', content)]
+    images.extend((ext, ext) for ext in re.findall(r'https?://[^\s\)]+\.(png|jpg|jpeg)', content))
+    for rel_path, ext in re.findall(r'!\[.*?\]\(([^\)]+\.(gif|png|jpg|jpeg))\)', content):
+        if not rel_path.startswith('http'):
+            images.append((f'https://raw.githubusercontent.com/{repo}/master/' + rel_path, ext))
+    return images[:5]
+
+
+def load_corpus(store_dir, cache_dir):
+    """캐시된 README 모음 {이름: (상대 경로 기준 URL, 내용)} (공용 저장소 + remote_markdown 캐시)"""
+    corpus = {}
+    store = ReadmeStore(store_dir)
+    for url, entry in store.readmes.items():
+        content = store.cached(url) if entry.get('sha256') else None
+        if content:
+            corpus[url] = (url, content)
+    if os.path.isdir(cache_dir):
+        for name in sorted(os.listdir(cache_dir)):
+            if name.endswith('.md'):
+                with open(os.path.join(cache_dir, name), 'r', encoding='utf-8') as f:
+                    corpus.setdefault(name, (None, f.read()))
+    return corpus
+
+
+def benchmark(corpus, repeat):
+    """예전 방식과 한 번 훑기 추출의 시간, 후보 수 비교"""
+    documents = list(corpus.values())
+    size = sum(len(content) for _, content in documents)
+    print(f"📚 README {len(documents)}개 ({size / 1024:.0f}KB), {repeat}회 반복\n")
+
+    results = {}
+    for label, func in (('legacy', lambda base_url, text: legacy_find_images(text, 'owner/repo')),
+                        ('extract', lambda base_url, text: extract_images(text, base_url))):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            found = [func(base_url, content) for base_url, content in documents]
+        elapsed = (time.perf_counter() - start) / repeat
+        results[label] = found
+        print(f"  {label:8} {elapsed * 1000:8.2f}ms  "
+              f"후보 {sum(len(images) for images in found)}개, "
+              f"이미지 있는 README {sum(1 for images in found if images)}개")
+
+    gif_first = sum(1 for images in results['extract'] if images and images[0].ext == 'gif')
+    bad_legacy = sum(1 for images in results['legacy'] for url, _ in images if '://' not in url)
+    print(f"\n  GIF가 첫 후보인 README {gif_first}개, 예전 방식의 잘못된 URL {bad_legacy}개")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='README 이미지 후보 추출')
+    parser.add_argument('repos', nargs='*', help='owner/repo (후보 목록 출력)')
+    parser.add_argument('--benchmark', action='store_true', help='캐시된 README로 성능 비교')
+    parser.add_argument('--repeat', type=int, default=5, help='벤치마크 반복 횟수')
+    parser.add_argument('--store-dir', default=STORE_DIR, help='공용 README 저장소 디렉토리')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='remote_markdown 캐시 디렉토리')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        corpus = load_corpus(args.store_dir, args.cache_dir)
+        if not corpus:
+            print(f"⚠️  {args.store_dir}, {args.cache_dir}에 캐시된 README가 없습니다")
+            return
+        benchmark(corpus, args.repeat)
+        return
+
+    for repo in args.repos:
+        images = readme_images(repo)
+        print(f"🖼️  {repo}: 후보 {len(images)}개")
+        for rank, image in enumerate(images, 1):
+            size = f", {image.size}px" if image.size else ''
+            print(f"  {rank}. [{image.ext}{size}] {image.url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+README URL 단일 조회
+
+브랜치 × 파일명 조합을 하나씩 요청해 보는 대신, 저장소마다
+GET /repos/{repo}/readme 한 번으로 기본 브랜치와 실제 README 경로를 얻는다.
+결과는 metadata_cache에 저장되어 RESOLVED_MAX_AGE 동안은 요청 없이 재사용되고,
+그 이후에는 ETag 조건부 요청으로 확인한다.
+
+사용법:
+    from readme_resolver import resolve_readme_urls
+
+    results = resolve_readme_urls(['Yalantis/Phoenix'])
+    results['Yalantis/Phoenix']['readme_url']
+"""
+
+import asyncio
+from urllib.parse import quote, unquote, urlsplit
+
+from github_client import DEFAULT_CONCURRENCY, GitHubClient
+from metadata_cache import MetadataCache
+
+RAW_URL = 'https://raw.githubusercontent.com'
+RESOLVED_MAX_AGE = 3600 * 24  # 1일
+
+# remote_markdown.rb가 허용하는 확장자
+MARKDOWN_EXTENSIONS = ('.markdown', '.mkdown', '.mkdn', '.mkd', '.md')
+
+
+def parse_readme(repo, data):
+    """/readme 응답에서 raw URL, 경로, 브랜치 추출"""
+    path = data['path']
+    readme_url = data.get('download_url')
+    if not readme_url:
+        return {'status': 'not_found', 'repo': repo}
+
+    # download_url: https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}
+    # download_url은 퍼센트 인코딩되어 있으므로 path도 인코딩해서 길이를 맞춤 (공백, 한글 경로)
+    url_path = urlsplit(readme_url).path
+    quoted_path = quote(path)
+    owner_repo_branch = url_path[1:len(url_path) - len(quoted_path) - 1]
+    full_name = '/'.join(owner_repo_branch.split('/', 2)[:2])
+    branch = owner_repo_branch.split('/', 2)[2]
+
+    return {
+        'status': 'found',
+        'repo': full_name,
+        'readme_url': f'{RAW_URL}/{full_name}/{branch}/{quoted_path}',
+        'path': path,
+        'branch': unquote(branch),
+        'markdown': path.lower().endswith(MARKDOWN_EXTENSIONS)
+    }
+
+
+async def resolve_readme(client, repo, max_age=RESOLVED_MAX_AGE):
+    """저장소 README를 요청 한 번으로 찾기"""
+    status, data = await client.get_json(f'{client.api_url}/repos/{repo}/readme', max_age)
+    if status == 404:
+        return {'status': 'not_found', 'repo': repo}
+    if status != 200:
+        return {'status': 'unknown', 'repo': repo, 'error': f'HTTP {status}'}
+    return parse_readme(repo, data)
+
+
+async def resolve_readmes(client, repos, max_age=RESOLVED_MAX_AGE):
+    """여러 저장소 README를 동시에 찾기 (repo -> 결과 dict)"""
+    repos = list(dict.fromkeys(repos))
+    results, failures = await client.scheduler.run(
+        repos, lambda repo: resolve_readme(client, repo, max_age), client.concurrency
+    )
+    for repo, error in failures.items():
+        results[repo] = {'status': 'unknown', 'repo': repo, 'error': str(error)}
+    return {repo: results[repo] for repo in repos}
+
+
+def resolve_readme_urls(repos, concurrency=DEFAULT_CONCURRENCY, max_age=RESOLVED_MAX_AGE):
+    """동기 호출용 래퍼
+
+    결과 dict의 status:
+        'found'     - readme_url, path, branch 포함
+        'not_found' - README가 없거나 저장소가 삭제됨
+        'unknown'   - 재시도 후에도 확인 실패 (error 포함)
+    """
+    async def run():
+        async with GitHubClient(concurrency, cache=MetadataCache()) as client:
+            return await resolve_readmes(client, repos, max_age)
+
+    return asyncio.run(run())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+공용 README 저장소
+
+태그 제안, 이미지 찾기, 요약, remote_markdown 플러그인이 각자 README를
+받던 것을 디스크 저장소 하나로 모은다. README는 내용 SHA-256 이름의 파일
+(_readme_cache/<sha256>.md)로 저장하고, index.json에 README URL → 해시,
+받은 시각, ETag를 기록한다. README_TTL 안에서는 몇 개의 도구가 읽어도
+한 번만 받고, 그 뒤에는 ETag 조건부 요청으로 확인한다. close()는 오래 안 쓴
+README를 MAX_READMES개로 줄이고 중단된 쓰기로 남은 파일을 정리한 뒤 저장한다.
+
+저장소 → README URL은 readme_resolver(/repos/{repo}/readme)로 실제 기본
+브랜치와 경로를 찾아 기록하고, API를 쓸 수 없을 때만 master/main을 시도한다.
+
+사용법:
+    from readme_store import get_readme_store
+
+    store = get_readme_store()
+    store.prefetch(repos)                 # 여러 저장소를 한 번에 받기
+    store.resolve_unknown(repos)          # README URL만 한 번에 찾기 (작업자 스레드를 띄우기 전)
+    content = store.readme_for_repo(repo) # 저장소 README (없으면 None)
+    content = store.get(readme_url)       # URL로 받기
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from http_session import DEFAULT_CONCURRENCY, get_session
+from readme_resolver import RAW_URL, resolve_readme_urls
+
+STORE_DIR = '_readme_cache'
+README_TTL = 3600 * 24 * 7  # 7일 (remote_markdown.rb의 CACHE_EXPIRY와 같음)
+MISSING_TTL = 3600 * 24  # 없는 README는 1일 동안 다시 묻지 않음
+MAX_READMES = 2000
+STALE_TMP_AGE = 3600  # 이보다 오래된 임시 파일/고아 파일만 정리
+FALLBACK_BRANCHES = ('master', 'main')
+
+
+class ReadmeStore:
+    """README URL → 내용 디스크 저장소 (스레드 안전)"""
+
+    def __init__(self, store_dir=STORE_DIR, ttl=README_TTL, concurrency=DEFAULT_CONCURRENCY,
+                 clock=time.time, session=None, max_readmes=MAX_READMES):
+        self.store_dir = store_dir
+        self.index_path = os.path.join(store_dir, 'index.json')
+        self.ttl = ttl
+        self.max_readmes = max_readmes
+        self.concurrency = concurrency
+        self.clock = clock
+        self.fetched = 0
+        self.revalidated = 0
+        self.session = session
+        self._lock = threading.Lock()
+        self._resolved = set()
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        self.readmes = index.get('readmes', {})
+        self.repos = index.get('repos', {})
+
+    def _blob_path(self, digest):
+        return os.path.join(self.store_dir, f'{digest}.md')
+
+    def _read_blob(self, digest):
+        try:
+            with open(self._blob_path(digest), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_blob(self, content):
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(self.store_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _fresh(self, entry):
+        ttl = self.ttl if entry.get('sha256') else MISSING_TTL
+        return self.clock() - entry.get('timestamp', 0) < ttl
+
+    def cached(self, url):
+        """저장된 README 내용 (네트워크 없이, 기한이 지나도 반환)"""
+        with self._lock:
+            entry = self.readmes.get(url)
+        if not entry or not entry.get('sha256'):
+            return None
+        return self._read_blob(entry['sha256'])
+
+    def get(self, url):
+        """README 내용 (TTL 안이면 저장된 것, 아니면 받아서 저장). 없으면 None"""
+        with self._lock:
+            entry = self.readmes.get(url)
+        if entry and self._fresh(entry):
+            return self._read_blob(entry['sha256']) if entry.get('sha256') else None
+
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        try:
+            status, resp_headers, data, _ = (self.session or get_session()).request('GET', url, headers)
+        except Exception:
+            # 네트워크 오류면 기한이 지난 내용이라도 사용
+            return self.cached(url)
+
+        now = self.clock()
+        if status == 304 and entry and entry.get('sha256'):
+            content = self._read_blob(entry['sha256'])
+            if content is not None:
+                with self._lock:
+                    self.readmes[url] = dict(entry, timestamp=now)
+                    self.revalidated += 1
+                return content
+        if status == 200:
+            content = data.decode('utf-8', errors='replace')
+            digest = self._write_blob(content)
+            with self._lock:
+                self.readmes[url] = {'sha256': digest, 'timestamp': now,
+                                     'etag': resp_headers.get('ETag')}
+                self.fetched += 1
+            return content
+        if status == 404:
+            with self._lock:
+                self.readmes[url] = {'sha256': None, 'timestamp': now}
+            return None
+        return self.cached(url)
+
+    def _repo_url(self, repo):
+        """기록된 (README URL 또는 None, 기록 여부) — 기한이 지난 기록은 모르는 것으로"""
+        with self._lock:
+            entry = self.repos.get(repo.lower())
+        if not entry:
+            return None, False
+        ttl = self.ttl if entry['url'] else MISSING_TTL
+        if self.clock() - entry['timestamp'] >= ttl:
+            return None, False
+        return entry['url'], True
+
+    def _set_repo_url(self, repo, url):
+        with self._lock:
+            self.repos[repo.lower()] = {'url': url, 'timestamp': self.clock()}
+
+    def resolve(self, repos):
+        """저장소 README URL을 readme_resolver로 한 번에 찾아 기록 (repo -> URL 또는 None)"""
+        repos = list(dict.fromkeys(repos))
+        with self._lock:
+            self._resolved.update(repo.lower() for repo in repos)
+        try:
+            results = resolve_readme_urls(repos, self.concurrency)
+        except Exception as e:
+            print(f"⚠️  README URL 확인 실패, master/main으로 시도: {e}")
+            results = {}
+
+        for repo in repos:
+            result = results.get(repo, {'status': 'unknown'})
+            if result['status'] == 'found':
+                self._set_repo_url(repo, result['readme_url'])
+            elif result['status'] == 'not_found':
+                self._set_repo_url(repo, None)
+        return {repo: self._repo_url(repo)[0] for repo in repos}
+
+    def resolve_unknown(self, repos):
+        """기록이 없는 저장소만 한 번에 찾기
+
+        readme_for_repo는 모르는 저장소마다 resolver를 따로 돌리므로, 여러 스레드에서
+        부르기 전에 이것으로 한 번에 찾아 두면 API 요청과 캐시 정리가 한 번씩만 일어난다.
+        """
+        unknown = [repo for repo in dict.fromkeys(repos) if repo and not self._repo_url(repo)[1]]
+        if unknown:
+            self.resolve(unknown)
+
+    def readme_url(self, repo):
+        """기록된 저장소 README URL (모르면 None)"""
+        return self._repo_url(repo)[0]
+
+    def readme_for_repo(self, repo):
+        """저장소 README 내용 (URL을 모르면 먼저 찾고, API를 쓸 수 없으면 master/main 시도)"""
+        url, known = self._repo_url(repo)
+        # 이번 실행에서 이미 찾아본 저장소는 API를 다시 부르지 않음
+        if not known and repo.lower() not in self._resolved:
+            self.resolve([repo])
+            url, known = self._repo_url(repo)
+        if url:
+            return self.get(url)
+        if known:
+            return None
+
+        for branch in FALLBACK_BRANCHES:
+            url = f'{RAW_URL}/{repo}/{branch}/README.md'
+            content = self.get(url)
+            if content is not None:
+                self._set_repo_url(repo, url)
+                return content
+        return None
+
+    def prefetch(self, repos):
+        """여러 저장소의 README를 동시에 받아 두기 (repo -> 내용 또는 None)"""
+        repos = list(dict.fromkeys(repo for repo in repos if repo))
+        self.resolve_unknown(repos)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            contents = list(executor.map(self.readme_for_repo, repos))
+        self.save()
+        return dict(zip(repos, contents))
+
+    def prune(self):
+        """오래 안 쓴 README를 max_readmes개로 줄이고 index에 없는 파일 삭제
+
+        임시 파일과 index에 없는 README 파일은 STALE_TMP_AGE보다 오래된 것만 지운다
+        (다른 프로세스가 쓰는 중이거나 아직 index를 저장하지 않은 파일은 두기).
+        """
+        with self._lock:
+            overflow = len(self.readmes) - self.max_readmes
+            if overflow > 0:
+                oldest = sorted(self.readmes, key=lambda url: self.readmes[url].get('timestamp', 0))
+                for url in oldest[:overflow]:
+                    del self.readmes[url]
+            live = {entry['sha256'] for entry in self.readmes.values() if entry.get('sha256')}
+        if not os.path.isdir(self.store_dir):
+            return
+        now = self.clock()
+        for name in os.listdir(self.store_dir):
+            stem, ext = os.path.splitext(name)
+            if ext == '.tmp' or (ext == '.md' and stem not in live):
+                path = os.path.join(self.store_dir, name)
+                try:
+                    if now - os.path.getmtime(path) >= STALE_TMP_AGE:
+                        os.remove(path)
+                except FileNotFoundError:
+                    # 다른 프로세스가 먼저 정리했거나 이름을 바꾼 파일
+                    continue
+
+    def save(self):
+        """index.json 저장 (임시 파일 후 이름 변경)"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        with self._lock:
+            payload = json.dumps({'readmes': self.readmes, 'repos': self.repos},
+                                 indent=2, sort_keys=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        """정리 후 index 저장"""
+        self.prune()
+        self.save()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_readme_store(store_dir=STORE_DIR):
+    """실행 중 한 번만 만들어지는 공용 저장소 (종료할 때 index 저장)"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.store_dir != store_dir:
+            _store = ReadmeStore(store_dir)
+            atexit.register(_store.close)
+        return _store
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+README 요약 미리 계산
+
+_plugins/auto_summary.rb가 빌드할 때마다 포스트마다 README를 받아서 만들던
+요약을, 캐시된 README(공용 README 저장소 _readme_cache, 없으면
+remote_markdown 캐시)로 미리 계산해서 _data/summaries.json에 쓴다.
+auto_summary.rb는 이 파일만 읽으므로 jekyll build 중 네트워크를 쓰지 않는다.
+
+요약 규칙은 auto_summary.rb의 generate_summary와 같다 (첫 문단 최대 3줄,
+제목/배지 줄 건너뛰기, 없으면 Description/Overview/About 섹션, 그래도 없으면
+제목에 따른 기본 문장). README의 SHA-256이 바뀐 포스트만 다시 계산한다.
+front matter에 summary가 있는 포스트는 건너뛴다.
+
+--fetch를 주면 캐시에 없는 README를 먼저 공용 README 저장소로 받는다.
+Pages 빌드(.github/workflows/jekyll.yml)는 jekyll build 전에 이렇게 실행하며,
+_readme_cache와 _data/summaries.json을 actions/cache로 이어 쓰므로 배포마다
+README_TTL이 지났거나 새로 생긴 README만 받는다 (지난 것도 ETag로 확인).
+README를 받지 못해 요약이 없는 포스트는 auto_summary.rb가 요약을 붙이지 않는다.
+
+사용법:
+    python3 scripts/readme_summary.py
+    python3 scripts/readme_summary.py --fetch
+    python3 scripts/readme_summary.py --workers 4 --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from http_session import print_session_stats
+from post_catalog import atomic_write, get_catalog
+from readme_store import ReadmeStore
+from readme_tagger import CACHE_DIR, cached_readme
+
+SUMMARIES_PATH = '_data/summaries.json'
+MAX_SUMMARY_LENGTH = 200
+SUMMARY_SECTIONS = ('Description', 'Overview', 'About')
+
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\([^)]+\)')
+LINK_PATTERN = re.compile(r'\[([^\]]*)\]\([^)]+\)')
+HEADER_PATTERN = re.compile(r'^#', re.M)
+# remote_markdown 캐시는 이미지를 [alt]로 바꿔 저장한다 ([![b](img)](link) → [[b]](link))
+CACHED_IMAGE_PATTERN = re.compile(r'\[\[[^\]]*\]\]\([^)]+\)|\[[^\]]*\](?![(\[:])')
+
+# 제목 패턴 → 기본 요약 (README에 요약할 문단이 없을 때)
+DEFAULT_SUMMARIES = (
+    (r'loading|loader|progress', "A customizable loading indicator and progress view library for Android applications."),
+    (r'calendar', "An Android calendar view component with customizable styling and event handling."),
+    (r'button', "A custom button implementation with enhanced styling and animation capabilities."),
+    (r'dialog|alert', "A customizable dialog and alert component for Android applications."),
+    (r'animation|animate', "An animation library providing smooth transitions and effects for Android UI elements."),
+    (r'image|photo', "An image handling and display library with advanced features for Android."),
+    (r'list|recycler', "A enhanced list view component with improved performance and customization options."),
+    (r'chart|graph', "A data visualization library for creating charts and graphs in Android applications."),
+    (r'tab|navigation', "A navigation component providing intuitive tab-based or menu navigation for Android apps."),
+    (r'card', "A card-based UI component for displaying content in a Material Design style."),
+    (r'text|edit', "A text input and editing component with enhanced features for Android."),
+    (r'picker|select', "A selection component allowing users to pick from multiple options in Android apps."),
+    (r'menu|drawer', "A navigation menu component providing drawer or sliding menu functionality."),
+    (r'swipe|gesture', "A gesture-based interaction library for implementing swipe and touch controls."),
+    (r'float', "A floating UI element that can be positioned over other content in Android apps."),
+)
+FALLBACK_SUMMARY = "A custom UI component library for enhancing Android application interfaces."
+
+
+def default_summary(title):
+    """제목에 따른 기본 요약"""
+    title = title.lower()
+    for pattern, summary in DEFAULT_SUMMARIES:
+        if re.search(pattern, title):
+            return summary
+    return FALLBACK_SUMMARY
+
+
+def extract_section(content, section_names):
+    """'## 섹션 이름' 다음부터 다음 제목 전까지의 내용"""
+    for name in section_names:
+        match = re.search(r'^##\s+' + re.escape(name) + r'\s*$', content, re.M | re.I)
+        if match:
+            end = HEADER_PATTERN.search(content, match.end())
+            return content[match.end():end.start() if end else len(content)].strip()
+    return None
+
+
+def generate_summary(content, title):
+    """README 내용으로 요약 만들기 (auto_summary.rb의 generate_summary와 같은 규칙)"""
+    content = IMAGE_PATTERN.sub('', content)
+    content = LINK_PATTERN.sub(r'\1', content)
+
+    # 제목, 배지, 빈 줄을 건너뛴 뒤 첫 문단 (다음 제목 전까지, 최대 3줄)
+    summary_lines = []
+    skip_headers = True
+    for line in content.splitlines(keepends=True):
+        if skip_headers:
+            if not line.strip() or line.startswith('#'):
+                continue
+            if 'badge' in line or 'shields.io' in line:
+                continue
+            skip_headers = False
+
+        if line.startswith('#') or len(summary_lines) >= 3:
+            break
+        if line.strip():
+            summary_lines.append(line.strip())
+
+    # 없으면 Description/Overview/About 섹션에서
+    if not summary_lines:
+        section = extract_section(content, SUMMARY_SECTIONS)
+        if section:
+            summary_lines = [line.strip() for line in section.splitlines()[:3] if line.strip()]
+
+    if not summary_lines:
+        return default_summary(title)
+
+    summary = re.sub(r'[*_`]', '', ' '.join(summary_lines))
+    if len(summary) > MAX_SUMMARY_LENGTH:
+        summary = summary[:MAX_SUMMARY_LENGTH - 2] + '...'
+    return summary
+
+
+def summarize_cached(content, title):
+    """remote_markdown 캐시 내용으로 요약 (이미지 자리표시 제거 후)"""
+    return generate_summary(CACHED_IMAGE_PATTERN.sub('', content), title)
+
+
+def load_summaries(summaries_path=SUMMARIES_PATH):
+    try:
+        with open(summaries_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_summaries(summaries, summaries_path=SUMMARIES_PATH):
+    """요약 저장 (임시 파일 후 이름 변경)"""
+    os.makedirs(os.path.dirname(summaries_path) or '.', exist_ok=True)
+    atomic_write(summaries_path, json.dumps(summaries, indent=2, sort_keys=True, ensure_ascii=False) + '\n')
+
+
+def _summarize(job):
+    key, content, title, raw = job
+    return key, generate_summary(content, title) if raw else summarize_cached(content, title)
+
+
+def fetch_readmes(urls, store):
+    """캐시에 없는 README를 저장소로 동시에 받고 저장소 정리 (받은 개수 반환)"""
+    urls = [url for url in dict.fromkeys(urls) if store.cached(url) is None]
+    contents = []
+    if urls:
+        with ThreadPoolExecutor(max_workers=store.concurrency) as executor:
+            contents = list(executor.map(store.get, urls))
+    # CI에서 이어 쓰는 저장소가 끝없이 커지지 않도록 정리 후 index 저장
+    store.close()
+    return sum(1 for content in contents if content is not None)
+
+
+def update_summaries(workers=None, force=False, cache_dir=CACHE_DIR, fetch=False):
+    """README가 바뀐 포스트만 프로세스 풀에서 다시 요약 (fetch: 없는 README 먼저 받기)"""
+    summaries = load_summaries()
+    store = ReadmeStore()
+    stats = {'posts': 0, 'built': 0, 'skipped': 0, 'missing': 0, 'fetched': 0}
+
+    if fetch:
+        stats['fetched'] = fetch_readmes(
+            (post.readme_url for post in get_catalog().posts() if post.readme_url and not post.summary),
+            store)
+
+    keys = set()
+    pending = []
+    for post in get_catalog().posts():
+        if post.summary or not post.readme_url:
+            continue
+        stats['posts'] += 1
+        key = post.file[:-3] if post.file.endswith('.md') else post.file
+        # 공용 저장소의 원본 README 우선, 없으면 remote_markdown 캐시 (이미지가 바뀐 내용)
+        content = store.cached(post.readme_url)
+        raw = content is not None
+        if not raw:
+            content = cached_readme(post.readme_url, cache_dir)
+        if content is None:
+            stats['missing'] += 1
+            # README를 다시 받기 전까지 이전 요약 유지
+            if key in summaries:
+                keys.add(key)
+            continue
+
+        keys.add(key)
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        entry = summaries.get(key)
+        if not force and entry and entry['readme_sha256'] == digest:
+            stats['skipped'] += 1
+            continue
+        summaries[key] = {'readme_sha256': digest, 'readme_url': post.readme_url}
+        pending.append((key, content, post.title, raw))
+
+    # 삭제되었거나 front matter에 summary가 생긴 포스트 정리
+    for key in list(summaries):
+        if key not in keys:
+            del summaries[key]
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for key, summary in executor.map(_summarize, pending, chunksize=16):
+                summaries[key]['summary'] = summary
+                stats['built'] += 1
+
+    save_summaries(summaries)
+    return stats
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='캐시된 README로 포스트 요약 미리 계산')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='작업 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--force', action='store_true', help='모든 요약 다시 계산')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='remote_markdown 캐시 디렉토리')
+    parser.add_argument('--fetch', action='store_true', help='캐시에 없는 README를 먼저 받기')
+    args = parser.parse_args()
+
+    stats = update_summaries(args.workers, args.force, args.cache_dir, args.fetch)
+    if args.fetch:
+        print(f"📥 README 받음: {stats['fetched']}개")
+    print(f"📝 README 요약: 포스트 {stats['posts']}개 중 계산 {stats['built']}개, "
+          f"그대로 {stats['skipped']}개, README 캐시 없음 {stats['missing']}개")
+    print(f"  📋 {SUMMARIES_PATH}")
+    print_session_stats()
+
+
+if __name__ == "__main__":
+    main()
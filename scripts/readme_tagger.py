@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+README 본문 기반 태그 분류기
+
+공용 README 저장소(_readme_cache)나 remote_markdown 플러그인 캐시
+(_remote_markdown_cache)에 있는 README를 읽어
+문서 × 키워드 희소 행렬(CSR)을 한 번에 만들고, TF-IDF로 가중한 뒤
+키워드 → 태그 행렬과 곱해서 모든 포스트의 태그 점수를 한 번에 구한다.
+네트워크는 쓰지 않는다.
+
+키워드 표와 태그 수 제한/우선순위는 batch_update_tags와 같다. 다만 README
+본문은 산문이므로 키워드를 단어 단위로만 센다 (부분 문자열 매칭은 저장소
+이름에만). anim, explod 같은 어간 키워드(KEYWORD_STEMS)는 뒤에 붙는
+글자를 허용한다 (animating, exploding).
+
+포스트의 현재 태그(GitHub 토픽 포함)와 제목 키워드 태그는 그대로 두고,
+점수가 MIN_SCORE 이상인 README 태그를 점수가 높은 순으로 MAX_TAGS까지
+채운 뒤 정규화하고 limit_tags로 자른다.
+
+사용법:
+    python3 scripts/readme_tagger.py --dry-run     # 변경 내용(diff)만 출력
+    python3 scripts/readme_tagger.py --min-score 0.3
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import re
+
+from batch_update_tags import KEYWORD_STEMS, MAX_TAGS, TAG_MAPPINGS, TAG_MATCHER, limit_tags
+from keyword_matcher import KeywordMatcher
+from post_catalog import get_catalog
+from readme_store import ReadmeStore
+from tag_vocabulary import normalize_tags
+
+CACHE_DIR = '_remote_markdown_cache'
+MIN_SCORE = 0.2
+
+# README 본문용 단어 단위 매처 (update → date, folder → fold 같은 오탐 방지)
+README_MATCHER = KeywordMatcher(TAG_MAPPINGS.items(), whole_words=True, stems=KEYWORD_STEMS)
+
+# 태그 판단에 쓰지 않는 부분 (코드 블록, URL, HTML 태그)
+NOISE_PATTERN = re.compile(r'```.*?```|`[^`\n]*`|\]\([^)]*\)|https?://\S+|<[^>]+>', re.S)
+
+
+def cached_readme(url, cache_dir=CACHE_DIR):
+    """remote_markdown 캐시에 있는 README 내용 (없으면 None)"""
+    path = os.path.join(cache_dir, hashlib.md5(url.encode('utf-8')).hexdigest() + '.md')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class TermMatrix:
+    """문서 × 키워드 희소 행렬 (CSR: indptr, indices, data)"""
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self.terms = sorted(matcher.tags_for)
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.indptr = [0]
+        self.indices = []
+        self.data = []
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def add_document(self, text):
+        """문서 한 행 추가 (키워드 등장 횟수)"""
+        counts = self.matcher.count(NOISE_PATTERN.sub(' ', text))
+        for term, count in sorted(counts.items()):
+            self.indices.append(self.term_index[term])
+            self.data.append(float(count))
+        self.indptr.append(len(self.indices))
+
+    def tfidf(self):
+        """로그 TF × 스무딩 IDF로 가중하고 행마다 L2 정규화 (제자리 변경)"""
+        df = [0] * len(self.terms)
+        for j in self.indices:
+            df[j] += 1
+        idf = [math.log((len(self) + 1) / (n + 1)) + 1 for n in df]
+        self.data = [(1 + math.log(value)) * idf[j] for value, j in zip(self.data, self.indices)]
+
+        for start, end in zip(self.indptr, self.indptr[1:]):
+            norm = math.sqrt(sum(value * value for value in self.data[start:end]))
+            if norm:
+                self.data[start:end] = [value / norm for value in self.data[start:end]]
+
+    def tag_matrix(self):
+        """키워드 → 태그 희소 행렬 (키워드마다 (태그, 가중치) 목록)"""
+        return [[(tag, 1.0) for tag in sorted(self.matcher.tags_for[term])] for term in self.terms]
+
+    def dot(self, columns):
+        """이 행렬 × columns 행렬 (결과는 행마다 {태그: 점수})"""
+        rows = []
+        for start, end in zip(self.indptr, self.indptr[1:]):
+            row = {}
+            for j, value in zip(self.indices[start:end], self.data[start:end]):
+                for tag, weight in columns[j]:
+                    row[tag] = row.get(tag, 0.0) + value * weight
+            rows.append(row)
+        return rows
+
+
+def score_readmes(texts, matcher=README_MATCHER):
+    """README 목록의 태그 점수 (목록 순서대로 {태그: 점수})"""
+    matrix = TermMatrix(matcher)
+    for text in texts:
+        matrix.add_document(text)
+    matrix.tfidf()
+    return matrix.dot(matrix.tag_matrix())
+
+
+def top_tags(scores, min_score=MIN_SCORE, limit=MAX_TAGS):
+    """점수가 min_score 이상인 태그 (점수 높은 순, 최대 limit개)"""
+    ranked = sorted((tag for tag, score in scores.items() if score >= min_score),
+                    key=lambda tag: (-scores[tag], tag))
+    return ranked[:limit]
+
+
+def suggest_readme_tags(post, scores, min_score=MIN_SCORE):
+    """현재 태그와 제목 키워드 태그에 README 태그를 더해 제안 (batch_update_tags.suggest_tags와 같은 제한)
+
+    현재 태그는 버리지 않고, README 태그는 MAX_TAGS까지 남은 자리만 채운다.
+    """
+    tags = {'view'}
+    tags.update(normalize_tags(post.tags))
+    tags |= TAG_MATCHER.match(post.name.lower())
+    tags = set(normalize_tags(tags))
+    for tag in top_tags(scores, min_score):
+        if len(tags) >= MAX_TAGS:
+            break
+        tags.update(normalize_tags([tag]))
+    return limit_tags(tags)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='캐시된 README 본문으로 View 라이브러리 태그 일괄 분류')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='remote_markdown 캐시 디렉토리')
+    parser.add_argument('--min-score', type=float, default=MIN_SCORE,
+                        help='README 태그로 채택할 최소 점수 (정규화된 TF-IDF 합)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='파일을 쓰지 않고 변경 내용(diff)만 출력')
+    args = parser.parse_args()
+
+    catalog = get_catalog()
+    store = ReadmeStore()
+    readmes = {}
+    for post in catalog.view_posts():
+        if not post.readme_url:
+            continue
+        text = store.cached(post.readme_url) or cached_readme(post.readme_url, args.cache_dir)
+        if text:
+            readmes[post] = text
+
+    print(f"🏷️  README 기반 태그 분류")
+    print(f"📚 캐시된 README {len(readmes)}개 / View 라이브러리 {len(catalog.view_posts())}개\n")
+    if not readmes:
+        print(f"⚠️  {store.store_dir}, {args.cache_dir}에 캐시된 README가 없습니다 (jekyll build 후 다시 실행)")
+        return
+
+    posts = list(readmes)
+    all_scores = score_readmes(readmes[post] for post in posts)
+
+    batch = catalog.batch()
+    for post, scores in zip(posts, all_scores):
+        suggested = suggest_readme_tags(post, scores, args.min_score)
+        if set(post.tags) != set(suggested):
+            batch.edit(post, {'tag': suggested})
+
+    updated = len(batch)
+    if args.dry_run:
+        print(batch.diff(), end='')
+    else:
+        batch.commit()
+
+    print(f"\n✅ 태그 분류 완료!")
+    print(f"  📊 분류: {len(posts)}개")
+    print(f"  ✏️  {'변경 예정' if args.dry_run else '업데이트'}: {updated}개")
+
+
+if __name__ == "__main__":
+    main()
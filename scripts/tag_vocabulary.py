@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+태그 어휘 정규화와 태그 역색인
+
+태그를 소문자로 바꾸고 '-', '_', 공백을 없앤 뒤 별칭(TAG_ALIASES)을
+대표 태그로 합친다 (date-time → calendar, progressbar → progress 등).
+정규화한 태그로 태그 → 포스트 역색인을 만들어 _data/tag_index.json에 쓴다.
+
+_plugins/tag_index.rb가 이 파일의 ignored 목록을 jekyll-tagging의
+ignored_tags로 넘겨서, 포스트가 MIN_TAG_POSTS개 미만인 태그와 대표 태그가
+아닌 표기는 태그 페이지를 만들지 않는다. tag_page 레이아웃은 tags 항목의
+posts로 목록을 그리므로 별칭으로만 태그된 포스트도 대표 태그 페이지에 나온다.
+
+태그 페이지는 jekyll-tagging이 원래 표기로 만들기 때문에, 대표 표기가 한 번도
+쓰이지 않은 태그(recyclerview만 있는 list 등)는 페이지가 없다. 포스트를
+추가하거나 태그를 바꾼 뒤에는 --fix로 정규화하고 역색인과 함께 커밋한다.
+
+사용법:
+    python3 scripts/tag_vocabulary.py                 # 역색인만 갱신
+    python3 scripts/tag_vocabulary.py --fix --dry-run # 포스트 태그 정규화 diff
+    python3 scripts/tag_vocabulary.py --fix
+"""
+
+import argparse
+import json
+import os
+
+from post_catalog import atomic_write, get_catalog
+
+INDEX_PATH = '_data/tag_index.json'
+MIN_TAG_POSTS = 2
+
+# 별칭 → 대표 태그 (키는 정규화된 표기)
+TAG_ALIASES = {
+    # animation
+    'anim': 'animation',
+    'animated': 'animation',
+    'animations': 'animation',
+    'animator': 'animation',
+    # progress
+    'progressbar': 'progress',
+    # calendar
+    'calendarview': 'calendar',
+    'datepicker': 'calendar',
+    'datetime': 'calendar',
+    # material
+    'materialcomponents': 'material',
+    'materialdesign': 'material',
+    'materialui': 'material',
+    # list
+    'listview': 'list',
+    'recyclerview': 'list',
+    # display
+    'cardview': 'card',
+    'charts': 'chart',
+    'graph': 'chart',
+    'imageview': 'image',
+    'textview': 'text',
+    # interaction
+    'pulltorefresh': 'refresh',
+    'seekbar': 'slider',
+    'sliding': 'swipe',
+    'swipegestures': 'swipe',
+    'scrollview': 'scroll',
+    'scrollbar': 'scroll',
+    # navigation
+    'navi': 'navigation',
+    'tablayout': 'tab',
+    # dialogs & overlays
+    'alert': 'dialog',
+    'popup': 'dialog',
+    'fab': 'floating',
+    'floatingactionbutton': 'floating',
+    'floatingview': 'floating',
+    # others
+    'cropper': 'crop',
+    'featurediscovery': 'intro',
+    'onboarding': 'intro',
+    'showcase': 'intro',
+    'music': 'audio',
+    'qrcode': 'scanner',
+    'snow': 'effect',
+    'video': 'media',
+}
+
+
+def normalize_tag(tag):
+    """태그 하나를 대표 표기로 (소문자, '-', '_', 공백 제거, 별칭 합치기)"""
+    key = str(tag).strip().lower().replace('-', '').replace('_', '').replace(' ', '')
+    return TAG_ALIASES.get(key, key)
+
+
+def normalize_tags(tags):
+    """태그 목록 정규화 (순서 유지, 중복과 빈 값 제거)"""
+    return list(dict.fromkeys(tag for tag in map(normalize_tag, tags) if tag))
+
+
+def build_tag_index(posts, min_posts=MIN_TAG_POSTS):
+    """정규화한 태그 → 포스트 역색인
+
+    tags:    포스트가 min_posts개 이상인 대표 태그 → {count, posts, aliases}
+    minor:   포스트가 min_posts개 미만인 대표 태그 → 포스트 수
+    ignored: 태그 페이지를 만들지 않을 원래 표기 (jekyll-tagging ignored_tags)
+    """
+    groups = {}
+    spellings = {}
+    for post in posts:
+        for raw in post.tags:
+            tag = normalize_tag(raw)
+            if not tag:
+                continue
+            group = groups.setdefault(tag, [])
+            if post.file not in group:
+                group.append(post.file)
+            spellings.setdefault(tag, set()).add(str(raw))
+
+    tags = {}
+    minor = {}
+    ignored = set()
+    for tag, files in groups.items():
+        aliases = sorted(spellings[tag] - {tag})
+        if len(files) >= min_posts:
+            tags[tag] = {
+                'count': len(files),
+                'posts': sorted((file[:-3] if file.endswith('.md') else file for file in files),
+                                reverse=True),
+                'aliases': aliases
+            }
+            ignored.update(aliases)
+        else:
+            minor[tag] = len(files)
+            ignored.update(spellings[tag])
+
+    return {'tags': tags, 'minor': minor, 'ignored': sorted(ignored)}
+
+
+def save_tag_index(index, index_path=INDEX_PATH):
+    """역색인 저장 (임시 파일 후 이름 변경)"""
+    os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+    atomic_write(index_path, json.dumps(index, indent=2, sort_keys=True, ensure_ascii=False) + '\n')
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='태그 정규화와 태그 역색인 생성')
+    parser.add_argument('--fix', action='store_true', help='포스트 front matter의 태그를 대표 표기로 바꾸기')
+    parser.add_argument('--dry-run', action='store_true', help='파일을 쓰지 않고 결과(diff)만 출력')
+    parser.add_argument('--min-posts', type=int, default=MIN_TAG_POSTS,
+                        help='태그 페이지를 만들 최소 포스트 수')
+    args = parser.parse_args()
+
+    catalog = get_catalog()
+    posts = catalog.posts()
+    raw_tags = {tag for post in posts for tag in post.tags}
+
+    if args.fix:
+        batch = catalog.batch()
+        for post in posts:
+            tags = normalize_tags(post.tags)
+            if tags != post.tags:
+                batch.edit(post, {'tag': tags})
+        print(f"✏️  태그를 정규화할 포스트: {len(batch)}개")
+        if args.dry_run:
+            print(batch.diff(), end='')
+        else:
+            batch.commit()
+
+    index = build_tag_index(catalog.posts(), args.min_posts)
+    print(f"🏷️  태그 표기 {len(raw_tags)}개 → 대표 태그 {len(index['tags']) + len(index['minor'])}개")
+    print(f"📄 태그 페이지: {len(index['tags'])}개 (포스트 {args.min_posts}개 미만 {len(index['minor'])}개 제외)")
+    for tag, entry in sorted(index['tags'].items(), key=lambda item: (-item[1]['count'], item[0])):
+        aliases = f" ← {', '.join(entry['aliases'])}" if entry['aliases'] else ''
+        print(f"  - {tag} ({entry['count']}){aliases}")
+
+    if not args.dry_run:
+        save_tag_index(index)
+        print(f"\n💾 {INDEX_PATH} 저장")
+
+
+if __name__ == "__main__":
+    main()